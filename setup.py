@@ -6,6 +6,8 @@ setup(
     version=VERSION,
     packages=find_packages(),
     install_requires=open("requirements.txt").read().splitlines(),
+    extras_require={"parquet": ["pyarrow"], "lxml": ["lxml"], "orjson": ["orjson"]},
+    entry_points={"console_scripts": ["stockdex=stockdex.cli:main"]},
     python_requires=">=3.8",
     author="Amir Nazary",
     description="A package to get stock data from Yahoo Finance",
@@ -1 +1,2 @@
 from .ticker import Ticker  # noqa F401
+from .tickers import Tickers  # noqa F401
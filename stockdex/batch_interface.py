@@ -0,0 +1,309 @@
+"""
+Module to run scraping jobs for many tickers at once
+The main Tickers class inherits from this class
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+import requests
+
+from stockdex.config import SCRAPED_DATASET_URLS, VALID_SECURITY_TYPES
+from stockdex.deadline import Deadline
+from stockdex.exceptions import DeadlineExceeded
+from stockdex.ticker_base import TickerBase
+
+# seconds between checks of the deadline while waiting for jobs
+DEADLINE_POLL_INTERVAL = 0.1
+
+
+def _parse_dataset(
+    ticker: str,
+    security_type: str,
+    dataset: str,
+    url: str,
+    content: bytes,
+    encoding: Union[str, None],
+    html_parser: str,
+    numeric: bool = False,
+    dates: bool = False,
+) -> pd.DataFrame:
+    """
+    Parse a prefetched page into the dataset of a ticker.
+    Runs in a worker process, hence defined at module level.
+    """
+    # imported here to avoid a circular import with stockdex.tickers
+    from stockdex.ticker import Ticker
+
+    response = requests.Response()
+    response._content = content
+    response.encoding = encoding
+    response.status_code = 200
+    response.url = url
+
+    ticker = Ticker(ticker=ticker, security_type=security_type)
+    ticker.html_parser = html_parser
+    ticker.numeric = numeric
+    ticker.dates = dates
+    ticker.prefetched_responses = {url: response}
+
+    return getattr(ticker, dataset)
+
+
+def _collect(future: Future, deadline: Deadline = None) -> Union[object, Exception]:
+    """
+    Get the result of a future, or its exception if it failed.
+    If the deadline expires first, the future is cancelled and
+    DeadlineExceeded is returned instead.
+    """
+    if deadline is None:
+        return future.exception() or future.result()
+
+    while not future.done() and not deadline.expired:
+        wait([future], timeout=DEADLINE_POLL_INTERVAL)
+
+    if not future.done():
+        future.cancel()
+        return DeadlineExceeded()
+
+    return future.exception() or future.result()
+
+
+class BatchInterface(TickerBase):
+    def __init__(
+        self,
+        tickers: Optional[List[str]] = None,
+        isins: Optional[List[str]] = None,
+        security_type: VALID_SECURITY_TYPES = "stock",
+    ) -> None:
+        self.tickers = list(tickers) if tickers else []
+        self.isins = list(isins) if isins else []
+        self.security_type = security_type
+
+    def scrape(
+        self,
+        datasets: List[str],
+        fetch_workers: int = 8,
+        parse_workers: Optional[int] = None,
+        deadline: Deadline = None,
+    ) -> Dict[Tuple[str, str], Union[pd.DataFrame, Exception]]:
+        """
+        Scrape datasets for all tickers. Pages are fetched on I/O threads and
+        parsed into DataFrames in a process pool, so parsing scales with the
+        number of cores instead of being bound to one core by the GIL.
+
+        Args:
+        ----------------
+        datasets (List[str]): The names of the scraped datasets to retrieve,
+        e.g. "digrin_price" or "yahoo_web_summary".
+        see ``SCRAPED_DATASET_URLS`` for the supported datasets
+
+        fetch_workers (int): The number of threads fetching pages
+
+        parse_workers (int): The number of processes parsing pages
+        default is the number of cores
+
+        deadline (Deadline): The deadline of the whole batch, default is the
+        deadline of the instance. Once it expires, outstanding fetches and parses
+        are abandoned and their value is DeadlineExceeded
+
+        Returns:
+        ----------------
+        Dict[Tuple[str, str], Union[pd.DataFrame, Exception]]: The result keyed by
+        (ticker, dataset). If fetching or parsing failed, the value is the exception
+        """
+        for dataset in datasets:
+            if dataset not in SCRAPED_DATASET_URLS:
+                raise ValueError(
+                    f"{dataset} is not a scraped dataset, "
+                    f"choose from: {list(SCRAPED_DATASET_URLS)}"
+                )
+
+        # jobs sharing a page wait on a single fetch of it
+        jobs = {}
+        for ticker in self.tickers:
+            for dataset in datasets:
+                url = SCRAPED_DATASET_URLS[dataset].format(ticker=ticker)
+                jobs.setdefault(url, []).append((ticker, dataset))
+
+        deadline = deadline or self.deadline
+        poll_interval = None if deadline is None else DEADLINE_POLL_INTERVAL
+
+        results = {}
+        fetchers = ThreadPoolExecutor(max_workers=fetch_workers)
+        # the parse processes are started while the fetch threads run, forking
+        # them could copy locks those threads hold, e.g. of logging or ssl
+        parsers = ProcessPoolExecutor(
+            max_workers=parse_workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        try:
+            pending = {fetchers.submit(self.get_response, url, deadline): url for url in jobs}
+            while pending:
+                if deadline is not None and deadline.expired:
+                    for future, url in pending.items():
+                        future.cancel()
+                        for job in jobs[url]:
+                            results[job] = DeadlineExceeded()
+                    break
+
+                done, _ = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = pending.pop(future)
+
+                    # hand the page over to the parsers as soon as it arrives
+                    if future.exception() is not None:
+                        for job in jobs[url]:
+                            results[job] = future.exception()
+                        continue
+
+                    response = future.result()
+                    for ticker, dataset in jobs[url]:
+                        parsed = parsers.submit(
+                            _parse_dataset,
+                            ticker,
+                            self.security_type,
+                            dataset,
+                            url,
+                            response.content,
+                            response.encoding,
+                            self.html_parser,
+                            self.numeric,
+                            self.dates,
+                        )
+                        results[(ticker, dataset)] = parsed
+
+            for job, result in results.items():
+                if not isinstance(result, Exception):
+                    results[job] = _collect(result, deadline)
+        finally:
+            # after the deadline, do not wait for abandoned fetches and parses
+            expired = deadline is not None and deadline.expired
+            fetchers.shutdown(wait=not expired)
+            parsers.shutdown(wait=not expired)
+
+        return {
+            (ticker, dataset): results[(ticker, dataset)]
+            for ticker in self.tickers
+            for dataset in datasets
+        }
+
+    def iter_datasets(
+        self,
+        datasets: List[Union[str, Tuple[str, dict]]],
+        max_workers: int = 8,
+        max_in_flight: Optional[int] = None,
+        deadline: Deadline = None,
+    ) -> Iterator[Tuple[str, str, Union[pd.DataFrame, Exception]]]:
+        """
+        Retrieve datasets for all tickers and yield each result as soon as it
+        is ready. At most max_in_flight jobs are running or waiting to be consumed,
+        so a slow consumer (e.g. a Parquet writer) limits how many results are
+        held in memory.
+
+        Args:
+        ----------------
+        datasets (list): The datasets to retrieve. Each item is the name of a
+        Ticker property or method, e.g. "digrin_price", or a tuple of a method name
+        and its keyword arguments, e.g. ("yahoo_api_price", {"range": "5d"})
+
+        max_workers (int): The number of threads retrieving datasets
+
+        max_in_flight (int): The maximum number of jobs submitted but not yet consumed
+        default is twice max_workers
+
+        deadline (Deadline): The deadline of the whole batch, default is the
+        deadline of the instance. Once it expires, running and remaining jobs are
+        abandoned and yielded with DeadlineExceeded as their result
+
+        Yields:
+        ----------------
+        Tuple[str, str, Union[pd.DataFrame, Exception]]: (ticker, dataset, result),
+        if retrieving the dataset failed, the result is the exception
+        """
+        datasets = [(dataset, {}) if isinstance(dataset, str) else dataset for dataset in datasets]
+        jobs = (
+            (ticker, dataset, kwargs) for ticker in self.tickers for dataset, kwargs in datasets
+        )
+
+        deadline = deadline or self.deadline
+        poll_interval = None if deadline is None else DEADLINE_POLL_INTERVAL
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = {}
+
+        def submit_next() -> bool:
+            job = next(jobs, None)
+            if job is not None:
+                future = executor.submit(self._run_dataset, *job, deadline)
+                pending[future] = job
+            return job is not None
+
+        try:
+            for _ in range(max_in_flight or 2 * max_workers):
+                if not submit_next():
+                    break
+
+            while pending:
+                if deadline is not None and deadline.expired:
+                    break
+
+                done, _ = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    ticker, dataset, _ = pending.pop(future)
+                    yield ticker, dataset, future.exception() or future.result()
+
+                    # only refill once the consumer has taken the result
+                    submit_next()
+
+            # the deadline expired, report the abandoned and the remaining jobs
+            for ticker, dataset, _ in list(pending.values()) + list(jobs):
+                yield ticker, dataset, DeadlineExceeded()
+        finally:
+            # the consumer may stop early, drop the jobs that did not start
+            for future in pending:
+                future.cancel()
+            expired = deadline is not None and deadline.expired
+            executor.shutdown(wait=not expired)
+
+    def _run_dataset(
+        self, ticker: str, dataset: str, kwargs: dict, deadline: Deadline = None
+    ) -> Union[pd.DataFrame, str]:
+        """
+        Retrieve a single dataset of a ticker
+
+        Args:
+        ----------------
+        ticker (str): The ticker to retrieve the dataset for
+
+        dataset (str): The name of the Ticker property or method
+
+        kwargs (dict): The keyword arguments if the dataset is a method
+
+        deadline (Deadline): The deadline bounding the requests of the job
+
+        Returns:
+        ----------------
+        Union[pd.DataFrame, str]: The dataset
+        """
+        # imported here to avoid a circular import with stockdex.tickers
+        from stockdex.ticker import Ticker
+
+        instance = Ticker(ticker=ticker, security_type=self.security_type)
+        instance.request_priority = self.request_priority
+        instance.deadline = deadline
+
+        if deadline is not None:
+            deadline.check()
+
+        value = getattr(instance, dataset)
+        return value(**kwargs) if callable(value) else value
@@ -0,0 +1,417 @@
+"""
+Command line interface of stockdex, installed as the ``stockdex`` console script
+
+Examples:
+``stockdex fetch --symbols universe.txt --datasets yahoo_api_price,digrin_price --out ./data``
+
+``stockdex enqueue --queue jobs.db --symbols universe.txt --datasets digrin_price``
+``stockdex work --queue jobs.db --out ./data --rate-limit www.digrin.com=2``
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+from stockdex.lib import write_output
+from stockdex.scheduler import RequestScheduler
+from stockdex.ticker_base import TickerBase
+from stockdex.tickers import Tickers
+from stockdex.worker import (
+    DirectoryResultSink,
+    SQLiteJobQueue,
+    SQLiteTokenBucket,
+    build_jobs,
+    run_worker,
+)
+
+# name of the checkpoint journal inside the output directory
+JOURNAL_FILE = "journal.jsonl"
+
+OUTPUT_FORMATS = ["parquet", "csv"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the ``stockdex`` console script
+
+    Args:
+    ----------------
+    argv (List[str]): The command line arguments, default is sys.argv[1:]
+
+    Returns:
+    ----------------
+    int: The exit code, 1 if any (symbol, dataset) pair failed
+    """
+    parser = argparse.ArgumentParser(
+        prog="stockdex", description="Retrieve financial data in bulk"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    fetch_parser = subparsers.add_parser(
+        "fetch",
+        help="Retrieve datasets for a universe of symbols, resuming where a "
+        "previous run stopped",
+    )
+    fetch_parser.add_argument(
+        "--symbols",
+        required=True,
+        help="File with one symbol per line, lines starting with # are ignored",
+    )
+    fetch_parser.add_argument(
+        "--datasets",
+        required=True,
+        help="Comma separated names of Ticker properties or methods, "
+        "e.g. yahoo_api_price,yahoo_api_income_statement",
+    )
+    fetch_parser.add_argument(
+        "--out", required=True, help="Directory to write the output files to"
+    )
+    fetch_parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="parquet",
+        help="Format of the output files, parquet requires pyarrow",
+    )
+    fetch_parser.add_argument("--workers", type=int, default=8, help="Number of concurrent jobs")
+    fetch_parser.add_argument(
+        "--security-type",
+        default="stock",
+        choices=["stock", "etf"],
+        help="Security type of the symbols",
+    )
+
+    enqueue_parser = subparsers.add_parser(
+        "enqueue", help="Push (symbol, dataset) jobs to a shared SQLite job queue"
+    )
+    enqueue_parser.add_argument(
+        "--queue", required=True, help="SQLite database file of the job queue"
+    )
+    enqueue_parser.add_argument(
+        "--symbols",
+        required=True,
+        help="File with one symbol per line, lines starting with # are ignored",
+    )
+    enqueue_parser.add_argument(
+        "--datasets",
+        required=True,
+        help="Comma separated names of Ticker properties or methods",
+    )
+
+    work_parser = subparsers.add_parser(
+        "work", help="Run jobs of a shared SQLite job queue until it is empty"
+    )
+    work_parser.add_argument(
+        "--queue", required=True, help="SQLite database file of the job queue"
+    )
+    work_parser.add_argument(
+        "--out", required=True, help="Shared directory to write the output files to"
+    )
+    work_parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="parquet",
+        help="Format of the output files, parquet requires pyarrow",
+    )
+    work_parser.add_argument(
+        "--lease",
+        type=float,
+        default=300.0,
+        help="Seconds a worker has to complete a job before it is retried",
+    )
+    work_parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="Number of attempts before a job is marked failed",
+    )
+    work_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help="Seconds to wait for new jobs once the queue is empty",
+    )
+    work_parser.add_argument(
+        "--rate-limit",
+        action="append",
+        default=[],
+        metavar="HOST=RATE",
+        help="Requests per second to a host, shared by all workers of the queue",
+    )
+    work_parser.add_argument(
+        "--security-type",
+        default="stock",
+        choices=["stock", "etf"],
+        help="Security type of the symbols",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "enqueue":
+        return enqueue(
+            queue=args.queue,
+            symbols=read_symbols(args.symbols),
+            datasets=_split_datasets(args.datasets),
+        )
+
+    if args.format == "parquet" and not _parquet_available():
+        parser.error(
+            "writing parquet files requires pyarrow, install it with "
+            "`pip install stockdex[parquet]` or use --format csv"
+        )
+
+    if args.command == "work":
+        try:
+            rate_limits = {
+                host: float(rate)
+                for host, rate in (item.split("=", 1) for item in args.rate_limit)
+            }
+        except ValueError:
+            parser.error("--rate-limit must be given as HOST=RATE")
+
+        return work(
+            queue=args.queue,
+            out=args.out,
+            output_format=args.format,
+            lease_seconds=args.lease,
+            max_attempts=args.max_attempts,
+            idle_timeout=args.idle_timeout,
+            rate_limits=rate_limits,
+            security_type=args.security_type,
+        )
+
+    return fetch(
+        symbols=read_symbols(args.symbols),
+        datasets=_split_datasets(args.datasets),
+        out=args.out,
+        output_format=args.format,
+        workers=args.workers,
+        security_type=args.security_type,
+    )
+
+
+def fetch(
+    symbols: List[str],
+    datasets: List[str],
+    out: str,
+    output_format: str = "parquet",
+    workers: int = 8,
+    security_type: str = "stock",
+) -> int:
+    """
+    Retrieve the datasets of all symbols and write one file per pair to
+    ``<out>/<dataset>/<symbol>.<format>``. Every finished pair is appended to
+    the checkpoint journal, pairs completed by a previous run are skipped.
+
+    Args:
+    ----------------
+    symbols (List[str]): The symbols to retrieve the datasets for
+
+    datasets (List[str]): The names of the Ticker properties or methods
+
+    out (str): The output directory, also holding the checkpoint journal
+
+    output_format (str): The format of the output files, "parquet" or "csv"
+
+    workers (int): The number of concurrent jobs
+
+    security_type (str): The security type of the symbols
+
+    Returns:
+    ----------------
+    int: The exit code, 1 if any pair failed
+    """
+    os.makedirs(out, exist_ok=True)
+    journal_path = os.path.join(out, JOURNAL_FILE)
+    completed = read_journal(journal_path)
+
+    counts = {"done": 0, "failed": 0, "skipped": 0}
+    _end_truncated_line(journal_path)
+    with open(journal_path, "a", encoding="utf-8") as journal:
+        # datasets run one after another, the symbols of a dataset concurrently
+        for dataset in datasets:
+            remaining = [symbol for symbol in symbols if (symbol, dataset) not in completed]
+            counts["skipped"] += len(symbols) - len(remaining)
+            if not remaining:
+                continue
+
+            tickers = Tickers(tickers=remaining, security_type=security_type)
+            for symbol, _, result in tickers.iter_datasets([dataset], max_workers=workers):
+                entry = {"symbol": symbol, "dataset": dataset}
+                try:
+                    if isinstance(result, Exception):
+                        raise result
+                    entry["path"] = write_output(result, out, symbol, dataset, output_format)
+                    entry["status"] = "done"
+                except Exception as error:  # noqa: BLE001
+                    entry["status"] = "failed"
+                    entry["error"] = f"{type(error).__name__}: {error}"
+
+                entry["time"] = datetime.now(timezone.utc).isoformat()
+                _append_entry(journal, entry)
+                counts[entry["status"]] += 1
+
+                print(
+                    f"{entry['status']:>6} {symbol} {dataset}"
+                    + (f" ({entry['error']})" if "error" in entry else ""),
+                    file=sys.stderr,
+                )
+
+    print(
+        f"{counts['done']} done, {counts['failed']} failed, "
+        f"{counts['skipped']} skipped (completed by a previous run)",
+        file=sys.stderr,
+    )
+    return 1 if counts["failed"] else 0
+
+
+def enqueue(queue: str, symbols: List[str], datasets: List[str]) -> int:
+    """
+    Push a job per symbol and dataset to a SQLite job queue
+
+    Returns:
+    ----------------
+    int: The exit code
+    """
+    count = SQLiteJobQueue(queue).push(build_jobs(symbols, datasets))
+    print(f"{count} jobs added to {queue}", file=sys.stderr)
+    return 0
+
+
+def work(
+    queue: str,
+    out: str,
+    output_format: str = "parquet",
+    lease_seconds: float = 300.0,
+    max_attempts: int = 3,
+    idle_timeout: Optional[float] = None,
+    rate_limits: Optional[Dict[str, float]] = None,
+    security_type: str = "stock",
+) -> int:
+    """
+    Run jobs of a SQLite job queue until it is empty. Many workers, on one host
+    or on hosts sharing the database file, can run on the same queue.
+
+    Args:
+    ----------------
+    queue (str): The SQLite database file of the job queue
+
+    out (str): The shared output directory
+
+    output_format (str): The format of the output files, "parquet" or "csv"
+
+    lease_seconds (float): The time a worker has to complete a job
+
+    max_attempts (int): The number of attempts before a job is marked failed
+
+    idle_timeout (float): The seconds to wait for new jobs once the queue is empty
+
+    rate_limits (Dict[str, float]): Requests per second per host, shared by
+    all workers through token buckets in the queue database
+
+    security_type (str): The security type of the symbols
+
+    Returns:
+    ----------------
+    int: The exit code, 1 if this worker failed any job
+    """
+    if rate_limits:
+        TickerBase.scheduler = RequestScheduler(
+            rate_limits={
+                host: SQLiteTokenBucket(queue, host, rate) for host, rate in rate_limits.items()
+            }
+        )
+
+    job_queue = SQLiteJobQueue(queue, max_attempts=max_attempts)
+    counts = run_worker(
+        job_queue,
+        DirectoryResultSink(out, output_format),
+        lease_seconds=lease_seconds,
+        idle_timeout=idle_timeout,
+        security_type=security_type,
+    )
+
+    print(
+        f"{counts['done']} done, {counts['failed']} failed by this worker, "
+        f"queue: {job_queue.counts()}",
+        file=sys.stderr,
+    )
+    return 1 if counts["failed"] else 0
+
+
+def read_symbols(path: str) -> List[str]:
+    """
+    Read the symbols from a file with one symbol per line, skipping empty lines,
+    comments starting with # and duplicates
+    """
+    with open(path, encoding="utf-8") as file:
+        lines = [line.split("#", 1)[0].strip() for line in file]
+
+    return list(dict.fromkeys(line for line in lines if line))
+
+
+def read_journal(path: str) -> Set[Tuple[str, str]]:
+    """
+    Get the (symbol, dataset) pairs a previous run completed.
+    A truncated last line, left by a crash while writing, is ignored.
+    """
+    completed = set()
+    if not os.path.exists(path):
+        return completed
+
+    with open(path, encoding="utf-8") as journal:
+        for line in journal:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry.get("status") == "done":
+                completed.add((entry["symbol"], entry["dataset"]))
+
+    return completed
+
+
+def _split_datasets(datasets: str) -> List[str]:
+    """
+    Split a comma separated list of dataset names
+    """
+    return [name.strip() for name in datasets.split(",") if name.strip()]
+
+
+def _end_truncated_line(path: str) -> None:
+    """
+    End a truncated last line of the journal, left by a crash while writing,
+    so that the next entry appended starts on its own line
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return
+
+    with open(path, "rb+") as journal:
+        journal.seek(-1, os.SEEK_END)
+        if journal.read(1) != b"\n":
+            journal.write(b"\n")
+
+
+def _append_entry(journal, entry: dict) -> None:
+    """
+    Append an entry to the journal and make sure it reached the disk
+    """
+    journal.write(json.dumps(entry) + "\n")
+    journal.flush()
+    os.fsync(journal.fileno())
+
+
+def _parquet_available() -> bool:
+    """
+    Check if a parquet engine is installed
+    """
+    return any(
+        importlib.util.find_spec(engine) is not None for engine in ("pyarrow", "fastparquet")
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
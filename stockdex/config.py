@@ -1,5 +1,6 @@
 # File for configuration of the stockdex package
 
+from importlib.util import find_spec
 from typing import Literal
 
 RESPONSE_TIMEOUT = 2
@@ -7,6 +8,11 @@ RETRY_AFTER_TIMEOUT = 2
 
 VALID_SECURITY_TYPES = Literal["stock", "etf", "cryptocurrency", "index", "commodity"]
 VALID_DATA_SOURCES = Literal["yahoo_web", "yahoo_api", "justetf", "digrin"]
+VALID_HTML_PARSERS = Literal["lxml", "html.parser", "html5lib"]
+
+# default BeautifulSoup parser backend, lxml is several times faster than the
+# built-in html.parser on large pages and is preferred when it is installed
+HTML_PARSER = "lxml" if find_spec("lxml") else "html.parser"
 
 BASE_URL = "https://query2.finance.yahoo.com/v8/finance"
 FUNDAMENTALS_BASE_URL = (
@@ -16,6 +22,298 @@ JUSTETF_BASE_URL = "https://www.justetf.com/en"
 NASDAQ_BASE_URL = "https://www.nasdaq.com/market-activity/stocks"
 DIGRIN_BASE_URL = "https://www.digrin.com/stocks/detail"
 MACROTRENDS_BASE_URL = "https://www.macrotrends.net/stocks/charts"
+YAHOO_WEB_BASE_URL = "https://finance.yahoo.com/quote"
+SPARK_BASE_URL = "https://query2.finance.yahoo.com/v7/finance/spark"
+QUOTE_BASE_URL = "https://query2.finance.yahoo.com/v7/finance/quote"
+QUOTE_SUMMARY_BASE_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSummary"
+YAHOO_COOKIE_URL = "https://fc.yahoo.com"
+YAHOO_CRUMB_URL = "https://query2.finance.yahoo.com/v1/test/getcrumb"
+
+# maximum number of symbols the spark endpoint accepts in a single request
+SPARK_MAX_SYMBOLS = 20
+
+# price fields of the chart endpoint
+PRICE_FIELDS = ["volume", "close", "open", "high", "low"]
+
+# price fields of the spark endpoint, it only returns the close of each bar
+SPARK_PRICE_FIELDS = ["close"]
+
+# number of symbols per request to the quote endpoint
+QUOTE_MAX_SYMBOLS = 250
+
+# fields of the quote endpoint returned by yahoo_api_bulk_quote and their dtypes,
+# the datetime fields are sent as epoch seconds
+QUOTE_FIELDS = {
+    "shortName": "string",
+    "longName": "string",
+    "quoteType": "string",
+    "currency": "string",
+    "exchange": "string",
+    "marketState": "string",
+    "regularMarketPrice": "float64",
+    "regularMarketChange": "float64",
+    "regularMarketChangePercent": "float64",
+    "regularMarketPreviousClose": "float64",
+    "regularMarketOpen": "float64",
+    "regularMarketDayLow": "float64",
+    "regularMarketDayHigh": "float64",
+    "regularMarketVolume": "Int64",
+    "regularMarketTime": "datetime64[ns, UTC]",
+    "bid": "float64",
+    "bidSize": "Int64",
+    "ask": "float64",
+    "askSize": "Int64",
+    "fiftyTwoWeekLow": "float64",
+    "fiftyTwoWeekHigh": "float64",
+    "fiftyDayAverage": "float64",
+    "twoHundredDayAverage": "float64",
+    "averageDailyVolume3Month": "Int64",
+    "marketCap": "Int64",
+    "sharesOutstanding": "Int64",
+    "trailingPE": "float64",
+    "forwardPE": "float64",
+    "priceToBook": "float64",
+    "epsTrailingTwelveMonths": "float64",
+    "epsForward": "float64",
+    "trailingAnnualDividendRate": "float64",
+    "trailingAnnualDividendYield": "float64",
+    "dividendYield": "float64",
+    "dividendDate": "datetime64[ns, UTC]",
+    "earningsTimestamp": "datetime64[ns, UTC]",
+}
+
+# modules of the quoteSummary endpoint
+QUOTE_SUMMARY_MODULES = [
+    "assetProfile",
+    "summaryProfile",
+    "summaryDetail",
+    "price",
+    "quoteType",
+    "defaultKeyStatistics",
+    "financialData",
+    "calendarEvents",
+    "earnings",
+    "earningsTrend",
+    "earningsHistory",
+    "recommendationTrend",
+    "upgradeDowngradeHistory",
+    "majorHoldersBreakdown",
+    "institutionOwnership",
+    "fundOwnership",
+    "majorDirectHolders",
+    "insiderHolders",
+    "insiderTransactions",
+    "netSharePurchaseActivity",
+    "secFilings",
+    "esgScores",
+    "incomeStatementHistory",
+    "incomeStatementHistoryQuarterly",
+    "cashflowStatementHistory",
+    "cashflowStatementHistoryQuarterly",
+    "balanceSheetHistory",
+    "balanceSheetHistoryQuarterly",
+    "fundProfile",
+    "topHoldings",
+]
+
+# modules retrieved together, in one request, by the quoteSummary fast path of
+# the yahoo_web profile and holders properties
+QUOTE_SUMMARY_WEB_MODULES = [
+    "assetProfile",
+    "majorHoldersBreakdown",
+    "institutionOwnership",
+    "fundOwnership",
+]
+
+# rows of the yahoo_web key statistics tables and the quoteSummary module and
+# field they are read from when served from the JSON embedded in the page
+KEY_STATISTICS_FIELDS = {
+    "financial_highlights": {
+        "Fiscal Year Ends": ("defaultKeyStatistics", "lastFiscalYearEnd"),
+        "Most Recent Quarter (mrq)": ("defaultKeyStatistics", "mostRecentQuarter"),
+        "Profit Margin": ("financialData", "profitMargins"),
+        "Operating Margin (ttm)": ("financialData", "operatingMargins"),
+        "Return on Assets (ttm)": ("financialData", "returnOnAssets"),
+        "Return on Equity (ttm)": ("financialData", "returnOnEquity"),
+        "Revenue (ttm)": ("financialData", "totalRevenue"),
+        "Revenue Per Share (ttm)": ("financialData", "revenuePerShare"),
+        "Quarterly Revenue Growth (yoy)": ("financialData", "revenueGrowth"),
+        "Gross Profit (ttm)": ("financialData", "grossProfits"),
+        "EBITDA": ("financialData", "ebitda"),
+        "Net Income Avi to Common (ttm)": ("defaultKeyStatistics", "netIncomeToCommon"),
+        "Diluted EPS (ttm)": ("defaultKeyStatistics", "trailingEps"),
+        "Quarterly Earnings Growth (yoy)": (
+            "defaultKeyStatistics",
+            "earningsQuarterlyGrowth",
+        ),
+        "Total Cash (mrq)": ("financialData", "totalCash"),
+        "Total Cash Per Share (mrq)": ("financialData", "totalCashPerShare"),
+        "Total Debt (mrq)": ("financialData", "totalDebt"),
+        "Total Debt/Equity (mrq)": ("financialData", "debtToEquity"),
+        "Current Ratio (mrq)": ("financialData", "currentRatio"),
+        "Book Value Per Share (mrq)": ("defaultKeyStatistics", "bookValue"),
+        "Operating Cash Flow (ttm)": ("financialData", "operatingCashflow"),
+        "Levered Free Cash Flow (ttm)": ("financialData", "freeCashflow"),
+    },
+    "trading_information": {
+        "Beta (5Y Monthly)": ("defaultKeyStatistics", "beta"),
+        "52 Week Change": ("defaultKeyStatistics", "52WeekChange"),
+        "S&P 500 52-Week Change": ("defaultKeyStatistics", "SandP52WeekChange"),
+        "52 Week High": ("summaryDetail", "fiftyTwoWeekHigh"),
+        "52 Week Low": ("summaryDetail", "fiftyTwoWeekLow"),
+        "50-Day Moving Average": ("summaryDetail", "fiftyDayAverage"),
+        "200-Day Moving Average": ("summaryDetail", "twoHundredDayAverage"),
+        "Avg Vol (3 month)": ("summaryDetail", "averageVolume"),
+        "Avg Vol (10 day)": ("summaryDetail", "averageVolume10days"),
+        "Shares Outstanding": ("defaultKeyStatistics", "sharesOutstanding"),
+        "Implied Shares Outstanding": (
+            "defaultKeyStatistics",
+            "impliedSharesOutstanding",
+        ),
+        "Float": ("defaultKeyStatistics", "floatShares"),
+        "% Held by Insiders": ("defaultKeyStatistics", "heldPercentInsiders"),
+        "% Held by Institutions": ("defaultKeyStatistics", "heldPercentInstitutions"),
+        "Shares Short": ("defaultKeyStatistics", "sharesShort"),
+        "Short Ratio": ("defaultKeyStatistics", "shortRatio"),
+        "Short % of Float": ("defaultKeyStatistics", "shortPercentOfFloat"),
+        "Short % of Shares Outstanding": (
+            "defaultKeyStatistics",
+            "sharesPercentSharesOut",
+        ),
+        "Shares Short (prior month)": ("defaultKeyStatistics", "sharesShortPriorMonth"),
+        "Forward Annual Dividend Rate": ("summaryDetail", "dividendRate"),
+        "Forward Annual Dividend Yield": ("summaryDetail", "dividendYield"),
+        "Trailing Annual Dividend Rate": (
+            "summaryDetail",
+            "trailingAnnualDividendRate",
+        ),
+        "Trailing Annual Dividend Yield": (
+            "summaryDetail",
+            "trailingAnnualDividendYield",
+        ),
+        "5 Year Average Dividend Yield": ("summaryDetail", "fiveYearAvgDividendYield"),
+        "Payout Ratio": ("summaryDetail", "payoutRatio"),
+        "Ex-Dividend Date": ("summaryDetail", "exDividendDate"),
+        "Last Split Factor": ("defaultKeyStatistics", "lastSplitFactor"),
+        "Last Split Date": ("defaultKeyStatistics", "lastSplitDate"),
+    },
+}
+
+# rows of the yahoo_web analysis tables and the earningsTrend fields they are
+# read from when served from the JSON embedded in the page
+EARNINGS_TREND_ROWS = {
+    "earningsEstimate": {
+        "No. of Analysts": "numberOfAnalysts",
+        "Avg. Estimate": "avg",
+        "Low Estimate": "low",
+        "High Estimate": "high",
+        "Year Ago EPS": "yearAgoEps",
+    },
+    "revenueEstimate": {
+        "No. of Analysts": "numberOfAnalysts",
+        "Avg. Estimate": "avg",
+        "Low Estimate": "low",
+        "High Estimate": "high",
+        "Year Ago Sales": "yearAgoRevenue",
+        "Sales Growth (year/est)": "growth",
+    },
+    "epsTrend": {
+        "Current Estimate": "current",
+        "7 Days Ago": "7daysAgo",
+        "30 Days Ago": "30daysAgo",
+        "60 Days Ago": "60daysAgo",
+        "90 Days Ago": "90daysAgo",
+    },
+    "epsRevisions": {
+        "Up Last 7 Days": "upLast7days",
+        "Up Last 30 Days": "upLast30days",
+        "Down Last 7 Days": "downLast7Days",
+        "Down Last 30 Days": "downLast30days",
+    },
+}
+
+# maximum span (in days) of a single chart request for intraday granularities
+INTRADAY_MAX_WINDOW_DAYS = {
+    "1m": 7,
+    "2m": 59,
+    "5m": 59,
+    "15m": 59,
+    "30m": 59,
+    "60m": 729,
+    "90m": 59,
+    "1h": 729,
+}
+
+# number of days (back from now) of intraday bars Yahoo keeps, requests starting
+# earlier are answered with HTTP 422
+INTRADAY_MAX_HISTORY_DAYS = {
+    "1m": 29,
+    "2m": 59,
+    "5m": 59,
+    "15m": 59,
+    "30m": 59,
+    "60m": 729,
+    "90m": 59,
+    "1h": 729,
+}
+
+# URL templates of the scraped datasets that are fetched with plain HTTP requests,
+# used by batch jobs to fetch pages ahead of parsing them
+SCRAPED_DATASET_URLS = {
+    "yahoo_web_cashflow": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/cash-flow",
+    "yahoo_web_balance_sheet": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/balance-sheet",
+    "yahoo_web_income_stmt": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/financials",
+    "yahoo_web_calls": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/options",
+    "yahoo_web_puts": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/options",
+    "yahoo_web_description": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/profile",
+    "yahoo_web_key_executives": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/profile",
+    "yahoo_web_corporate_governance": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/profile",
+    "yahoo_web_major_holders": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/holders",
+    "yahoo_web_top_institutional_holders": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/holders",
+    "yahoo_web_top_mutual_fund_holders": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/holders",
+    "yahoo_web_summary": f"{YAHOO_WEB_BASE_URL}/{{ticker}}",
+    "yahoo_web_valuation_measures": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/key-statistics",
+    "yahoo_web_financial_highlights": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/key-statistics",
+    "yahoo_web_trading_information": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/key-statistics",
+    "yahoo_web_full_name": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/",
+    "yahoo_web_earnings_estimate": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/analysis",
+    "yahoo_web_revenue_estimate": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/analysis",
+    "yahoo_web_earnings_history": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/analysis",
+    "yahoo_web_eps_trend": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/analysis",
+    "yahoo_web_eps_revisions": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/analysis",
+    "yahoo_web_growth_estimates": f"{YAHOO_WEB_BASE_URL}/{{ticker}}/analysis",
+    "digrin_dividend": f"{DIGRIN_BASE_URL}/{{ticker}}",
+    "digrin_payout_ratio": f"{DIGRIN_BASE_URL}/{{ticker}}/payout_ratio",
+    "digrin_price": f"{DIGRIN_BASE_URL}/{{ticker}}/price",
+    "digrin_stock_splits": f"{DIGRIN_BASE_URL}/{{ticker}}/stock_split",
+    "digrin_assets_vs_liabilities": f"{DIGRIN_BASE_URL}/{{ticker}}/financials",
+    "digrin_free_cash_flow": f"{DIGRIN_BASE_URL}/{{ticker}}/financials",
+    "digrin_net_income": f"{DIGRIN_BASE_URL}/{{ticker}}/financials",
+    "digrin_cash_and_debt": f"{DIGRIN_BASE_URL}/{{ticker}}/financials",
+    "digrin_shares_outstanding": f"{DIGRIN_BASE_URL}/{{ticker}}/financials",
+    "digrin_expenses": f"{DIGRIN_BASE_URL}/{{ticker}}/financials",
+    "digrin_cost_of_revenue": f"{DIGRIN_BASE_URL}/{{ticker}}/financials",
+    "digrin_dgr3": f"{DIGRIN_BASE_URL}/{{ticker}}/dgr3",
+    "digrin_dgr5": f"{DIGRIN_BASE_URL}/{{ticker}}/dgr5",
+    "digrin_dgr10": f"{DIGRIN_BASE_URL}/{{ticker}}/dgr10",
+    "digrin_upcoming_estimated_earnings": f"{DIGRIN_BASE_URL}/{{ticker}}/earnings",
+    "macrotrends_income_statement": f"{MACROTRENDS_BASE_URL}/{{ticker}}/TBD/income-statement",
+    "macrotrends_operating_margin": f"{MACROTRENDS_BASE_URL}/{{ticker}}/TBD/operating-margin",
+    "macrotrends_gross_margin": f"{MACROTRENDS_BASE_URL}/{{ticker}}/TBD/gross-margin",
+    "macrotrends_ebitda_margin": f"{MACROTRENDS_BASE_URL}/{{ticker}}/TBD/ebitda-margin",
+    "macrotrends_pre_tax_margin": f"{MACROTRENDS_BASE_URL}/{{ticker}}/TBD/pre-tax-profit-margin",
+    "macrotrends_net_margin": f"{MACROTRENDS_BASE_URL}/{{ticker}}/TBD/net-profit-margin",
+}
+
+# maximum URL length used when packing many fields into a single request
+MAX_URL_LENGTH = 8000
+
+FUNDAMENTALS_STATEMENTS = [
+    "income_statement",
+    "cash_flow",
+    "balance_sheet",
+    "financials",
+]
 
 INCOME_STATEMENT_COLUMNS = [
     "TaxEffectOfUnusualItems",
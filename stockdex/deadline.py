@@ -0,0 +1,74 @@
+"""
+Module for deadlines and cancellation of requests and batch jobs
+"""
+
+import threading
+import time
+from typing import Optional, Union
+
+from stockdex.exceptions import DeadlineExceeded
+
+
+class Deadline:
+    """
+    Token bounding the time that requests, Selenium renders and batch jobs may
+    take. It expires once its timeout has passed or when it is cancelled, after
+    which pending work raises DeadlineExceeded instead of starting.
+    """
+
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        """
+        Args:
+        ----------------
+        timeout (float): The number of seconds from now until the deadline expires
+        default is None, the deadline then only expires when cancelled
+        """
+        self.expires_at = None if timeout is None else time.monotonic() + timeout
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """
+        Expire the deadline now
+        """
+        self._cancelled.set()
+
+    @property
+    def expired(self) -> bool:
+        """
+        Whether the deadline has passed or was cancelled
+        """
+        return self._cancelled.is_set() or (
+            self.expires_at is not None and time.monotonic() >= self.expires_at
+        )
+
+    def remaining(self) -> Union[float, None]:
+        """
+        Get the number of seconds left, None if there is no time limit
+        """
+        if self._cancelled.is_set():
+            return 0.0
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def check(self) -> None:
+        """
+        Raise DeadlineExceeded if the deadline expired
+        """
+        if self.expired:
+            raise DeadlineExceeded()
+
+    def timeout(self, default: float) -> float:
+        """
+        Bound a timeout by the time left, raise DeadlineExceeded if the deadline expired
+        """
+        self.check()
+        remaining = self.remaining()
+        return default if remaining is None else min(default, remaining)
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Sleep, waking up early and raising DeadlineExceeded if the deadline expires
+        """
+        self._cancelled.wait(self.timeout(seconds))
+        self.check()
@@ -5,12 +5,17 @@ Module to extract data from Digrin website
 from typing import Union
 
 import pandas as pd
-from bs4 import BeautifulSoup
 from plotly import express as px
 
-from stockdex.config import DIGRIN_BASE_URL, VALID_SECURITY_TYPES
+from stockdex.config import VALID_SECURITY_TYPES
 from stockdex.exceptions import NoDataError
-from stockdex.lib import plot_dataframe
+from stockdex.lib import (
+    parse_dates,
+    parse_numeric,
+    plot_dataframe,
+    table_to_dataframe,
+    typed_table,
+)
 from stockdex.ticker_base import TickerBase
 
 
@@ -26,6 +31,7 @@ class DigrinInterface(TickerBase):
         self.security_type = security_type
 
     @property
+    @typed_table
     def digrin_dividend(self) -> pd.DataFrame:
         """
         Get dividends for the ticker
@@ -39,28 +45,17 @@ class DigrinInterface(TickerBase):
         """
 
         # URL of the website to scrape
-        url = f"{DIGRIN_BASE_URL}/{self.ticker}"
-        response = self.get_response(url)
+        url = self.dataset_url("digrin_dividend")
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        try:
-            table = self.find_parent_by_text(soup, "table", "Ex-dividend date")
-        except IndexError:
+        # Find the table by one of its column names
+        table = self.find_table(url, "Ex-dividend date")
+        if table is None:
             raise Exception(f"There is no dividend data for the ticker {self.ticker}")
 
-        data_df = pd.DataFrame()
-        data = []
-
-        headers = [th.text for th in table.find_all("thead")[0].find_all("th")]
-        for tr in table.find_all("tbody")[0].find_all("tr"):
-            data.append([td.text for td in tr.find_all("td")])
-
-        data_df = pd.DataFrame(data, columns=headers)
-        return data_df
+        return table_to_dataframe(table)
 
     @property
+    @typed_table
     def digrin_payout_ratio(self) -> pd.DataFrame:
         """
         Get payout ratio for the ticker
@@ -71,30 +66,19 @@ class DigrinInterface(TickerBase):
         """
 
         # URL of the website to scrape
-        url = f"{DIGRIN_BASE_URL}/{self.ticker}/payout_ratio"
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        url = self.dataset_url("digrin_payout_ratio")
 
-        try:
-            table = self.find_parent_by_text(soup, "table", "Payout ratio")
-        except IndexError:
+        # Find the table by one of its column names
+        table = self.find_table(url, "Payout ratio")
+        if table is None:
             raise Exception(
                 f"There is no payout ratio data for the ticker {self.ticker}"
             )
 
-        data_df = pd.DataFrame()
-        data = []
-
-        headers = [th.text for th in table.find_all("thead")[0].find_all("th")]
-        for tr in table.find_all("tbody")[0].find_all("tr"):
-            data.append([td.text for td in tr.find_all("td")])
-
-        data_df = pd.DataFrame(data, columns=headers)
-        return data_df
+        return table_to_dataframe(table)
 
     @property
+    @typed_table
     def digrin_price(self) -> pd.DataFrame:
         """
         Get price for the ticker
@@ -105,28 +89,17 @@ class DigrinInterface(TickerBase):
         """
 
         # URL of the website to scrape
-        url = f"{DIGRIN_BASE_URL}/{self.ticker}/price"
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        url = self.dataset_url("digrin_price")
 
-        try:
-            table = self.find_parent_by_text(soup, "table", "Adjusted price")
-        except IndexError:
+        # Find the table by one of its column names
+        table = self.find_table(url, "Adjusted price")
+        if table is None:
             raise Exception(f"There is no price data for the ticker {self.ticker}")
 
-        data_df = pd.DataFrame()
-        data = []
-
-        headers = [th.text for th in table.find_all("thead")[0].find_all("th")]
-        for tr in table.find_all("tbody")[0].find_all("tr"):
-            data.append([td.text for td in tr.find_all("td")])
-
-        data_df = pd.DataFrame(data, columns=headers)
-        return data_df
+        return table_to_dataframe(table)
 
     @property
+    @typed_table
     def digrin_stock_splits(self) -> pd.DataFrame:
         """
         Get stock splits for the ticker
@@ -137,28 +110,16 @@ class DigrinInterface(TickerBase):
         """
 
         # URL of the website to scrape
-        url = f"{DIGRIN_BASE_URL}/{self.ticker}/stock_split"
-        response = self.get_response(url)
+        url = self.dataset_url("digrin_stock_splits")
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        try:
-            table = self.find_parent_by_text(soup, "table", "Split Ratio")
-        except IndexError:
+        # Find the table by one of its column names
+        table = self.find_table(url, "Split Ratio")
+        if table is None:
             raise Exception(
                 f"There is no stock split data for the ticker {self.ticker}"
             )
 
-        data_df = pd.DataFrame()
-        data = []
-
-        headers = [th.text for th in table.find_all("thead")[0].find_all("th")]
-        for tr in table.find_all("tbody")[0].find_all("tr"):
-            data.append([td.text for td in tr.find_all("td")])
-
-        data_df = pd.DataFrame(data, columns=headers)
-        return data_df
+        return table_to_dataframe(table)
 
     def _get_table_from_url(self, keyword: str, url: str) -> pd.DataFrame:
         """
@@ -172,36 +133,17 @@ class DigrinInterface(TickerBase):
         visible in the digrin website for the ticker
         """
 
-        # URL of the website to scrape
-        url = url
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        try:
-            table = self.find_parent_by_text(soup, "table", keyword)
-        except IndexError:
-            raise NoDataError(
-                f"There is no {keyword} data for the ticker {self.ticker}"
-            )
-
+        # Find the table by one of its column names
+        table = self.find_table(url, keyword)
         if table is None:
             raise NoDataError(
                 f"There is no {keyword} data for the ticker {self.ticker}"
             )
 
-        data_df = pd.DataFrame()
-        data = []
-
-        headers = [th.text for th in table.find_all("thead")[0].find_all("th")]
-        for tr in table.find_all("tbody")[0].find_all("tr"):
-            data.append([td.text for td in tr.find_all("td")])
-
-        data_df = pd.DataFrame(data, columns=headers)
-        return data_df
+        return table_to_dataframe(table)
 
     @property
+    @typed_table
     def digrin_assets_vs_liabilities(self) -> pd.DataFrame:
         """
         Get assets vs liabilities for the ticker
@@ -212,10 +154,11 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Assets", f"{DIGRIN_BASE_URL}/{self.ticker}/financials"
+            "Assets", self.dataset_url("digrin_assets_vs_liabilities")
         )
 
     @property
+    @typed_table
     def digrin_free_cash_flow(self) -> pd.DataFrame:
         """
         Get free cash flow for the ticker
@@ -226,10 +169,11 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Free Cash Flow", f"{DIGRIN_BASE_URL}/{self.ticker}/financials"
+            "Free Cash Flow", self.dataset_url("digrin_free_cash_flow")
         )
 
     @property
+    @typed_table
     def digrin_net_income(self) -> pd.DataFrame:
         """
         Get net income for the ticker
@@ -240,10 +184,11 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Net Income", f"{DIGRIN_BASE_URL}/{self.ticker}/financials"
+            "Net Income", self.dataset_url("digrin_net_income")
         )
 
     @property
+    @typed_table
     def digrin_cash_and_debt(self) -> pd.DataFrame:
         """
         Get cash and debt for the ticker
@@ -254,10 +199,11 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Capital Lease", f"{DIGRIN_BASE_URL}/{self.ticker}/financials"
+            "Capital Lease", self.dataset_url("digrin_cash_and_debt")
         )
 
     @property
+    @typed_table
     def digrin_shares_outstanding(self) -> pd.DataFrame:
         """
         Get shares outstanding for the ticker
@@ -268,10 +214,11 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Shares Outstanding", f"{DIGRIN_BASE_URL}/{self.ticker}/financials"
+            "Shares Outstanding", self.dataset_url("digrin_shares_outstanding")
         )
 
     @property
+    @typed_table
     def digrin_expenses(self) -> pd.DataFrame:
         """
         Get expenses for the ticker
@@ -282,10 +229,11 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Capex", f"{DIGRIN_BASE_URL}/{self.ticker}/financials"
+            "Capex", self.dataset_url("digrin_expenses")
         )
 
     @property
+    @typed_table
     def digrin_cost_of_revenue(self) -> pd.DataFrame:
         """
         Get cost of revenue for the ticker
@@ -296,10 +244,11 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Cost of Revenue", f"{DIGRIN_BASE_URL}/{self.ticker}/financials"
+            "Cost of Revenue", self.dataset_url("digrin_cost_of_revenue")
         )
 
     @property
+    @typed_table
     def digrin_dgr3(self) -> pd.DataFrame:
         """
         Get dgr3 for the ticker
@@ -310,10 +259,11 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Estimated Yield on Cost", f"{DIGRIN_BASE_URL}/{self.ticker}/dgr3"
+            "Estimated Yield on Cost", self.dataset_url("digrin_dgr3")
         )
 
     @property
+    @typed_table
     def digrin_dgr5(self) -> pd.DataFrame:
         """
         Get dgr5 for the ticker
@@ -324,10 +274,11 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Estimated Yield on Cost", f"{DIGRIN_BASE_URL}/{self.ticker}/dgr5"
+            "Estimated Yield on Cost", self.dataset_url("digrin_dgr5")
         )
 
     @property
+    @typed_table
     def digrin_dgr10(self) -> pd.DataFrame:
         """
         Get dgr10 for the ticker
@@ -338,10 +289,11 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Estimated Yield on Cost", f"{DIGRIN_BASE_URL}/{self.ticker}/dgr10"
+            "Estimated Yield on Cost", self.dataset_url("digrin_dgr10")
         )
 
     @property
+    @typed_table
     def digrin_upcoming_estimated_earnings(self) -> pd.DataFrame:
         """
         Get upcoming estimated earnings for the ticker
@@ -352,7 +304,7 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Actual / Estimated EPS", f"{DIGRIN_BASE_URL}/{self.ticker}/earnings"
+            "Actual / Estimated EPS", self.dataset_url("digrin_upcoming_estimated_earnings")
         )
 
     def plot_digrin_shares_outstanding(
@@ -375,13 +327,8 @@ class DigrinInterface(TickerBase):
 
         data = self.digrin_shares_outstanding
 
-        data["Date"] = data["Date"].apply(self._human_date_format_to_raw)
-        data["Date"] = pd.to_datetime(data["Date"])
-        data["Shares Outstanding"] = (
-            data["Shares Outstanding"]
-            .replace("?", "0")
-            .apply(self._human_number_format_to_raw)
-        )
+        data["Date"] = parse_dates(data["Date"])
+        data["Shares Outstanding"] = parse_numeric(data["Shares Outstanding"]).fillna(0)
         data.set_index("Date", inplace=True)
         data = data[["Shares Outstanding"]]
 
@@ -412,13 +359,9 @@ class DigrinInterface(TickerBase):
         """
 
         data = self.digrin_price
-        data["Date"] = pd.to_datetime(data["Date"])
-        data["Real Price"] = (
-            data["Real price"].str.replace("$", "").replace(",", "").astype(float)
-        )
-        data["Adjusted Price"] = (
-            data["Adjusted price"].str.replace("$", "").replace(",", "").astype(float)
-        )
+        data["Date"] = parse_dates(data["Date"])
+        data["Real Price"] = parse_numeric(data["Real price"])
+        data["Adjusted Price"] = parse_numeric(data["Adjusted price"])
 
         # drop the original columns
         data.drop(columns=["Real price", "Adjusted price"], inplace=True)
@@ -452,7 +395,7 @@ class DigrinInterface(TickerBase):
         """
 
         data = self.digrin_dividend
-        data["Ex-dividend date"] = pd.to_datetime(data["Ex-dividend date"])
+        data["Ex-dividend date"] = parse_dates(data["Ex-dividend date"])
         data["Dividend"] = (
             data["Dividend amount (change)"]
             .str.split(" ", expand=True)[0]
@@ -493,12 +436,9 @@ class DigrinInterface(TickerBase):
 
         data = self.digrin_assets_vs_liabilities
 
-        data["Date"] = data["Date"].apply(self._human_date_format_to_raw)
-        data["Date"] = pd.to_datetime(data["Date"])
-        data["Assets"] = data["Assets"].apply(self._human_number_format_to_raw)
-        data["Liabilities"] = data["Liabilities"].apply(
-            self._human_number_format_to_raw
-        )
+        data["Date"] = parse_dates(data["Date"])
+        data["Assets"] = parse_numeric(data["Assets"]).fillna(0)
+        data["Liabilities"] = parse_numeric(data["Liabilities"]).fillna(0)
         data.set_index("Date", inplace=True)
         data = data[["Assets", "Liabilities"]]
 
@@ -512,60 +452,6 @@ class DigrinInterface(TickerBase):
 
         return fig
 
-    def _human_number_format_to_raw(self, entry: str) -> float:
-        """
-        Convert human readable format to raw format
-        If there is a suffix like trillion, billion, million, etc. in the data,
-        """
-        entries_to_consider_zero = [
-            "?",
-            "N/A",
-            "n/a",
-            "nan",
-            "NAN",
-            "Nan",
-            "_",
-            "-",
-            "",
-        ]
-        if entry in entries_to_consider_zero:
-            return 0
-        elif "t" in entry.lower():
-            return float(entry.split(" ")[0]) * 1000000000000
-        elif "b" in entry.lower():
-            return float(entry.split(" ")[0]) * 1000000000
-        elif "m" in entry.lower():
-            return float(entry.split(" ")[0]) * 1000000
-        elif "k" in entry.lower():
-            return float(entry.split(" ")[0]) * 1000
-        else:
-            return float(entry)
-
-    def _human_date_format_to_raw(self, entry: str) -> str:
-        """
-        Convert human readable date format (e.g. "Dec. 31, 2023") to raw format (e.g. 2023-12-31)
-        """
-        conversion_dict = {
-            "Jan": "01",
-            "Feb": "02",
-            "March": "03",
-            "Apr": "04",
-            "May": "05",
-            "June": "06",
-            "Jul": "07",
-            "Aug": "08",
-            "Sept": "09",
-            "Oct": "10",
-            "Nov": "11",
-            "Dec": "12",
-        }
-
-        month, day, year = entry.split(" ")
-        month = month.replace(".", "")
-        month = conversion_dict[month]
-        day = day.replace(",", "")
-        return f"{year}-{month}-{day}"
-
     def plot_digrin_free_cash_flow(
         self, show_plot: bool = True
     ) -> Union[px.line, px.bar]:
@@ -586,18 +472,11 @@ class DigrinInterface(TickerBase):
 
         data = self.digrin_free_cash_flow
 
-        data["Date"] = data["Date"].apply(self._human_date_format_to_raw)
-        data["Date"] = pd.to_datetime(data["Date"])
-        data["Free Cash Flow"] = (
-            data["Free Cash Flow"]
-            .replace("?", "0")
-            .apply(self._human_number_format_to_raw)
-        )
-        data["Stock based compensation"] = (
+        data["Date"] = parse_dates(data["Date"])
+        data["Free Cash Flow"] = parse_numeric(data["Free Cash Flow"]).fillna(0)
+        data["Stock based compensation"] = parse_numeric(
             data["Stock based compensation"]
-            .replace("?", "0")
-            .apply(self._human_number_format_to_raw)
-        )
+        ).fillna(0)
         data.set_index("Date", inplace=True)
         data = data[["Free Cash Flow", "Stock based compensation"]]
 
@@ -629,11 +508,8 @@ class DigrinInterface(TickerBase):
 
         data = self.digrin_net_income
 
-        data["Date"] = data["Date"].apply(self._human_date_format_to_raw)
-        data["Date"] = pd.to_datetime(data["Date"])
-        data["Net Income"] = (
-            data["Net Income"].replace("?", "0").apply(self._human_number_format_to_raw)
-        )
+        data["Date"] = parse_dates(data["Date"])
+        data["Net Income"] = parse_numeric(data["Net Income"]).fillna(0)
 
         data.set_index("Date", inplace=True)
         data = data[["Net Income"]]
@@ -668,10 +544,9 @@ class DigrinInterface(TickerBase):
 
         data = self.digrin_cash_and_debt
 
-        data["Date"] = data["Date"].apply(self._human_date_format_to_raw)
-        data["Date"] = pd.to_datetime(data["Date"])
-        data["Cash"] = data["Cash"].apply(self._human_number_format_to_raw)
-        data["Debt"] = data["Debt"].apply(self._human_number_format_to_raw)
+        data["Date"] = parse_dates(data["Date"])
+        data["Cash"] = parse_numeric(data["Cash"]).fillna(0)
+        data["Debt"] = parse_numeric(data["Debt"]).fillna(0)
         data.set_index("Date", inplace=True)
         data = data[["Cash", "Debt"]]
 
@@ -703,12 +578,11 @@ class DigrinInterface(TickerBase):
 
         data = self.digrin_expenses
 
-        data["Date"] = data["Date"].apply(self._human_date_format_to_raw)
-        data["Date"] = pd.to_datetime(data["Date"])
-        data["Capex"] = data["Capex"].apply(self._human_number_format_to_raw)
-        data["R&D"] = data["R&D"].apply(self._human_number_format_to_raw)
-        data["G&A"] = data["G&A"].apply(self._human_number_format_to_raw)
-        data["S&M"] = data["S&M"].apply(self._human_number_format_to_raw)
+        data["Date"] = parse_dates(data["Date"])
+        data["Capex"] = parse_numeric(data["Capex"]).fillna(0)
+        data["R&D"] = parse_numeric(data["R&D"]).fillna(0)
+        data["G&A"] = parse_numeric(data["G&A"]).fillna(0)
+        data["S&M"] = parse_numeric(data["S&M"]).fillna(0)
         data.set_index("Date", inplace=True)
         data = data[["Capex", "R&D", "G&A", "S&M"]]
 
@@ -742,16 +616,9 @@ class DigrinInterface(TickerBase):
 
         data = self.digrin_cost_of_revenue
 
-        data["Date"] = data["Date"].apply(self._human_date_format_to_raw)
-        data["Date"] = pd.to_datetime(data["Date"])
-        data["Cost of Revenue"] = (
-            data["Cost of Revenue"]
-            .replace("?", "0")
-            .apply(self._human_number_format_to_raw)
-        )
-        data["Revenue"] = (
-            data["Revenue"].replace("?", "0").apply(self._human_number_format_to_raw)
-        )
+        data["Date"] = parse_dates(data["Date"])
+        data["Cost of Revenue"] = parse_numeric(data["Cost of Revenue"]).fillna(0)
+        data["Revenue"] = parse_numeric(data["Revenue"]).fillna(0)
         data.set_index("Date", inplace=True)
         data = data[["Cost of Revenue", "Revenue"]]
 
@@ -85,3 +85,17 @@ class FieldNotExists(Exception):
             {self.message}. The field {self.given_field} does not exist in the dataframe.
             Make sure to choose a field from the following: {self.available_fields}
             """
+
+
+class DeadlineExceeded(Exception):
+    """
+    The exception to be shown when work is skipped because its deadline expired
+    or it was cancelled
+    """
+
+    def __init__(self, message: str = "Deadline exceeded") -> None:
+        self.message = message
+        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        return self.message
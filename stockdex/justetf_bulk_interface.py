@@ -0,0 +1,120 @@
+"""
+Module to retrieve data for many ETFs at once from JustETF website
+The main Tickers class inherits from this class
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from stockdex.config import JUSTETF_BASE_URL, VALID_SECURITY_TYPES
+from stockdex.exceptions import NoISINError
+from stockdex.justetf_interface import (
+    HOLDINGS_TABLES,
+    parse_basics,
+    parse_general_info,
+    parse_holdings,
+)
+from stockdex.lib import check_security_type
+from stockdex.selenium_interface import selenium_interface
+from stockdex.ticker_base import TickerBase
+
+JUSTETF_BULK_DATASETS = ["general_info", "basics", *HOLDINGS_TABLES]
+
+
+class JustETFBulk(TickerBase):
+    def __init__(
+        self,
+        tickers: Optional[List[str]] = None,
+        isins: Optional[List[str]] = None,
+        security_type: VALID_SECURITY_TYPES = "etf",
+    ) -> None:
+        self.tickers = list(tickers) if tickers else []
+        self.isins = list(isins) if isins else []
+        self.security_type = security_type
+
+    def justetf_bulk(
+        self, datasets: List[str] = JUSTETF_BULK_DATASETS, max_workers: int = 4
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get JustETF data for all ISINs. The profile page of each ISIN is rendered
+        once and all datasets are parsed from it, the pages of different ISINs are
+        rendered concurrently.
+
+        Args:
+        ----------------
+        datasets (List[str]): The datasets to retrieve, any of "general_info",
+        "basics", "holdings_companies", "holdings_countries" and "holdings_sectors"
+        default is all of them
+
+        max_workers (int): The number of pages rendered concurrently
+
+        Returns:
+        ----------------
+        Dict[str, pd.DataFrame]: One frame per dataset indexed by ISIN.
+        general_info and basics have one row per ISIN, the holdings datasets one
+        row per ISIN and holding. ISINs whose page failed are left out and logged
+        """
+        check_security_type(self.security_type, valid_types=["etf"])
+        if not self.isins:
+            raise NoISINError("No ISINs provided, please provide a list of ISINs")
+        for dataset in datasets:
+            if dataset not in JUSTETF_BULK_DATASETS:
+                raise ValueError(
+                    f"{dataset} is not a JustETF dataset, " f"choose from: {JUSTETF_BULK_DATASETS}"
+                )
+
+        # build selenium interface object if not already built
+        if not hasattr(self, "selenium_interface"):
+            self.selenium_interface = selenium_interface()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                isin: executor.submit(self._justetf_profile, isin, datasets) for isin in self.isins
+            }
+
+        frames = {dataset: [] for dataset in datasets}
+        for isin, future in futures.items():
+            if future.exception() is not None:
+                self.logger.warning(
+                    f"Failed to retrieve JustETF data of {isin}: {future.exception()}"
+                )
+                continue
+
+            for dataset, data in future.result().items():
+                frames[dataset].append(data.assign(isin=isin))
+
+        return {
+            dataset: self._tidy_justetf_frame(dataset, frames[dataset]) for dataset in datasets
+        }
+
+    def _justetf_profile(self, isin: str, datasets: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Render the profile page of an ISIN once and parse the datasets from it
+        """
+        url = f"{JUSTETF_BASE_URL}/etf-profile.html?isin={isin}"
+        soup = self.selenium_interface.get_html_content(
+            url, deadline=self.deadline, parser=self.html_parser
+        )
+
+        results = {}
+        for dataset in datasets:
+            if dataset == "general_info":
+                results[dataset] = parse_general_info(soup)
+            elif dataset == "basics":
+                results[dataset] = parse_basics(soup)
+            else:
+                heading, name = HOLDINGS_TABLES[dataset]
+                results[dataset] = parse_holdings(soup, heading, name).reset_index()
+
+        return results
+
+    def _tidy_justetf_frame(self, dataset: str, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatenate the frames of all ISINs into one frame indexed by ISIN
+        """
+        if not frames:
+            return pd.DataFrame(index=pd.Index([], name="isin"))
+
+        return pd.concat(frames, ignore_index=True).set_index("isin")
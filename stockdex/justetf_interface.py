@@ -7,10 +7,73 @@ from bs4 import BeautifulSoup
 
 from stockdex.config import JUSTETF_BASE_URL, VALID_SECURITY_TYPES
 from stockdex.exceptions import NoISINError
-from stockdex.lib import check_security_type
+from stockdex.lib import check_security_type, table_to_dataframe, typed_table
 from stockdex.selenium_interface import selenium_interface
 from stockdex.ticker_base import TickerBase
 
+# (heading of the holdings table, name of its first column) per holdings dataset
+HOLDINGS_TABLES = {
+    "holdings_companies": ("Top 10 Holdings", "company name"),
+    "holdings_countries": ("Countries", "country name"),
+    "holdings_sectors": ("Sectors", "sector name"),
+}
+
+
+def parse_general_info(soup: BeautifulSoup) -> pd.DataFrame:
+    """
+    Parse the general information (TER, distribution policy, replication method,
+    etc.) from the ETF profile page
+    """
+    data_df = pd.DataFrame()
+
+    general_info = soup.find("div", {"class": "data-overview mt-4 mb-3"})
+    labels = general_info.find_all("div", {"class": "vallabel"})
+
+    for label in labels:
+        column = label.text.replace(" ", "")
+        value = label.find_next_sibling("div").text
+
+        data_df[column] = [value]
+
+    return data_df
+
+
+def parse_basics(soup: BeautifulSoup) -> pd.DataFrame:
+    """
+    Parse the basics table (fund size, domicile, legal structure, etc.)
+    from the rendered ETF profile page
+    """
+    table = soup.find("table", {"class": "table etf-data-table"})
+
+    data = table_to_dataframe(table, header=None, body=None, strip=True)
+
+    # one column per label
+    return pd.DataFrame([data[1].values], columns=data[0].values)
+
+
+def parse_holdings(soup: BeautifulSoup, heading: str, name: str) -> pd.DataFrame:
+    """
+    Parse a holdings table from the rendered ETF profile page
+
+    Args:
+    ----------------
+    soup (BeautifulSoup): The rendered profile page
+
+    heading (str): The text of the heading above the table, e.g. "Countries"
+
+    name (str): The name of the first column, used as index
+
+    Returns:
+    ----------------
+    pd.DataFrame: The holdings with a "shares in percent" column
+    """
+    table = soup.find(lambda tag: tag.name == "h3" and heading in tag.text).find_next("table")
+    data = table_to_dataframe(table, header=None, strip=True)
+
+    return pd.DataFrame(
+        {"shares in percent": data[1].values}, index=pd.Index(data[0].values, name=name)
+    )
+
 
 class JustETF(TickerBase):
     def __init__(
@@ -26,6 +89,7 @@ class JustETF(TickerBase):
             raise NoISINError("No ISIN provided, please provide an ISIN")
 
     @property
+    @typed_table
     def justetf_general_info(self) -> pd.DataFrame:
         """
         Get the general information of the ETF
@@ -34,22 +98,9 @@ class JustETF(TickerBase):
         check_security_type(self.security_type, valid_types=["etf"])
 
         url = f"{JUSTETF_BASE_URL}/etf-profile.html?isin={self.isin}"
-        response = self.get_response(url)
-
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        data_df = pd.DataFrame()
-
-        general_info = soup.find("div", {"class": "data-overview mt-4 mb-3"})
-        labels = general_info.find_all("div", {"class": "vallabel"})
+        soup = self.get_soup(url)
 
-        for label in labels:
-            column = label.text.replace(" ", "")
-            value = label.find_next_sibling("div").text
-
-            data_df[column] = [value]
-
-        return data_df
+        return parse_general_info(soup)
 
     @property
     def justetf_wkn(self) -> str:
@@ -59,9 +110,7 @@ class JustETF(TickerBase):
         check_security_type(self.security_type, valid_types=["etf"])
 
         url = f"{JUSTETF_BASE_URL}/etf-profile.html?isin={self.isin}"
-        response = self.get_response(url)
-
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = self.get_soup(url)
 
         wkn = soup.find("span", {"id": "etf-second-id"}).text
 
@@ -75,15 +124,14 @@ class JustETF(TickerBase):
         check_security_type(self.security_type, valid_types=["etf"])
 
         url = f"{JUSTETF_BASE_URL}/etf-profile.html?isin={self.isin}"
-        response = self.get_response(url)
-
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = self.get_soup(url)
 
         description = soup.find("div", {"id": "etf-description"}).text
 
         return description
 
     @property
+    @typed_table
     def justetf_basics(self) -> pd.DataFrame:
         """
         Get the baisc information of the ETF
@@ -110,19 +158,14 @@ class JustETF(TickerBase):
         if not hasattr(self, "selenium_interface"):
             self.selenium_interface = selenium_interface()
 
-        soup = self.selenium_interface.get_html_content(url)
-
-        data_df = pd.DataFrame()
-
-        table = soup.find("table", {"class": "table etf-data-table"})
-
-        for row in table.find_all("tr"):
-            column = row.find_all("td")
-            data_df[column[0].text.strip()] = [column[1].text.strip()]
+        soup = self.selenium_interface.get_html_content(
+            url, deadline=self.deadline, parser=self.html_parser
+        )
 
-        return data_df
+        return parse_basics(soup)
 
     @property
+    @typed_table
     def justetf_holdings_companies(self) -> pd.DataFrame:
         """
         Get the top 10 holdings of the ETF by companies
@@ -147,30 +190,14 @@ class JustETF(TickerBase):
         if not hasattr(self, "selenium_interface"):
             self.selenium_interface = selenium_interface()
 
-        soup = self.selenium_interface.get_html_content(url)
-
-        data_df = pd.DataFrame()
-        companies = []
-        shares_percent = []
-
-        table_body = (
-            soup.find(lambda tag: tag.name == "h3" and "Top 10 Holdings" in tag.text)
-            .find_next("table")
-            .find("tbody")
+        soup = self.selenium_interface.get_html_content(
+            url, deadline=self.deadline, parser=self.html_parser
         )
 
-        for row in table_body.find_all("tr"):
-            columns = row.find_all("td")
-            companies.append(columns[0].text.strip())
-            shares_percent.append(columns[1].text.strip())
-
-        data_df["company name"] = companies
-        data_df["shares in percent"] = shares_percent
-        data_df.set_index("company name", inplace=True)
-
-        return data_df
+        return parse_holdings(soup, heading="Top 10 Holdings", name="company name")
 
     @property
+    @typed_table
     def justetf_holdings_countries(self) -> pd.DataFrame:
         """
         Get the top 10 holdings of the ETF by countries
@@ -195,30 +222,14 @@ class JustETF(TickerBase):
         if not hasattr(self, "selenium_interface"):
             self.selenium_interface = selenium_interface()
 
-        soup = self.selenium_interface.get_html_content(url)
-
-        data_df = pd.DataFrame()
-        countries = []
-        shares_percent = []
-
-        table_body = (
-            soup.find(lambda tag: tag.name == "h3" and "Countries" in tag.text)
-            .find_next("table")
-            .find("tbody")
+        soup = self.selenium_interface.get_html_content(
+            url, deadline=self.deadline, parser=self.html_parser
         )
 
-        for row in table_body.find_all("tr"):
-            columns = row.find_all("td")
-            countries.append(columns[0].text.strip())
-            shares_percent.append(columns[1].text.strip())
-
-        data_df["country name"] = countries
-        data_df["shares in percent"] = shares_percent
-        data_df.set_index("country name", inplace=True)
-
-        return data_df
+        return parse_holdings(soup, heading="Countries", name="country name")
 
     @property
+    @typed_table
     def justetf_holdings_sectors(self) -> pd.DataFrame:
         """
         Get the top 10 holdings of the ETF by sectors
@@ -243,25 +254,8 @@ class JustETF(TickerBase):
         if not hasattr(self, "selenium_interface"):
             self.selenium_interface = selenium_interface()
 
-        soup = self.selenium_interface.get_html_content(url)
-
-        data_df = pd.DataFrame()
-        sectors = []
-        shares_percent = []
-
-        table_body = (
-            soup.find(lambda tag: tag.name == "h3" and "Sectors" in tag.text)
-            .find_next("table")
-            .find("tbody")
+        soup = self.selenium_interface.get_html_content(
+            url, deadline=self.deadline, parser=self.html_parser
         )
 
-        for row in table_body.find_all("tr"):
-            columns = row.find_all("td")
-            sectors.append(columns[0].text.strip())
-            shares_percent.append(columns[1].text.strip())
-
-        data_df["sector name"] = sectors
-        data_df["shares in percent"] = shares_percent
-        data_df.set_index("sector name", inplace=True)
-
-        return data_df
+        return parse_holdings(soup, heading="Sectors", name="sector name")
@@ -1,13 +1,93 @@
+import json
+import os
 import platform
-from typing import List, Union
+from datetime import datetime
+from functools import wraps
+from typing import Callable, List, Optional, Tuple, Union
 
 import dash
+import numpy as np
 import pandas as pd
 import plotly.express as px
+from bs4 import Tag
 from dash import dcc, html
 
 from stockdex.exceptions import WrongSecurityType
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# scraped values standing for a missing number
+MISSING_VALUES = ["", "?", "-", "--", "_", "\u2014", "N/A", "n/a", "NA", "nan", "NaN"]
+
+# characters dropped before a value is converted, e.g. in "$1,234" and
+# "1.2 B", the minus sign is replaced by a hyphen
+NUMERIC_NOISE = {
+    " ": "",
+    ",": "",
+    "$": "",
+    "\u20ac": "",
+    "\u00a3": "",
+    "\u00a5": "",
+    "%": "",
+    "\u2212": "-",
+}
+# scale words, matched in any case and longest first, replaced by the suffix
+# of SUFFIX_MULTIPLIERS they stand for, e.g. "2.1 Trillion" becomes "2.1t"
+NUMERIC_WORDS = {"thousand": "k", "trillion": "t", "million": "m", "billion": "b"}
+SUFFIX_MULTIPLIERS = {"k": 1e3, "m": 1e6, "b": 1e9, "t": 1e12}
+
+# month names and the abbreviations of the scraped dates, e.g. "Sept." and "March",
+# replaced by the three letters of %b before the format of a date column is detected
+MONTH_ABBREVIATIONS = {
+    "January": "Jan",
+    "February": "Feb",
+    "March": "Mar",
+    "April": "Apr",
+    "June": "Jun",
+    "July": "Jul",
+    "August": "Aug",
+    "September": "Sep",
+    "Sept": "Sep",
+    "October": "Oct",
+    "November": "Nov",
+    "December": "Dec",
+}
+MONTHS = [
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+]
+
+# formats of the scraped dates, tried in order on the first date of a column
+DATE_FORMATS = [
+    "%Y-%m-%d",
+    "%b %d, %Y",
+    "%b %d %Y",
+    "%d %b %Y",
+    "%m/%d/%Y",
+    "%m/%d/%y",
+    "%d.%m.%Y",
+    "%b %Y",
+    "%Y-%m",
+    "%b %d",
+    "%d %b",
+]
+# formats of dates shown without their year, e.g. "March 31" of a past earnings
+# or dividend row, which is filled in as the year of its most recent occurrence
+YEARLESS_DATE_FORMATS = ["%b %d", "%d %b"]
+
 
 def get_user_agent():
     os_name = platform.system().lower()
@@ -22,6 +102,400 @@ def get_user_agent():
         return """Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36"""  # noqa E501
 
 
+def loads_json(content: Union[str, bytes]) -> Union[dict, list]:
+    """
+    Decode a JSON document, with the faster orjson decoder when it is installed
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
+def _find_all(element: object, *specs: str) -> list:
+    """
+    Find the descendants of a BeautifulSoup tag or lxml element matching any of
+    the specs, in document order. A spec is a tag name, optionally followed by
+    a class, e.g. "tbody" or "tr.earnings-surprise__header"
+    """
+    if not isinstance(element, Tag):
+        paths = []
+        for spec in specs:
+            tag, _, class_name = spec.partition(".")
+            path = f".//{tag}"
+            if class_name:
+                path += f"[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+            paths.append(path)
+        return element.xpath(" | ".join(paths))
+
+    if len(specs) == 1 and "." in specs[0]:
+        tag, _, class_name = specs[0].partition(".")
+        return element.find_all(tag, class_=class_name)
+
+    return element.find_all(list(specs))
+
+
+def _cell_text(element: object, strip: bool) -> str:
+    """
+    Get the text of a BeautifulSoup tag or lxml element
+    """
+    text = element.get_text() if isinstance(element, Tag) else element.text_content()
+
+    return text.strip() if strip else text
+
+
+def table_to_dataframe(
+    table: object,
+    header: Union[str, None] = "thead",
+    body: Union[str, None] = "tbody",
+    cells: Tuple[str, ...] = ("td",),
+    columns: Optional[List[str]] = None,
+    strip: bool = False,
+    header_position: int = 0,
+) -> pd.DataFrame:
+    """
+    Build a DataFrame from an HTML table. The cells are collected in one pass
+    and the frame is built once. The table is either a BeautifulSoup tag or,
+    as a faster alternative, an lxml element.
+
+    Args:
+    ----------------
+    table (Union[Tag, HtmlElement]): The table, or any element holding rows
+
+    header (str): The element holding the column names as th cells, a tag name
+    optionally followed by a class, e.g. "thead" or "tr.table__header".
+    If None, the columns are numbered
+
+    body (str): The element holding the rows, e.g. "tbody", if None all rows of
+    the table are read. Rows without cells, e.g. header rows, are skipped
+
+    cells (Tuple[str]): The tags of the cells of a row, e.g. ("th", "td") for rows
+    whose first cell is a th
+
+    columns (List[str]): The column names, overrides the header
+
+    strip (bool): If the whitespace around the cell texts should be removed
+
+    header_position (int): The position of the header among the matching elements,
+    e.g. 1 if the first thead of the table holds its title
+
+    Returns:
+    ----------------
+    pd.DataFrame: The table
+    """
+    if columns is None and header is not None:
+        header_element = _find_all(table, header)[header_position]
+        columns = [_cell_text(cell, strip) for cell in _find_all(header_element, "th")]
+
+    container = _find_all(table, body)[0] if body is not None else table
+
+    data = []
+    for row in _find_all(container, "tr"):
+        values = [_cell_text(cell, strip) for cell in _find_all(row, *cells)]
+        if values:
+            data.append(values)
+
+    return pd.DataFrame(data, columns=columns)
+
+
+def _parse_numeric(values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    Parse a column of scraped strings into floats, returning the parsed values
+    and a mask of the values that are present, i.e. not a missing marker
+    """
+    text = np.char.strip(values.fillna("").to_numpy(dtype=str))
+    present = ~np.isin(text, MISSING_VALUES)
+
+    # accounting style negatives, e.g. "(1,234)"
+    negative = np.char.startswith(text, "(") & np.char.endswith(text, ")")
+    text = np.where(negative, np.char.strip(text, "()"), text)
+
+    # only replace the characters that occur in the column
+    codes = text.view(np.uint32)
+    initials = {ord(char) for word in NUMERIC_WORDS for char in (word[0], word[0].upper())}
+    if np.isin(codes, list(initials)).any():
+        text = np.char.lower(text)
+        for word in sorted(NUMERIC_WORDS, key=len, reverse=True):
+            text = np.char.replace(text, word, NUMERIC_WORDS[word])
+
+    for token, replacement in NUMERIC_NOISE.items():
+        if (codes == ord(token[0])).any():
+            text = np.char.replace(text, token, replacement)
+
+    multiplier = np.ones(len(text))
+    for suffix, factor in SUFFIX_MULTIPLIERS.items():
+        suffixed = np.char.endswith(text, suffix) | np.char.endswith(text, suffix.upper())
+        multiplier[suffixed] = factor
+    text = np.char.rstrip(text, "kmbtKMBT")
+
+    text[~present] = "nan"
+    try:
+        number = text.astype(float)
+    except ValueError:
+        # some values are not numbers, they become NaN
+        number = pd.to_numeric(text, errors="coerce").astype(float)
+
+    number = number * multiplier
+    number[negative] *= -1
+
+    return (
+        pd.Series(number, index=values.index, name=values.name),
+        pd.Series(present, index=values.index),
+    )
+
+
+def parse_numeric(values: pd.Series) -> pd.Series:
+    """
+    Convert a column of scraped strings such as "1.23B", "12.5%", "(1,234)",
+    "--" and "$182.30" into floats at once, using NumPy's vectorized string
+    operations instead of converting the values one by one
+
+    Suffixes K, M, B and T (or thousand, million, billion and trillion) scale the
+    value, parentheses make it negative, currency symbols and thousands separators
+    are dropped and percentages keep their value, e.g. "12.5%" becomes 12.5
+
+    Args:
+    ----------------
+    values (pd.Series): The scraped values
+
+    Returns:
+    ----------------
+    pd.Series: The values as floats, NaN for missing markers such as "--" or "N/A"
+    and values that are not a number
+    """
+    return _parse_numeric(values)[0]
+
+
+def numeric_dataframe(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the text columns of a scraped table whose values are all numbers,
+    apart from missing markers, into float columns. Other columns, e.g. names
+    and dates, are left unchanged
+
+    Args:
+    ----------------
+    data (pd.DataFrame): The scraped table
+
+    Returns:
+    ----------------
+    pd.DataFrame: A copy of the table with the numeric columns as floats
+    """
+    data = data.copy()
+    for position in range(data.shape[1]):
+        column = data.iloc[:, position]
+        if column.dtype != object and not pd.api.types.is_string_dtype(column):
+            continue
+
+        parsed, present = _parse_numeric(column)
+        if present.any() and parsed[present.to_numpy()].notna().all():
+            data.isetitem(position, parsed)
+
+    return data
+
+
+def _date_format_matches(value: str, date_format: str) -> bool:
+    """
+    Check whether a date matches the given format
+    """
+    if date_format in YEARLESS_DATE_FORMATS:
+        # a leap year, so that February 29 matches
+        value, date_format = f"{value} 2000", f"{date_format} %Y"
+    try:
+        datetime.strptime(value, date_format)
+    except ValueError:
+        return False
+    return True
+
+
+def _to_datetime(values: np.ndarray, date_format: str) -> np.ndarray:
+    """
+    Convert dates of the given format at once, NaT for the ones not matching it
+    """
+    if date_format not in YEARLESS_DATE_FORMATS:
+        return pd.to_datetime(values, format=date_format, errors="coerce").to_numpy(
+            dtype="datetime64[ns]"
+        )
+
+    # parsed in a leap year, so that February 29 is valid, then moved to this year,
+    # or the year before for the dates still to come this year
+    today = pd.Timestamp.today().normalize()
+    dates = pd.to_datetime(
+        np.char.add(values, " 2000"), format=f"{date_format} %Y", errors="coerce"
+    )
+    earlier, dates = (dates + pd.DateOffset(years=today.year + shift - 2000) for shift in (-1, 0))
+    dates = dates.where(dates <= today, earlier)
+
+    return dates.to_numpy(dtype="datetime64[ns]")
+
+
+def _parse_dates(values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    Parse a column of scraped dates, returning the parsed dates and a mask of
+    the values that are present, i.e. not a missing marker
+    """
+    # dates repeat, e.g. the quarter ends of several fields, so each distinct
+    # value is normalized and parsed once
+    codes, uniques = pd.factorize(values.astype("string").str.strip())
+    uniques = np.asarray(uniques, dtype=str)
+    # numeric dates, e.g. ISO ones, have no month names to shorten
+    letters = np.char.isalpha(uniques.view("U1"))
+    if letters.any():
+        for name, abbreviation in MONTH_ABBREVIATIONS.items():
+            uniques = np.char.replace(uniques, name, abbreviation)
+        for abbreviation in MONTHS:
+            uniques = np.char.replace(uniques, f"{abbreviation}.", abbreviation)
+    present_uniques = ~np.isin(uniques, MISSING_VALUES)
+
+    # the format is detected once, on the first date of the column
+    date_format = None
+    if present_uniques.any():
+        sample = uniques[present_uniques][0]
+        date_format = next(
+            (candidate for candidate in DATE_FORMATS if _date_format_matches(sample, candidate)),
+            None,
+        )
+
+    parsed_uniques = np.full(len(uniques) + 1, np.datetime64("NaT"), "datetime64[ns]")
+    if date_format is not None:
+        parsed_uniques[:-1] = _to_datetime(uniques, date_format)
+
+        # the dates not matching the format of the column are tried with the
+        # other formats, one format at a time
+        for candidate in DATE_FORMATS:
+            unparsed = present_uniques & np.isnat(parsed_uniques[:-1])
+            if not unparsed.any():
+                break
+            if candidate != date_format:
+                parsed_uniques[:-1][unparsed] = _to_datetime(uniques[unparsed], candidate)
+
+    # missing values have the code -1, i.e. the trailing NaT
+    present = np.append(present_uniques, False)[codes]
+    parsed = pd.Series(parsed_uniques[codes], index=values.index, name=values.name)
+
+    return parsed, pd.Series(present, index=values.index)
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Convert a column of scraped dates such as "Dec. 31, 2023", "Sept. 30, 2023",
+    "12/31/2023" or "2023-12-31" into datetimes. The format is detected once per
+    column and the whole column is converted by pd.to_datetime with it, the
+    dates not matching it are then tried with the other formats
+
+    Dates without a year, e.g. "March 31", get the year of their most recent
+    occurrence up to today
+
+    Args:
+    ----------------
+    values (pd.Series): The scraped dates
+
+    Returns:
+    ----------------
+    pd.Series: The dates as datetime64, NaT for missing markers and values that
+    are not dates
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+
+    return _parse_dates(values)[0]
+
+
+def dates_dataframe(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the text columns of a scraped table whose values are all dates,
+    apart from missing markers, into datetime columns. Column names that are
+    all dates, e.g. the periods of a financial statement, become a DatetimeIndex
+
+    Args:
+    ----------------
+    data (pd.DataFrame): The scraped table
+
+    Returns:
+    ----------------
+    pd.DataFrame: A copy of the table with the date columns as datetimes
+    """
+    data = data.copy()
+    for position in range(data.shape[1]):
+        column = data.iloc[:, position]
+        if column.dtype != object and not pd.api.types.is_string_dtype(column):
+            continue
+
+        parsed, present = _parse_dates(column)
+        if present.any() and parsed[present.to_numpy()].notna().all():
+            data.isetitem(position, parsed)
+
+    if data.columns.dtype == object or pd.api.types.is_string_dtype(data.columns):
+        parsed, present = _parse_dates(pd.Series(data.columns))
+        if len(parsed) and present.all() and parsed.notna().all():
+            data.columns = pd.DatetimeIndex(parsed, name=data.columns.name)
+
+    return data
+
+
+def typed_table(accessor: Callable) -> Callable:
+    """
+    Decorator for the scraped accessors, converting the numeric and date columns
+    of the returned table, or of each table of a returned dict, when the numeric
+    and dates options of the ticker are set
+    """
+
+    def convert(self, data: object) -> object:
+        if isinstance(data, dict):
+            return {key: convert(self, value) for key, value in data.items()}
+        if not isinstance(data, pd.DataFrame):
+            return data
+
+        if self.numeric:
+            data = numeric_dataframe(data)
+        if self.dates:
+            data = dates_dataframe(data)
+        return data
+
+    @wraps(accessor)
+    def wrapper(self, *args, **kwargs):
+        return convert(self, accessor(self, *args, **kwargs))
+
+    return wrapper
+
+
+def write_output(
+    data: Union[pd.DataFrame, pd.Series],
+    out: str,
+    symbol: str,
+    dataset: str,
+    output_format: str = "parquet",
+) -> str:
+    """
+    Write a dataset to ``<out>/<dataset>/<symbol>.<format>``. The file is
+    written under a temporary name first, so a crash never leaves a partial file.
+
+    Returns:
+    ----------------
+    str: The path of the written file
+    """
+    if isinstance(data, pd.Series):
+        data = data.to_frame()
+    if not isinstance(data, pd.DataFrame):
+        raise TypeError(f"{dataset} returned {type(data).__name__}, not a DataFrame")
+
+    # columnar formats need string column names
+    data = data.copy()
+    data.columns = [str(column) for column in data.columns]
+
+    directory = os.path.join(out, dataset)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{symbol}.{output_format}")
+    temporary_path = f"{path}.tmp"
+
+    if output_format == "parquet":
+        data.to_parquet(temporary_path)
+    else:
+        data.to_csv(temporary_path)
+    os.replace(temporary_path, path)
+
+    return path
+
+
 def check_security_type(security_type: str, valid_types: Union[str, list]) -> None:
     """
     Check if the security type is valid
@@ -10,11 +10,23 @@ import plotly.express as px
 from bs4 import BeautifulSoup
 
 from stockdex.config import MACROTRENDS_BASE_URL, VALID_SECURITY_TYPES
-from stockdex.exceptions import FieldNotExists
-from stockdex.lib import check_security_type, plot_dataframe
+from stockdex.exceptions import FieldNotExists, NoDataError
+from stockdex.lib import (
+    check_security_type,
+    loads_json,
+    plot_dataframe,
+    table_to_dataframe,
+    typed_table,
+)
 from stockdex.selenium_interface import selenium_interface
 from stockdex.ticker_base import TickerBase
 
+# the rows of a table, assigned to originalData in a script of the page
+ORIGINAL_DATA_PATTERN = re.compile(r"originalData = (\[.*\]);")
+
+# the name of a row inside the link around it, e.g. <a href='...'>Revenue</a>
+FIELD_NAME_PATTERN = re.compile(">(.*)<")
+
 
 class MacrotrendsInterface(TickerBase):
     """
@@ -57,57 +69,70 @@ class MacrotrendsInterface(TickerBase):
         Returns:
         ----------
         pd.DataFrame
-            The table as a pandas DataFrame.
+            The table as a pandas DataFrame indexed by field name with one float
+            column per period, empty cells are NaN.
         """
         table = self.find_parent_by_text(soup=soup, tag="div", text=text_to_look_for)
 
-        data = []
         # get var originalData from the table
+        match = None
         for script in table.find_all("script"):
-            if "originalData" in script.get_text():
-                original_data = script.get_text()
-                break
-
-        # get the data from the script
-        for line in original_data.split("\n"):
-            if "originalData" in line:
-                data = line.split(" = ")[1]
+            match = ORIGINAL_DATA_PATTERN.search(script.get_text())
+            if match:
                 break
 
-        # convert the data to a pandas DataFrame
-        data = data.replace(";", "")
-        data = data.replace("null", "None")
-        data = eval(data)
-        data = pd.DataFrame(data)
+        if match is None:
+            raise NoDataError(
+                f"There is no {text_to_look_for} data for the ticker {self.ticker}"
+            )
+
+        rows = loads_json(match.group(1))
+
+        field_names = []
+        for row in rows:
+            name = FIELD_NAME_PATTERN.search(row["field_name"])
+            field_names.append(name.group(1) if name else row["field_name"])
+
+        # every other key of a row is the end date of a period
+        dates = [key for key in rows[0] if key not in ("field_name", "popup_icon")]
+
+        # build the table a column at a time, each column converted to floats at
+        # once, cells that are not numbers (empty, missing or placeholders) are NaN
+        columns = {}
+        for date in dates:
+            values = pd.Series([row.get(date) for row in rows], dtype=object)
+            numbers = pd.to_numeric(values, errors="coerce")
+
+            # only the cells that failed are checked for thousands separators
+            failed = numbers.isna() & values.notna()
+            if failed.any():
+                numbers[failed] = pd.to_numeric(
+                    values[failed].astype(str).str.replace(",", ""), errors="coerce"
+                )
+            columns[date] = numbers.to_numpy(dtype="float64")
 
-        return data
+        return pd.DataFrame(columns, index=pd.Index(field_names, name="field_name"))
 
     @property
+    @typed_table
     def macrotrends_income_statement(self, time_freq=None) -> pd.DataFrame:
         """
         Retrieve the income statement for the given ticker.
         """
         check_security_type(self.security_type, valid_types=["stock"])
-        url = f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/income-statement"
+        url = self.dataset_url("macrotrends_income_statement")
         if time_freq=='Q':
             url = url+"?freq=Q"
         
-        response = self.get_response(url)
-
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url)
 
         data = self._find_table_in_url("Revenue", soup)
 
-        data["field_name"] = data["field_name"].apply(
-            lambda x: re.search(">(.*)<", x).group(1)
-        )
-        data = data.set_index("field_name")
-        data.drop(columns=["popup_icon"], inplace=True)
-
         return data
 
     @property
+    @typed_table
     def macrotrends_balance_sheet(self, time_freq=None) -> pd.DataFrame:
         """
         Retrieve the balance sheet for the given ticker.
@@ -120,19 +145,16 @@ class MacrotrendsInterface(TickerBase):
         if not hasattr(self, "selenium_interface"):
             self.selenium_interface = selenium_interface()
 
-        soup = self.selenium_interface.get_html_content(url)
+        soup = self.selenium_interface.get_html_content(
+            url, deadline=self.deadline, parser=self.html_parser
+        )
 
         data = self._find_table_in_url("Cash On Hand", soup)
 
-        data["field_name"] = data["field_name"].apply(
-            lambda x: re.search(">(.*)<", x).group(1)
-        )
-        data = data.set_index("field_name")
-        data.drop(columns=["popup_icon"], inplace=True)
-
         return data
 
     @property
+    @typed_table
     def macrotrends_cash_flow(self, time_freq=None) -> pd.DataFrame:
         """
         Retrieve the cash flow statement for the given ticker.
@@ -145,19 +167,16 @@ class MacrotrendsInterface(TickerBase):
         if not hasattr(self, "selenium_interface"):
             self.selenium_interface = selenium_interface()
 
-        soup = self.selenium_interface.get_html_content(url)
+        soup = self.selenium_interface.get_html_content(
+            url, deadline=self.deadline, parser=self.html_parser
+        )
 
         data = self._find_table_in_url("Net Income/Loss", soup)
 
-        data["field_name"] = data["field_name"].apply(
-            lambda x: re.search(">(.*)<", x).group(1)
-        )
-        data = data.set_index("field_name")
-        data.drop(columns=["popup_icon"], inplace=True)
-
         return data
 
     @property
+    @typed_table
     def macrotrends_key_financial_ratios(self, time_freq=None) -> pd.DataFrame:
         """
         Retrieve the key financial ratios for the given ticker.
@@ -170,93 +189,79 @@ class MacrotrendsInterface(TickerBase):
         if not hasattr(self, "selenium_interface"):
             self.selenium_interface = selenium_interface()
 
-        soup = self.selenium_interface.get_html_content(url)
+        soup = self.selenium_interface.get_html_content(
+            url, deadline=self.deadline, parser=self.html_parser
+        )
 
         data = self._find_table_in_url("Current Ratio", soup)
 
-        data["field_name"] = data["field_name"].apply(
-            lambda x: re.search(">(.*)<", x).group(1)
-        )
-        data = data.set_index("field_name")
-        data.drop(columns=["popup_icon"], inplace=True)
-
         return data
 
     def _find_margins_table(self, url: str, text_to_look_for: str):
-        response = self.get_response(url)
+        table = self.find_table(url, text_to_look_for)
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        data = []
-        headers = []
-
-        table = self.find_parent_by_text(soup=soup, tag="table", text=text_to_look_for)
-
-        headers = [
-            row.text
-            for row in table.find_all("thead")[1].find_all("tr")[0].find_all("th")
-        ]
-        data = [
-            [cell.text for cell in row.find_all("td")]
-            for row in table.find_all("tr")[1:]
-        ]
-        data = pd.DataFrame(data, columns=headers)
+        # the first thead holds the title of the table, the second the column names
+        data = table_to_dataframe(table, body=None, header_position=1)
 
         return data
 
     @property
+    @typed_table
     def macrotrends_operating_margin(self, time_freq=None) -> pd.DataFrame:
         """
         Retrieve the operating margin for the given ticker.
         """
         check_security_type(self.security_type, valid_types=["stock"])
-        url = f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/operating-margin"
+        url = self.dataset_url("macrotrends_operating_margin")
         if time_freq=='Q':
             url = url+"?freq=Q"
         return self._find_margins_table(url, "TTM Operating Income")
 
     @property
+    @typed_table
     def macrotrends_gross_margin(self, time_freq=None) -> pd.DataFrame:
         """
         Retrieve the gross margin for the given ticker.
         """
         check_security_type(self.security_type, valid_types=["stock"])
-        url = f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/gross-margin"
+        url = self.dataset_url("macrotrends_gross_margin")
 
         return self._find_margins_table(url, "Gross Margin")
 
     @property
+    @typed_table
     def macrotrends_ebitda_margin(self, time_freq=None) -> pd.DataFrame:
         """
         Retrieve the EBITDA margin for the given ticker.
         """
         check_security_type(self.security_type, valid_types=["stock"])
-        url = f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/ebitda-margin"
+        url = self.dataset_url("macrotrends_ebitda_margin")
         if time_freq=='Q':
             url = url+"?freq=Q"
 
         return self._find_margins_table(url, "TTM EBITDA")
 
     @property
+    @typed_table
     def macrotrends_pre_tax_margin(self, time_freq=None) -> pd.DataFrame:
         """
         Retrieve the pre-tax margin for the given ticker.
         """
         check_security_type(self.security_type, valid_types=["stock"])
-        url = f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/pre-tax-profit-margin"
+        url = self.dataset_url("macrotrends_pre_tax_margin")
         if time_freq=='Q':
             url = url+"?freq=Q"
 
         return self._find_margins_table(url, "TTM Pre-Tax Income")
 
     @property
+    @typed_table
     def macrotrends_net_margin(self, time_freq=None) -> pd.DataFrame:
         """
         Retrieve the net profit margin for the given ticker.
         """
         check_security_type(self.security_type, valid_types=["stock"])
-        url = f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/net-profit-margin"
+        url = self.dataset_url("macrotrends_net_margin")
         if time_freq=='Q':
             url = url+"?freq=Q"
 
@@ -331,7 +336,7 @@ class MacrotrendsInterface(TickerBase):
     def plot_macrotrends_cash_flow(
         self,
         fields_to_include: list = [
-            "Net Income\/Loss",  # noqa: W605
+            "Net Income/Loss",
             "Common Stock Dividends Paid",
             "Net Long-Term Debt",
         ],
@@ -401,11 +406,6 @@ class MacrotrendsInterface(TickerBase):
         # fill NaN values with 0
         df = df.fillna(0)
 
-        # convert all values to float and replace empty cells with 0
-        df = df.replace(r"^\s*$", "0", regex=True).applymap(
-            lambda x: float(x.replace(",", ""))
-        )
-
         # sort index in ascending order
         df = df.T.sort_index()
 
@@ -0,0 +1,114 @@
+"""
+Module to retrieve earnings data for many symbols at once from NASDAQ website
+The main Tickers class inherits from this class
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import pandas as pd
+from bs4 import SoupStrainer
+
+from stockdex.config import NASDAQ_BASE_URL, VALID_SECURITY_TYPES
+from stockdex.lib import check_security_type
+from stockdex.nasdaq_interface import EARNINGS_TABLES, parse_earnings_table
+from stockdex.selenium_interface import selenium_interface
+from stockdex.ticker_base import TickerBase
+
+
+class NASDAQBulk(TickerBase):
+    def __init__(
+        self,
+        tickers: Optional[List[str]] = None,
+        isins: Optional[List[str]] = None,
+        security_type: VALID_SECURITY_TYPES = "stock",
+    ) -> None:
+        self.tickers = list(tickers) if tickers else []
+        self.isins = list(isins) if isins else []
+        self.security_type = security_type
+
+    def nasdaq_bulk_earnings(
+        self, tables: Optional[List[str]] = None, max_workers: int = 4
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get the earnings tables of all tickers. The earnings page of each ticker
+        is rendered once and all tables are extracted from it, the pages of
+        different tickers are rendered concurrently.
+
+        Args:
+        ----------------
+        tables (List[str]): The tables to retrieve, any of
+        "quarterly_earnings_surprise", "yearly_earnings_forecast" and
+        "quarterly_earnings_forecast", default is all of them
+
+        max_workers (int): The number of pages rendered concurrently
+
+        Returns:
+        ----------------
+        Dict[str, pd.DataFrame]: One long-format frame per table with the columns
+        symbol, period (the first column of the table, e.g. the fiscal quarter end),
+        field and value. Tickers whose page failed are left out and logged
+        """
+        check_security_type(security_type=self.security_type, valid_types=["stock"])
+        tables = tables or list(EARNINGS_TABLES)
+        for table in tables:
+            if table not in EARNINGS_TABLES:
+                raise ValueError(
+                    f"{table} is not a NASDAQ earnings table, "
+                    f"choose from: {list(EARNINGS_TABLES)}"
+                )
+
+        # build selenium interface object if not already built
+        if not hasattr(self, "selenium_interface"):
+            self.selenium_interface = selenium_interface(use_custom_user_agent=True)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                ticker: executor.submit(self._nasdaq_earnings_page, ticker, tables)
+                for ticker in self.tickers
+            }
+
+        frames = {table: [] for table in tables}
+        for ticker, future in futures.items():
+            if future.exception() is not None:
+                self.logger.warning(
+                    f"Failed to retrieve NASDAQ earnings of {ticker}: " f"{future.exception()}"
+                )
+                continue
+
+            for table, data in future.result().items():
+                frames[table].append(self._long_earnings_frame(ticker, data))
+
+        return {
+            table: (
+                pd.concat(frames[table], ignore_index=True)
+                if frames[table]
+                else pd.DataFrame(columns=["symbol", "period", "field", "value"])
+            )
+            for table in tables
+        }
+
+    def _nasdaq_earnings_page(self, ticker: str, tables: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Render the earnings page of a ticker once and extract the tables from it
+        """
+        url = f"{NASDAQ_BASE_URL}/{ticker.lower()}/earnings"
+        soup = self.selenium_interface.get_html_content(
+            url,
+            deadline=self.deadline,
+            parser=self.html_parser,
+            parse_only=SoupStrainer("table"),
+        )
+
+        return {table: parse_earnings_table(soup, table) for table in tables}
+
+    def _long_earnings_frame(self, ticker: str, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Melt an earnings table into symbol, period, field and value columns
+        """
+        period = data.columns[0]
+        data = data.melt(id_vars=period, var_name="field", value_name="value")
+        data = data.rename(columns={period: "period"})
+        data.insert(0, "symbol", ticker)
+
+        return data
@@ -3,12 +3,51 @@ Interface for NASDAQ stock data
 """
 
 import pandas as pd
+from bs4 import BeautifulSoup, SoupStrainer
 
 from stockdex.config import NASDAQ_BASE_URL, VALID_SECURITY_TYPES
-from stockdex.lib import check_security_type, get_user_agent
+from stockdex.lib import (
+    check_security_type,
+    get_user_agent,
+    table_to_dataframe,
+    typed_table,
+)
 from stockdex.selenium_interface import selenium_interface
 from stockdex.ticker_base import TickerBase
 
+# (class prefix, position among the tables with that prefix) of the earnings tables
+EARNINGS_TABLES = {
+    "quarterly_earnings_surprise": ("earnings-surprise", 0),
+    "yearly_earnings_forecast": ("earnings-forecast", 0),
+    "quarterly_earnings_forecast": ("earnings-forecast", 1),
+}
+
+
+def parse_earnings_table(soup: BeautifulSoup, table_name: str) -> pd.DataFrame:
+    """
+    Parse one of the tables of the rendered earnings page
+
+    Args:
+    ----------------
+    soup (BeautifulSoup): The rendered earnings page
+
+    table_name (str): The name of the table, a key of ``EARNINGS_TABLES``
+
+    Returns:
+    ----------------
+    pd.DataFrame: The table with the header cells as columns
+    """
+    prefix, position = EARNINGS_TABLES[table_name]
+    earnings_table = soup.find_all("table", {"class": f"{prefix}__table"})[position]
+
+    # the first cell of a row, e.g. the fiscal quarter end, is a th
+    return table_to_dataframe(
+        earnings_table,
+        header=f"tr.{prefix}__header",
+        body=f"tbody.{prefix}__table-body",
+        cells=("th", "td"),
+    )
+
 
 class NASDAQInterface(TickerBase):
     def __init__(
@@ -26,6 +65,7 @@ class NASDAQInterface(TickerBase):
         }
 
     @property
+    @typed_table
     def quarterly_earnings_surprise(self) -> pd.DataFrame:
         """
         Get quarterly earnings for the stock
@@ -48,27 +88,17 @@ class NASDAQInterface(TickerBase):
         if not hasattr(self, "selenium_interface"):
             self.selenium_interface = selenium_interface(use_custom_user_agent=True)
 
-        soup = self.selenium_interface.get_html_content(url)
-
-        earnings_table = soup.find("table", {"class": "earnings-surprise__table"})
-        columns = earnings_table.find(
-            "tr", {"class": "earnings-surprise__header"}
-        ).find_all("th")
-        columns = [column.text for column in columns]
-
-        data = []
-        table_body = earnings_table.find(
-            "tbody", {"class": "earnings-surprise__table-body"}
+        soup = self.selenium_interface.get_html_content(
+            url,
+            deadline=self.deadline,
+            parser=self.html_parser,
+            parse_only=SoupStrainer("table"),
         )
-        for row in table_body.find_all("tr"):
-            row_data_th = [cell.text for cell in row.find_all("th")]
-            row_data_td = [cell.text for cell in row.find_all("td")]
-            row_data = row_data_th + row_data_td
-            data.append(row_data)
 
-        return pd.DataFrame(data, columns=columns)
+        return parse_earnings_table(soup, "quarterly_earnings_surprise")
 
     @property
+    @typed_table
     def yearly_earnings_forecast(self) -> pd.DataFrame:
         """
         Get yearly earnings for the stock
@@ -93,38 +123,17 @@ class NASDAQInterface(TickerBase):
         if not hasattr(self, "selenium_interface"):
             self.selenium_interface = selenium_interface(use_custom_user_agent=True)
 
-        soup = self.selenium_interface.get_html_content(url)
-
-        # with open("earnings.html", "w") as f:
-        #     f.write(str(soup.prettify()))
-
-        # parent_div = self.find_parent_by_text(
-        #     soup=soup, tag="h2", text="Yearly Earnings Forecast"
-        # ).parent.parent
-
-        # table = parent_div.find("div", {"part": "table-row"})
-
-        # earnings_table = soup.find("div", {"class": "jupiter22-earnings-forecast"})
-        earnings_table = soup.find("table", {"class": "earnings-forecast__table"})
-
-        columns = earnings_table.find(
-            "tr", {"class": "earnings-forecast__header"}
-        ).find_all("th")
-        columns = [column.text for column in columns]
-
-        data = []
-        table_body = earnings_table.find(
-            "tbody", {"class": "earnings-forecast__table-body"}
+        soup = self.selenium_interface.get_html_content(
+            url,
+            deadline=self.deadline,
+            parser=self.html_parser,
+            parse_only=SoupStrainer("table"),
         )
-        for row in table_body.find_all("tr"):
-            row_data_th = [cell.text for cell in row.find_all("th")]
-            row_data_td = [cell.text for cell in row.find_all("td")]
-            row_data = row_data_th + row_data_td
-            data.append(row_data)
 
-        return pd.DataFrame(data, columns=columns)
+        return parse_earnings_table(soup, "yearly_earnings_forecast")
 
     @property
+    @typed_table
     def quarterly_earnings_forecast(self) -> pd.DataFrame:
         """
         Get quarterly earnings forecast for the stock
@@ -149,29 +158,17 @@ class NASDAQInterface(TickerBase):
         if not hasattr(self, "selenium_interface"):
             self.selenium_interface = selenium_interface(use_custom_user_agent=True)
 
-        soup = self.selenium_interface.get_html_content(url)
-        earnings_table = soup.find_all("table", {"class": "earnings-forecast__table"})[
-            1
-        ]
-
-        columns = earnings_table.find(
-            "tr", {"class": "earnings-forecast__header"}
-        ).find_all("th")
-        columns = [column.text for column in columns]
-
-        data = []
-        table_body = earnings_table.find(
-            "tbody", {"class": "earnings-forecast__table-body"}
+        soup = self.selenium_interface.get_html_content(
+            url,
+            deadline=self.deadline,
+            parser=self.html_parser,
+            parse_only=SoupStrainer("table"),
         )
-        for row in table_body.find_all("tr"):
-            row_data_th = [cell.text for cell in row.find_all("th")]
-            row_data_td = [cell.text for cell in row.find_all("td")]
-            row_data = row_data_th + row_data_td
-            data.append(row_data)
 
-        return pd.DataFrame(data, columns=columns)
+        return parse_earnings_table(soup, "quarterly_earnings_forecast")
 
     @property
+    @typed_table
     def price_to_earnings_ratio(self) -> pd.DataFrame:
         """
         Get the price to earnings ratio for the stock
@@ -188,18 +185,22 @@ class NASDAQInterface(TickerBase):
         if not hasattr(self, "selenium_interface"):
             self.selenium_interface = selenium_interface(use_custom_user_agent=True)
 
-        soup = self.selenium_interface.get_html_content(url)
+        soup = self.selenium_interface.get_html_content(
+            url,
+            deadline=self.deadline,
+            parser=self.html_parser,
+            parse_only=SoupStrainer("table"),
+        )
 
         table = soup.find("tbody", {"class": "price-earnings-peg-ratios__table-body"})
-        index, value = [], []
+        data = table_to_dataframe(table, header=None, body=None, cells=("th", "td"))
 
-        for row in table.find_all("tr"):
-            index.append(row.find("th").text)
-            value.append(row.find("td").text)
-
-        return pd.DataFrame(value, index=index, columns=["Price to Earnings Ratio"])
+        return pd.DataFrame(
+            data[1].values, index=data[0].values, columns=["Price to Earnings Ratio"]
+        )
 
     @property
+    @typed_table
     def forecast_peg_rate(self) -> pd.DataFrame:
         """
         Get the forecast price to earning growth rate for the stock
@@ -217,17 +218,20 @@ class NASDAQInterface(TickerBase):
         if not hasattr(self, "selenium_interface"):
             self.selenium_interface = selenium_interface(use_custom_user_agent=True)
 
-        soup = self.selenium_interface.get_html_content(url)
+        soup = self.selenium_interface.get_html_content(
+            url,
+            deadline=self.deadline,
+            parser=self.html_parser,
+            parse_only=SoupStrainer("table"),
+        )
 
         table = soup.find_all(
             "tbody", {"class": "price-earnings-peg-ratios__table-body"}
         )[1]
-        index, value = [], []
-
-        for row in table.find_all("tr"):
-            index.append(row.find("th").text)
-            value.append(row.find("td").text)
+        data = table_to_dataframe(table, header=None, body=None, cells=("th", "td"))
 
         return pd.DataFrame(
-            value, index=index, columns=["Forecast Price to Earning Growth Rate"]
+            data[1].values,
+            index=data[0].values,
+            columns=["Forecast Price to Earning Growth Rate"],
         )
@@ -16,21 +16,16 @@ class SankeyCharts(TickerBase):
 
     def _build_main_df(self, ticker: str, frequency: str = "annual") -> pd.DataFrame:
         self.ticker = ticker
-        yahoo_cash_flow = self.yahoo_api_cash_flow(format="raw", frequency=frequency)
-        yahoo_balance_sheet = self.yahoo_api_balance_sheet(
-            format="raw", frequency=frequency
+        fundamentals = self.yahoo_api_fundamentals(
+            frequencies=[frequency], format="raw"
         )
-        yahoo_income_statement = self.yahoo_api_income_statement(
-            format="raw", frequency=frequency
-        )
-        yahoo_financials = self.yahoo_api_financials(format="raw", frequency=frequency)
         # concatenate all the dataframes
         self.data = pd.concat(
             [
-                yahoo_cash_flow,
-                yahoo_balance_sheet,
-                yahoo_income_statement,
-                yahoo_financials,
+                fundamentals["cash_flow"][frequency],
+                fundamentals["balance_sheet"][frequency],
+                fundamentals["income_statement"][frequency],
+                fundamentals["financials"][frequency],
             ],
             axis=1,
         )
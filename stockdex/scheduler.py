@@ -0,0 +1,229 @@
+"""
+Module for scheduling HTTP requests by priority with per-host concurrency caps
+"""
+
+import itertools
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Literal, Optional
+from urllib.parse import urlparse
+
+import pandas as pd
+
+from stockdex.deadline import Deadline
+from stockdex.exceptions import DeadlineExceeded
+
+VALID_PRIORITIES = Literal["interactive", "bulk"]
+
+# lower values are served first
+PRIORITY_ORDER = {"interactive": 0, "bulk": 1}
+
+
+class RequestScheduler:
+    """
+    Central scheduler under the request layer. Every request waits in a queue
+    until its host has a free slot and the politeness delay since the previous
+    request to that host has passed. Interactive requests are always served
+    ahead of bulk requests waiting for the same host.
+
+    To route all requests through a scheduler, set it on the base class:
+
+    ``TickerBase.scheduler = RequestScheduler(max_concurrency={"www.digrin.com": 2})``
+    """
+
+    def __init__(
+        self,
+        default_max_concurrency: int = 4,
+        default_politeness_delay: float = 0.0,
+        max_concurrency: Optional[Dict[str, int]] = None,
+        politeness_delay: Optional[Dict[str, float]] = None,
+        rate_limits: Optional[Dict[str, object]] = None,
+    ) -> None:
+        """
+        Args:
+        ----------------
+        default_max_concurrency (int): The maximum number of concurrent requests
+        to a host that is not listed in max_concurrency
+
+        default_politeness_delay (float): The minimum number of seconds between the
+        start of two requests to a host that is not listed in politeness_delay
+
+        max_concurrency (dict): The maximum number of concurrent requests per host,
+        e.g. {"finance.yahoo.com": 2}
+
+        politeness_delay (dict): The minimum number of seconds between the start of
+        two requests per host, e.g. {"www.digrin.com": 1.5}
+
+        rate_limits (dict): Token buckets per host, shared with other processes
+        or nodes, e.g. {"www.digrin.com": SQLiteTokenBucket("jobs.db", "digrin", 2)}
+        see stockdex.worker. A request takes a token once it has a slot
+        """
+        self.default_max_concurrency = default_max_concurrency
+        self.default_politeness_delay = default_politeness_delay
+        self.max_concurrency = max_concurrency or {}
+        self.politeness_delay = politeness_delay or {}
+        self.rate_limits = rate_limits or {}
+
+        self._condition = threading.Condition()
+        self._counter = itertools.count()
+        self._waiting = []
+        self._active = defaultdict(int)
+        self._last_start = defaultdict(lambda: float("-inf"))
+        self._served = defaultdict(int)
+        self._total_wait = defaultdict(float)
+        self._max_wait = defaultdict(float)
+
+    @contextmanager
+    def slot(
+        self,
+        url: str,
+        priority: VALID_PRIORITIES = "interactive",
+        deadline: Deadline = None,
+    ):
+        """
+        Context manager that holds a slot of the URL's host while the request runs
+
+        Args:
+        ----------------
+        url (str): The URL to request
+
+        priority (str): The priority class of the request, "interactive" or "bulk"
+
+        deadline (Deadline): The deadline after which the request leaves the queue
+        """
+        host = self.acquire(url, priority, deadline)
+        try:
+            yield
+        finally:
+            self.release(host)
+
+    def acquire(
+        self,
+        url: str,
+        priority: VALID_PRIORITIES = "interactive",
+        deadline: Deadline = None,
+    ) -> str:
+        """
+        Block until the request may start and take a slot of its host
+
+        Args:
+        ----------------
+        url (str): The URL to request
+
+        priority (str): The priority class of the request, "interactive" or "bulk"
+
+        deadline (Deadline): The deadline after which the request leaves the queue
+        and DeadlineExceeded is raised
+
+        Returns:
+        ----------------
+        str: The host whose slot was taken, to be passed to release
+        """
+        host = urlparse(url).netloc
+        limit = self.max_concurrency.get(host, self.default_max_concurrency)
+        delay = self.politeness_delay.get(host, self.default_politeness_delay)
+
+        entry = (PRIORITY_ORDER[priority], next(self._counter), host)
+        enqueued = time.monotonic()
+
+        with self._condition:
+            self._waiting.append(entry)
+            while True:
+                if deadline is not None and deadline.expired:
+                    self._waiting.remove(entry)
+                    self._condition.notify_all()
+                    raise DeadlineExceeded(f"Deadline exceeded waiting for {host}")
+
+                timeout = None
+                if self._is_next(entry) and self._active[host] < limit:
+                    timeout = self._last_start[host] + delay - time.monotonic()
+                    if timeout <= 0:
+                        break
+
+                # wake up regularly to notice an expired or cancelled deadline
+                if deadline is not None:
+                    timeout = min(i for i in (timeout, deadline.remaining(), 0.1) if i is not None)
+                self._condition.wait(timeout)
+
+            self._waiting.remove(entry)
+            self._active[host] += 1
+            self._last_start[host] = time.monotonic()
+
+            waited = self._last_start[host] - enqueued
+            self._served[(host, priority)] += 1
+            self._total_wait[(host, priority)] += waited
+            self._max_wait[(host, priority)] = max(self._max_wait[(host, priority)], waited)
+
+            self._condition.notify_all()
+
+        # coordinate with the other processes sharing the host's token bucket
+        if host in self.rate_limits:
+            try:
+                self.rate_limits[host].acquire(deadline)
+            except BaseException:
+                self.release(host)
+                raise
+
+        return host
+
+    def release(self, host: str) -> None:
+        """
+        Give back a slot of the host taken by acquire
+        """
+        with self._condition:
+            self._active[host] -= 1
+            self._condition.notify_all()
+
+    def _is_next(self, entry: tuple) -> bool:
+        """
+        Check if the entry is the first in line among the requests to its host
+        """
+        return entry == min(item for item in self._waiting if item[2] == entry[2])
+
+    def stats(self) -> pd.DataFrame:
+        """
+        Get the queue depth and wait times of the scheduler
+
+        Returns:
+        ----------------
+        pd.DataFrame: One row per host and priority with columns
+        queued (requests waiting now), active (requests of the host running now),
+        served, mean_wait and max_wait (seconds spent in the queue)
+        """
+        with self._condition:
+            priorities = {value: key for key, value in PRIORITY_ORDER.items()}
+            queued = defaultdict(int)
+            for order, _, host in self._waiting:
+                queued[(host, priorities[order])] += 1
+
+            rows = []
+            for host, priority in sorted(set(queued) | set(self._served)):
+                served = self._served[(host, priority)]
+                rows.append(
+                    {
+                        "host": host,
+                        "priority": priority,
+                        "queued": queued[(host, priority)],
+                        "active": self._active[host],
+                        "served": served,
+                        "mean_wait": (
+                            self._total_wait[(host, priority)] / served if served else 0.0
+                        ),
+                        "max_wait": self._max_wait[(host, priority)],
+                    }
+                )
+
+        return pd.DataFrame(
+            rows,
+            columns=[
+                "host",
+                "priority",
+                "queued",
+                "active",
+                "served",
+                "mean_wait",
+                "max_wait",
+            ],
+        ).set_index(["host", "priority"])
@@ -1,12 +1,16 @@
 import os
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from stockdex.config import HTML_PARSER, VALID_HTML_PARSERS
+from stockdex.deadline import Deadline
+from stockdex.exceptions import DeadlineExceeded
 from stockdex.lib import get_user_agent
 
 
@@ -26,7 +30,13 @@ class selenium_interface:
         if use_custom_user_agent:
             self.chrome_options.add_argument(f"user-agent={get_user_agent}")
 
-    def get_html_content(self, url: str) -> str:
+    def get_html_content(
+        self,
+        url: str,
+        deadline: Deadline = None,
+        parser: VALID_HTML_PARSERS = HTML_PARSER,
+        parse_only: SoupStrainer = None,
+    ) -> str:
         """
         Method to fetch the HTML content of a webpage using Selenium
 
@@ -34,21 +44,44 @@ class selenium_interface:
         ----------------
         url (str): URL of the webpage
 
+        deadline (Deadline): The deadline bounding the page load
+        if it expires, the render is aborted and DeadlineExceeded is raised
+
+        parser (str): The BeautifulSoup parser backend, "lxml", "html.parser"
+        or "html5lib", default is lxml when it is installed
+
+        parse_only (SoupStrainer): The region of the page the caller reads,
+        only the matching tags and their descendants are built
+
         Returns:
         ----------------
         str: HTML content of the webpage in prettified format
         """
+        if deadline is not None:
+            deadline.check()
+
         # Initialize WebDriver
         driver = webdriver.Chrome(options=self.chrome_options)
-        # Fetch the webpage
-        driver.get(url)
+        try:
+            if deadline is not None and deadline.remaining() is not None:
+                driver.set_page_load_timeout(deadline.remaining())
+
+            # Fetch the webpage
+            driver.get(url)
 
-        # Get the page source and close the driver
-        page_source = driver.page_source
-        driver.quit()
+            # Get the page source
+            page_source = driver.page_source
+        except TimeoutException as error:
+            # only a page load bounded by an expired deadline exceeded the deadline
+            if deadline is not None and deadline.expired:
+                raise DeadlineExceeded(f"Deadline exceeded rendering {url}") from error
+            raise
+        finally:
+            # close the driver, also when the render was aborted
+            driver.quit()
 
         # Use Beautiful Soup to parse the HTML content
-        return BeautifulSoup(page_source, "html.parser")
+        return BeautifulSoup(page_source, parser, parse_only=parse_only)
 
     def click_on_element(self, xpath: str, wait_time: int = 3):
         """
@@ -1,4 +1,10 @@
-from stockdex.config import VALID_SECURITY_TYPES
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Union
+
+import pandas as pd
+
+from stockdex.config import SCRAPED_DATASET_URLS, VALID_SECURITY_TYPES
 from stockdex.digrin_interface import DigrinInterface
 from stockdex.justetf_interface import JustETF
 from stockdex.macrotrends_interface import MacrotrendsInterface
@@ -38,3 +44,56 @@ class Ticker(
             raise Exception("Please provide either a ticker or an ISIN")
 
         super().__init__(ticker=ticker, isin=isin, security_type=security_type)
+
+    def fetch(
+        self, datasets: List[str], max_workers: int = 8
+    ) -> Dict[str, Union[pd.DataFrame, str]]:
+        """
+        Retrieve several scraped datasets at once. Each distinct page the
+        datasets need is fetched once, concurrently, and parsed once, e.g.
+        yahoo_web_description, yahoo_web_key_executives and
+        yahoo_web_corporate_governance all read the same profile page.
+
+        Args:
+        ----------------
+        datasets (List[str]): The names of the scraped datasets to retrieve
+        see ``SCRAPED_DATASET_URLS`` in config for the supported datasets
+
+        max_workers (int): The number of pages fetched concurrently
+
+        Returns:
+        ----------------
+        Dict[str, Union[pd.DataFrame, str]]: The datasets keyed by name
+        """
+        for dataset in datasets:
+            if dataset not in SCRAPED_DATASET_URLS:
+                raise ValueError(
+                    f"{dataset} is not a scraped dataset, "
+                    f"choose from: {list(SCRAPED_DATASET_URLS)}"
+                )
+
+        # number of datasets reading each distinct page
+        readers = Counter(self.dataset_url(dataset) for dataset in datasets)
+        urls = list(readers)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = dict(zip(urls, executor.map(self.get_response, urls)))
+
+        if not hasattr(self, "prefetched_responses"):
+            self.prefetched_responses = {}
+        self.prefetched_responses.update(responses)
+
+        # pages read by several datasets are parsed once as a whole when first
+        # needed, the others only in the region their dataset reads
+        self.shared_pages = {url for url, count in readers.items() if count > 1}
+
+        # tables kept from earlier calls are built again from the fetched pages
+        getattr(self, "yahoo_web_page_results", {}).clear()
+
+        try:
+            return {dataset: getattr(self, dataset) for dataset in datasets}
+        finally:
+            # later calls retrieve fresh pages again
+            self.shared_pages = set()
+            for url in urls:
+                self.release_page(url)
@@ -2,15 +2,27 @@
 Base class for ticker objects to inherit from
 """
 
+import threading
 import time
+from contextlib import contextmanager
 from logging import getLogger
-from typing import Union
+from typing import Tuple, Union
+from urllib.parse import quote
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
-from stockdex.config import RESPONSE_TIMEOUT
+from stockdex.config import (
+    HTML_PARSER,
+    RESPONSE_TIMEOUT,
+    SCRAPED_DATASET_URLS,
+    VALID_HTML_PARSERS,
+    YAHOO_COOKIE_URL,
+    YAHOO_CRUMB_URL,
+)
+from stockdex.deadline import Deadline
 from stockdex.lib import get_user_agent
+from stockdex.scheduler import RequestScheduler
 
 
 class TickerBase:
@@ -19,7 +31,35 @@ class TickerBase:
     }
     logger = getLogger(__name__)
 
-    def get_response(self, url: str) -> requests.Response:
+    # optional scheduler shared by all requests, see stockdex.scheduler
+    scheduler: RequestScheduler = None
+    request_priority = "interactive"
+
+    # optional deadline bounding requests and Selenium renders, see stockdex.deadline
+    deadline: Deadline = None
+
+    # BeautifulSoup parser backend, set it on TickerBase to change it for all
+    # tickers or on an instance to change it for that ticker only
+    html_parser: VALID_HTML_PARSERS = HTML_PARSER
+
+    # convert the numeric columns of scraped tables into floats, e.g. "1.23B" and
+    # "(1,234)", set it on TickerBase for all tickers or on an instance
+    numeric = False
+
+    # convert the date columns of scraped tables into datetimes, e.g. "Dec. 31, 2023"
+    dates = False
+
+    # cookie session and crumb shared by the Yahoo endpoints that require them
+    _yahoo_session: requests.Session = None
+    _yahoo_crumb: str = None
+    _yahoo_crumb_lock = threading.Lock()
+
+    def get_response(
+        self,
+        url: str,
+        deadline: Deadline = None,
+        session: requests.Session = None,
+    ) -> requests.Response:
         """
         Send an HTTP GET request to the website
 
@@ -28,6 +68,13 @@ class TickerBase:
         url: str
             The URL to send the HTTP GET request to
 
+        deadline: Deadline
+            The deadline bounding the request, timeouts and rate limit sleeps
+            default is the deadline of the ticker
+
+        session: requests.Session
+            The session to send the request with, default is a new session
+
 
         Returns:
         ----------
@@ -35,11 +82,15 @@ class TickerBase:
             The response from the website
         """
 
+        # serve responses that were fetched ahead of time, e.g. by batch jobs
+        if url in getattr(self, "prefetched_responses", {}):
+            return self.prefetched_responses[url]
+
+        deadline = deadline or self.deadline
+
         # Send an HTTP GET request to the website
-        session = requests.Session()
-        response = session.get(
-            url, headers=self.request_headers, timeout=RESPONSE_TIMEOUT
-        )
+        session = session or requests.Session()
+        response = self._send_request(session, url, deadline)
         # If the HTTP GET request can't be served
         if response.status_code != 200 and response.status_code != 429:
             raise Exception(
@@ -57,15 +108,227 @@ class TickerBase:
                 self.logger.warning(
                     f"Rate limit reached. Retrying after {retry_after} seconds"
                 )
-                time.sleep(retry_after)
-                response = session.get(
-                    url, headers=self.request_headers, timeout=RESPONSE_TIMEOUT
-                )
+                if deadline is None:
+                    time.sleep(retry_after)
+                else:
+                    deadline.sleep(retry_after)
+                response = self._send_request(session, url, deadline)
                 if response.status_code == 200:
                     break
 
         return response
 
+    def get_soup(
+        self,
+        url: str,
+        parser: VALID_HTML_PARSERS = None,
+        parse_only: SoupStrainer = None,
+    ) -> BeautifulSoup:
+        """
+        Get the parsed HTML document of a URL. The documents of prefetched
+        responses are parsed once and shared by all datasets read from them
+
+        Args:
+        ----------
+        url: str
+            The URL of the document
+
+        parser: str
+            The BeautifulSoup parser backend, "lxml", "html.parser" or "html5lib"
+            default is the parser of the ticker
+
+        parse_only: SoupStrainer
+            The region of the document the caller reads, only the matching
+            tags and their descendants are built. Ignored if the whole document
+            was already parsed
+
+        Returns:
+        ----------
+        BeautifulSoup
+            The parsed document
+        """
+        if url in getattr(self, "prefetched_soups", {}):
+            return self.prefetched_soups[url]
+
+        # pages shared by several datasets are parsed as a whole, once
+        if url in getattr(self, "shared_pages", set()):
+            parse_only = None
+
+        soup = BeautifulSoup(
+            self.get_response(url).content,
+            parser or self.html_parser,
+            parse_only=parse_only,
+        )
+
+        # only whole documents can be shared by datasets reading different regions
+        if parse_only is None and url in getattr(self, "prefetched_responses", {}):
+            if not hasattr(self, "prefetched_soups"):
+                self.prefetched_soups = {}
+            self.prefetched_soups[url] = soup
+
+        return soup
+
+    @contextmanager
+    def shared_page(self, url: str, whole: bool = True):
+        """
+        Context manager under which a page is fetched once and its response,
+        parsed document and embedded data are shared by all datasets read from it.
+        A page prefetched before, e.g. by Ticker.fetch, is reused as it is
+
+        Args:
+        ----------
+        url: str
+            The URL of the page
+
+        whole: bool
+            Parse the document as a whole once for all datasets, instead of
+            parsing the region each dataset reads
+        """
+        if not hasattr(self, "prefetched_responses"):
+            self.prefetched_responses = {}
+        fetched = url not in self.prefetched_responses
+        if fetched:
+            self.prefetched_responses[url] = self.get_response(url)
+
+        shared = whole and url not in getattr(self, "shared_pages", set())
+        if shared:
+            self.shared_pages = getattr(self, "shared_pages", set()) | {url}
+
+        try:
+            yield
+        finally:
+            if shared:
+                self.shared_pages = self.shared_pages - {url}
+            if fetched:
+                # later calls retrieve a fresh page again
+                self.release_page(url)
+
+    def release_page(self, url: str) -> None:
+        """
+        Drop the prefetched response of a page and everything parsed from it
+
+        Args:
+        ----------
+        url: str
+            The URL of the page
+        """
+        getattr(self, "prefetched_responses", {}).pop(url, None)
+        getattr(self, "prefetched_soups", {}).pop(url, None)
+        getattr(self, "prefetched_trees", {}).pop(url, None)
+        getattr(self, "prefetched_payloads", {}).pop(url, None)
+
+    def dataset_url(self, dataset: str) -> str:
+        """
+        URL of the page a scraped dataset of the ticker is read from
+
+        Args:
+        ----------
+        dataset: str
+            The name of the dataset, one of ``SCRAPED_DATASET_URLS`` in config
+        """
+        return SCRAPED_DATASET_URLS[dataset].format(ticker=self.ticker)
+
+    def get_crumb_response(self, url: str, deadline: Deadline = None) -> requests.Response:
+        """
+        Send an HTTP GET request to a Yahoo Finance endpoint that requires a
+        cookie and crumb, e.g. the quote and quoteSummary endpoints.
+        The cookie and crumb are retrieved once and shared by all tickers.
+
+        Args:
+        ----------
+        url: str
+            The URL to send the HTTP GET request to, without the crumb
+
+        deadline: Deadline
+            The deadline bounding the request, default is the deadline of the ticker
+
+        Returns:
+        ----------
+        requests.Response
+            The response from the website
+        """
+        session, crumb = self._get_yahoo_crumb(deadline)
+        separator = "&" if "?" in url else "?"
+
+        try:
+            return self.get_response(f"{url}{separator}crumb={quote(crumb)}", deadline, session)
+        except Exception:
+            # the crumb may have expired, retrieve a new one for the next request
+            with TickerBase._yahoo_crumb_lock:
+                if TickerBase._yahoo_crumb == crumb:
+                    TickerBase._yahoo_crumb = None
+            raise
+
+    def _get_yahoo_crumb(self, deadline: Deadline = None) -> Tuple[requests.Session, str]:
+        """
+        Get the session holding the Yahoo cookie and the crumb belonging to it
+        """
+        with TickerBase._yahoo_crumb_lock:
+            if TickerBase._yahoo_crumb is None:
+                session = requests.Session()
+                # the cookie is set although the page itself returns an error
+                self._send_request(session, YAHOO_COOKIE_URL, deadline)
+                crumb = self.get_response(YAHOO_CRUMB_URL, deadline, session).text
+
+                TickerBase._yahoo_session = session
+                TickerBase._yahoo_crumb = crumb
+
+            return TickerBase._yahoo_session, TickerBase._yahoo_crumb
+
+    def _send_request(
+        self, session: requests.Session, url: str, deadline: Deadline = None
+    ) -> requests.Response:
+        """
+        Send a single HTTP GET request, through the scheduler if one is set
+        """
+        if self.scheduler is None:
+            timeout = deadline.timeout(RESPONSE_TIMEOUT) if deadline else RESPONSE_TIMEOUT
+            return session.get(url, headers=self.request_headers, timeout=timeout)
+
+        with self.scheduler.slot(url, self.request_priority, deadline):
+            # the time spent in the queue counts against the deadline
+            timeout = deadline.timeout(RESPONSE_TIMEOUT) if deadline else RESPONSE_TIMEOUT
+            return session.get(url, headers=self.request_headers, timeout=timeout)
+
+    def find_table(self, url: str, text: str) -> object:
+        """
+        Find the first table of a document containing a text. With the lxml
+        parser, the document is parsed into an lxml tree and the table found by
+        XPath, which is much faster than building a BeautifulSoup document.
+        The result can be passed to stockdex.lib.table_to_dataframe
+
+        Args:
+        ----------
+        url: str
+            The URL of the document
+        text: str
+            The text the table contains, e.g. a column name
+
+        Returns:
+        ----------
+        Union[None, Tag, HtmlElement]: The table if it exists, None otherwise
+        """
+        if self.html_parser == "lxml" and url not in getattr(self, "prefetched_soups", {}):
+            tree = getattr(self, "prefetched_trees", {}).get(url)
+            if tree is None:
+                from lxml import html as lxml_html
+
+                tree = lxml_html.fromstring(self.get_response(url).content)
+
+                # the trees of prefetched responses are shared by all tables read from them
+                if url in getattr(self, "prefetched_responses", {}):
+                    if not hasattr(self, "prefetched_trees"):
+                        self.prefetched_trees = {}
+                    self.prefetched_trees[url] = tree
+
+            tables = tree.xpath("//table[contains(string(.), $text)]", text=text)
+
+            return tables[0] if tables else None
+
+        soup = self.get_soup(url, parse_only=SoupStrainer("table"))
+
+        return self.find_parent_by_text(soup, "table", text)
+
     def find_parent_by_text(
         self,
         soup: BeautifulSoup,
@@ -0,0 +1,36 @@
+from typing import List, Optional
+
+from stockdex.batch_interface import BatchInterface
+from stockdex.config import VALID_SECURITY_TYPES
+from stockdex.justetf_bulk_interface import JustETFBulk
+from stockdex.nasdaq_bulk_interface import NASDAQBulk
+from stockdex.yahoo_api_bulk_interface import YahooAPIBulk
+
+
+class Tickers(YahooAPIBulk, JustETFBulk, NASDAQBulk, BatchInterface):
+    """
+    Class for retrieving data for many tickers at once
+    """
+
+    # queued behind interactive lookups when a scheduler is set
+    request_priority = "bulk"
+
+    def __init__(
+        self,
+        tickers: Optional[List[str]] = None,
+        isins: Optional[List[str]] = None,
+        security_type: VALID_SECURITY_TYPES = "stock",
+    ) -> None:
+        """
+        Initialize the Tickers class
+
+        Args:
+        tickers (List[str]): The tickers of the stocks
+        isins (List[str]): The ISINs of the etfs
+        security_type (str): The security type of the tickers
+            default is "stock"
+        """
+        if not tickers and not isins:
+            raise ValueError("Please provide either a list of tickers or ISINs")
+
+        super().__init__(tickers=tickers, isins=isins, security_type=security_type)
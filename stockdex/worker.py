@@ -0,0 +1,667 @@
+"""
+Module to run dataset jobs on many worker processes or nodes.
+
+Jobs ``(symbol, dataset, kwargs)`` are pushed to a shared queue and leased by
+workers, which write the results to a shared sink. Queues and token buckets
+come in a SQLite flavour, for a single host or a shared file system and as a
+local stand-in for tests, and a Redis flavour taking a ``redis.Redis`` client.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import pandas as pd
+
+from stockdex.deadline import Deadline
+from stockdex.lib import write_output
+from stockdex.tickers import Tickers
+
+
+class Job(NamedTuple):
+    """
+    A leased job, attempts includes the current attempt. The worker and attempts
+    identify the lease, only its holder can complete or give back the job
+    """
+
+    id: Union[int, str]
+    symbol: str
+    dataset: str
+    kwargs: dict
+    attempts: int
+    worker: str = ""
+
+
+def _text(value: Union[bytes, str, None]) -> Union[str, None]:
+    """
+    Decode a Redis reply, which is bytes unless the client decodes responses
+    """
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class SQLiteJobQueue:
+    """
+    Job queue stored in a SQLite database. A job is leased by one worker at a
+    time, a lease that is not completed in time (e.g. the worker crashed) expires
+    and the job is retried, up to max_attempts times.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 3) -> None:
+        """
+        Args:
+        ----------------
+        path (str): The path of the database file, shared by all workers
+
+        max_attempts (int): The number of attempts before a job is marked failed
+        """
+        self.path = path
+        self.max_attempts = max_attempts
+
+        # autocommit mode, transactions are started explicitly
+        self.connection = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                symbol TEXT NOT NULL,
+                dataset TEXT NOT NULL,
+                kwargs TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_until REAL,
+                worker TEXT,
+                error TEXT
+            )
+            """
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, lease_until)"
+        )
+
+    def push(self, jobs: Iterable[Tuple[str, str, dict]]) -> int:
+        """
+        Add jobs to the queue
+
+        Args:
+        ----------------
+        jobs (Iterable[Tuple[str, str, dict]]): (symbol, dataset, kwargs) tuples
+
+        Returns:
+        ----------------
+        int: The number of jobs added
+        """
+        rows = [(symbol, dataset, json.dumps(kwargs or {})) for symbol, dataset, kwargs in jobs]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO jobs (symbol, dataset, kwargs) VALUES (?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def lease(self, worker: str, lease_seconds: float = 300.0) -> Union[Job, None]:
+        """
+        Take the next pending job, or a job whose lease expired
+
+        Args:
+        ----------------
+        worker (str): The name of the worker taking the job
+
+        lease_seconds (float): The time the worker has to complete the job
+
+        Returns:
+        ----------------
+        Union[Job, None]: The job, None if there is no job to lease
+        """
+        now = time.time()
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            # leases of crashed workers expire, jobs out of attempts fail
+            self.connection.execute(
+                """
+                UPDATE jobs SET status = 'failed', error = 'lease expired'
+                WHERE status = 'leased' AND lease_until < ? AND attempts >= ?
+                """,
+                (now, self.max_attempts),
+            )
+            row = self.connection.execute(
+                """
+                SELECT id, symbol, dataset, kwargs, attempts FROM jobs
+                WHERE status = 'pending' OR (status = 'leased' AND lease_until < ?)
+                ORDER BY id LIMIT 1
+                """,
+                (now,),
+            ).fetchone()
+            if row is not None:
+                self.connection.execute(
+                    """
+                    UPDATE jobs SET status = 'leased', attempts = attempts + 1,
+                    lease_until = ?, worker = ? WHERE id = ?
+                    """,
+                    (now + lease_seconds, worker, row[0]),
+                )
+            self.connection.execute("COMMIT")
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+
+        if row is None:
+            return None
+        return Job(row[0], row[1], row[2], json.loads(row[3]), row[4] + 1, worker)
+
+    def complete(self, job: Job) -> bool:
+        """
+        Mark a leased job done
+
+        Returns:
+        ----------------
+        bool: False if the lease expired and the job was leased again, the job
+        is then left to its new holder
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                """
+                UPDATE jobs SET status = 'done', error = NULL
+                WHERE id = ? AND status = 'leased' AND attempts = ? AND worker = ?
+                """,
+                (job.id, job.attempts, job.worker),
+            )
+        return cursor.rowcount > 0
+
+    def fail(self, job: Job, error: str) -> bool:
+        """
+        Give a leased job back for a retry, or mark it failed when it is out of
+        attempts
+
+        Returns:
+        ----------------
+        bool: False if the lease expired and the job was leased again, the job
+        is then left to its new holder
+        """
+        status = "failed" if job.attempts >= self.max_attempts else "pending"
+        with self.connection:
+            cursor = self.connection.execute(
+                """
+                UPDATE jobs SET status = ?, error = ?
+                WHERE id = ? AND status = 'leased' AND attempts = ? AND worker = ?
+                """,
+                (status, error, job.id, job.attempts, job.worker),
+            )
+        return cursor.rowcount > 0
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Get the number of jobs per status: pending, leased, done and failed
+        """
+        counts = dict.fromkeys(["pending", "leased", "done", "failed"], 0)
+        for status, count in self.connection.execute(
+            "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+        ):
+            counts[status] = count
+        return counts
+
+    def failures(self) -> pd.DataFrame:
+        """
+        Get the failed jobs with their last error
+        """
+        return pd.read_sql_query(
+            "SELECT symbol, dataset, kwargs, attempts, error FROM jobs "
+            "WHERE status = 'failed' ORDER BY id",
+            self.connection,
+        )
+
+
+class RedisJobQueue:
+    """
+    Job queue stored in Redis, for workers on many nodes. Behaves like
+    SQLiteJobQueue: leases expire and jobs are retried up to max_attempts times.
+    Every job is in exactly one of the pending list, the leased sorted set and
+    the done and failed sets, each transition between them is a single script
+    run atomically by the server.
+
+    ``RedisJobQueue(redis.Redis(host="queue-host"), name="nightly")``
+    """
+
+    # give expired leases back, then lease the next pending job
+    LEASE_SCRIPT = """
+    local pending, leased, failed = KEYS[1], KEYS[2], KEYS[3]
+    local now, prefix, max_attempts = ARGV[1], ARGV[4], tonumber(ARGV[5])
+    for _, id in ipairs(redis.call('ZRANGEBYSCORE', leased, 0, now)) do
+        redis.call('ZREM', leased, id)
+        if tonumber(redis.call('HGET', prefix .. id, 'attempts')) >= max_attempts then
+            redis.call('HSET', prefix .. id, 'status', 'failed', 'error', 'lease expired')
+            redis.call('SADD', failed, id)
+        else
+            redis.call('HSET', prefix .. id, 'status', 'pending')
+            redis.call('LPUSH', pending, id)
+        end
+    end
+
+    local id = redis.call('RPOP', pending)
+    if not id then
+        return false
+    end
+    local key = prefix .. id
+    local attempts = redis.call('HINCRBY', key, 'attempts', 1)
+    redis.call('ZADD', leased, ARGV[2], id)
+    redis.call('HSET', key, 'status', 'leased', 'worker', ARGV[3])
+    local job = redis.call('HMGET', key, 'symbol', 'dataset', 'kwargs')
+    return {id, job[1], job[2], job[3], attempts}
+    """
+
+    # only the worker holding the current lease of a job completes it
+    COMPLETE_SCRIPT = """
+    local leased, done = KEYS[1], KEYS[2]
+    local id, key = ARGV[1], ARGV[2]
+    local state = redis.call('HMGET', key, 'status', 'attempts', 'worker')
+    if state[1] ~= 'leased' or state[2] ~= ARGV[3] or state[3] ~= ARGV[4] then
+        return 0
+    end
+    redis.call('ZREM', leased, id)
+    redis.call('SADD', done, id)
+    redis.call('HSET', key, 'status', 'done', 'error', '')
+    return 1
+    """
+
+    # only the worker holding the current lease of a job gives it back
+    FAIL_SCRIPT = """
+    local pending, leased, failed = KEYS[1], KEYS[2], KEYS[3]
+    local id, key, attempts = ARGV[1], ARGV[2], ARGV[3]
+    local state = redis.call('HMGET', key, 'status', 'attempts', 'worker')
+    if state[1] ~= 'leased' or state[2] ~= attempts or state[3] ~= ARGV[6] then
+        return 0
+    end
+    redis.call('ZREM', leased, id)
+    if tonumber(attempts) >= tonumber(ARGV[4]) then
+        redis.call('HSET', key, 'status', 'failed', 'error', ARGV[5])
+        redis.call('SADD', failed, id)
+    else
+        redis.call('HSET', key, 'status', 'pending', 'error', ARGV[5])
+        redis.call('LPUSH', pending, id)
+    end
+    return 1
+    """
+
+    def __init__(self, client, name: str = "stockdex", max_attempts: int = 3) -> None:
+        """
+        Args:
+        ----------------
+        client (redis.Redis): The Redis client
+
+        name (str): The prefix of the keys of this queue
+
+        max_attempts (int): The number of attempts before a job is marked failed
+        """
+        self.client = client
+        self.name = name
+        self.max_attempts = max_attempts
+
+        self._lease = client.register_script(self.LEASE_SCRIPT)
+        self._complete = client.register_script(self.COMPLETE_SCRIPT)
+        self._fail = client.register_script(self.FAIL_SCRIPT)
+
+    def _key(self, *parts) -> str:
+        return ":".join([self.name, *[str(part) for part in parts]])
+
+    def push(self, jobs: Iterable[Tuple[str, str, dict]]) -> int:
+        """
+        Add jobs to the queue, see SQLiteJobQueue.push
+        """
+        count = 0
+        for symbol, dataset, kwargs in jobs:
+            job_id = self.client.incr(self._key("ids"))
+
+            # the job is only visible to workers once it is complete
+            with self.client.pipeline() as pipeline:
+                pipeline.hset(
+                    self._key("job", job_id),
+                    mapping={
+                        "symbol": symbol,
+                        "dataset": dataset,
+                        "kwargs": json.dumps(kwargs or {}),
+                        "status": "pending",
+                        "attempts": 0,
+                    },
+                )
+                pipeline.lpush(self._key("pending"), job_id)
+                pipeline.execute()
+            count += 1
+        return count
+
+    def lease(self, worker: str, lease_seconds: float = 300.0) -> Union[Job, None]:
+        """
+        Take the next pending job, or a job whose lease expired,
+        see SQLiteJobQueue.lease
+        """
+        now = time.time()
+        job = self._lease(
+            keys=[self._key("pending"), self._key("leased"), self._key("failed")],
+            args=[now, now + lease_seconds, worker, self._key("job", ""), self.max_attempts],
+        )
+        if job is None:
+            return None
+
+        job_id, symbol, dataset, kwargs, attempts = job
+        return Job(
+            _text(job_id),
+            _text(symbol),
+            _text(dataset),
+            json.loads(_text(kwargs)),
+            attempts,
+            worker,
+        )
+
+    def complete(self, job: Job) -> bool:
+        """
+        Mark a leased job done, see SQLiteJobQueue.complete
+        """
+        return bool(
+            self._complete(
+                keys=[self._key("leased"), self._key("done")],
+                args=[job.id, self._key("job", job.id), job.attempts, job.worker],
+            )
+        )
+
+    def fail(self, job: Job, error: str) -> bool:
+        """
+        Give a leased job back for a retry, or mark it failed when it is out of
+        attempts, see SQLiteJobQueue.fail
+        """
+        return bool(
+            self._fail(
+                keys=[self._key("pending"), self._key("leased"), self._key("failed")],
+                args=[
+                    job.id,
+                    self._key("job", job.id),
+                    job.attempts,
+                    self.max_attempts,
+                    error,
+                    job.worker,
+                ],
+            )
+        )
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Get the number of jobs per status: pending, leased, done and failed
+        """
+        return {
+            "pending": self.client.llen(self._key("pending")),
+            "leased": self.client.zcard(self._key("leased")),
+            "done": self.client.scard(self._key("done")),
+            "failed": self.client.scard(self._key("failed")),
+        }
+
+    def failures(self) -> pd.DataFrame:
+        """
+        Get the failed jobs with their last error
+        """
+        job_ids = sorted(self.client.smembers(self._key("failed")), key=int)
+        rows = []
+        for job_id in job_ids:
+            job = {
+                _text(field): _text(value)
+                for field, value in self.client.hgetall(self._key("job", _text(job_id))).items()
+            }
+            rows.append(
+                {
+                    "symbol": job["symbol"],
+                    "dataset": job["dataset"],
+                    "kwargs": job["kwargs"],
+                    "attempts": int(job["attempts"]),
+                    "error": job["error"],
+                }
+            )
+        return pd.DataFrame(rows, columns=["symbol", "dataset", "kwargs", "attempts", "error"])
+
+
+class TokenBucket(ABC):
+    """
+    Base class of the shared token buckets. Every acquire takes one token,
+    tokens refill at rate per second up to capacity.
+    """
+
+    def acquire(self, deadline: Deadline = None) -> None:
+        """
+        Block until a token is available and take it
+
+        Args:
+        ----------------
+        deadline (Deadline): The deadline after which DeadlineExceeded is raised
+        """
+        while True:
+            wait = self._take()
+            if wait <= 0:
+                return
+            if deadline is None:
+                time.sleep(wait)
+            else:
+                deadline.sleep(wait)
+
+    @abstractmethod
+    def _take(self) -> float:
+        """
+        Take a token if one is available
+
+        Returns:
+        ----------------
+        float: 0 if a token was taken, otherwise the seconds until one is available
+        """
+
+
+class SQLiteTokenBucket(TokenBucket):
+    """
+    Token bucket stored in a SQLite database, shared by all workers using the
+    same file
+    """
+
+    def __init__(self, path: str, name: str, rate: float, capacity: float = 1.0) -> None:
+        """
+        Args:
+        ----------------
+        path (str): The path of the database file, shared by all workers
+
+        name (str): The name of the bucket, e.g. the host it limits
+
+        rate (float): The number of tokens added per second
+
+        capacity (float): The maximum number of tokens, i.e. the allowed burst
+        """
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+
+        self.connection = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS token_buckets (
+                name TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated REAL NOT NULL
+            )
+            """
+        )
+
+    def _take(self) -> float:
+        now = time.time()
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.connection.execute(
+                "SELECT tokens, updated FROM token_buckets WHERE name = ?", (self.name,)
+            ).fetchone()
+            tokens, updated = row if row is not None else (self.capacity, now)
+            tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / self.rate
+
+            self.connection.execute(
+                "INSERT OR REPLACE INTO token_buckets VALUES (?, ?, ?)",
+                (self.name, tokens, now),
+            )
+            self.connection.execute("COMMIT")
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+
+        return wait
+
+
+class RedisTokenBucket(TokenBucket):
+    """
+    Token bucket stored in Redis, shared by workers on many nodes,
+    see SQLiteTokenBucket
+    """
+
+    # refill and take a token atomically on the server
+    SCRIPT = """
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+    local rate, capacity, now = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+    local tokens = tonumber(state[1]) or capacity
+    local updated = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + (now - updated) * rate)
+    local wait = 0
+    if tokens >= 1 then tokens = tokens - 1 else wait = (1 - tokens) / rate end
+    redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+    return tostring(wait)
+    """
+
+    def __init__(self, client, name: str, rate: float, capacity: float = 1.0) -> None:
+        """
+        Args:
+        ----------------
+        client (redis.Redis): The Redis client
+
+        name (str): The name of the bucket, e.g. the host it limits
+
+        rate (float): The number of tokens added per second
+
+        capacity (float): The maximum number of tokens, i.e. the allowed burst
+        """
+        self.client = client
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+
+    def _take(self) -> float:
+        wait = self.client.eval(
+            self.SCRIPT,
+            1,
+            f"stockdex:bucket:{self.name}",
+            self.rate,
+            self.capacity,
+            time.time(),
+        )
+        return float(_text(wait))
+
+
+class DirectoryResultSink:
+    """
+    Result sink writing one file per job to a directory shared by all workers,
+    laid out as ``<out>/<dataset>/<symbol>.<format>`` like ``stockdex fetch``
+    """
+
+    def __init__(self, out: str, output_format: str = "parquet") -> None:
+        self.out = out
+        self.output_format = output_format
+
+    def write(self, job: Job, result: Union[pd.DataFrame, pd.Series]) -> str:
+        """
+        Write the result of a job
+
+        Returns:
+        ----------------
+        str: The path of the written file
+        """
+        return write_output(result, self.out, job.symbol, job.dataset, self.output_format)
+
+
+def run_worker(
+    queue: Union[SQLiteJobQueue, RedisJobQueue],
+    sink: DirectoryResultSink,
+    worker: Optional[str] = None,
+    lease_seconds: float = 300.0,
+    idle_timeout: Optional[float] = None,
+    poll_interval: float = 1.0,
+    max_jobs: Optional[int] = None,
+    security_type: str = "stock",
+) -> Dict[str, int]:
+    """
+    Lease jobs from the queue, run them and write their results to the sink until
+    the queue stays empty for idle_timeout seconds. Each job runs under a deadline
+    of lease_seconds, so it never outlives its lease. To coordinate rate limits
+    across workers, set a RequestScheduler with shared token buckets on TickerBase.
+
+    Args:
+    ----------------
+    queue (Union[SQLiteJobQueue, RedisJobQueue]): The shared job queue
+
+    sink (DirectoryResultSink): The shared result sink, any object with a
+    write(job, result) method
+
+    worker (str): The name of the worker, default is <hostname>-<pid>
+
+    lease_seconds (float): The time a worker has to complete a job
+
+    idle_timeout (float): The seconds to wait for new jobs when the queue is empty
+    default is None, the worker then returns as soon as the queue is empty
+
+    poll_interval (float): The seconds between polls of an empty queue
+
+    max_jobs (int): The maximum number of jobs to run, default is no limit
+
+    security_type (str): The security type of the symbols
+
+    Returns:
+    ----------------
+    Dict[str, int]: The number of jobs this worker completed and failed
+    """
+    worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+    counts = {"done": 0, "failed": 0}
+    idle_since = time.monotonic()
+    while max_jobs is None or sum(counts.values()) < max_jobs:
+        job = queue.lease(worker, lease_seconds)
+        if job is None:
+            if idle_timeout is None or time.monotonic() - idle_since >= idle_timeout:
+                break
+            time.sleep(poll_interval)
+            continue
+
+        try:
+            tickers = Tickers(tickers=[job.symbol], security_type=security_type)
+            result = tickers._run_dataset(
+                job.symbol, job.dataset, job.kwargs, Deadline(lease_seconds)
+            )
+            sink.write(job, result)
+        except Exception as error:  # noqa: BLE001
+            queue.fail(job, f"{type(error).__name__}: {error}")
+            counts["failed"] += 1
+        else:
+            queue.complete(job)
+            counts["done"] += 1
+
+        idle_since = time.monotonic()
+
+    return counts
+
+
+def build_jobs(
+    symbols: List[str], datasets: List[Union[str, Tuple[str, dict]]]
+) -> List[Tuple[str, str, dict]]:
+    """
+    Build the (symbol, dataset, kwargs) jobs of all symbols and datasets
+
+    Args:
+    ----------------
+    symbols (List[str]): The symbols
+
+    datasets (list): The dataset names, or tuples of a method name and its
+    keyword arguments, as in Tickers.iter_datasets
+    """
+    datasets = [(dataset, {}) if isinstance(dataset, str) else dataset for dataset in datasets]
+    return [(symbol, dataset, kwargs) for symbol in symbols for dataset, kwargs in datasets]
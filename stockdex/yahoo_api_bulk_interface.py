@@ -0,0 +1,233 @@
+"""
+Module to retrieve data for many symbols at once from Yahoo Finance API
+The main Tickers class inherits from this class
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+from stockdex import config
+from stockdex.config import SPARK_PRICE_FIELDS, VALID_SECURITY_TYPES
+from stockdex.exceptions import FieldNotExists
+from stockdex.lib import loads_json
+from stockdex.ticker_base import TickerBase
+
+
+class YahooAPIBulk(TickerBase):
+    def __init__(
+        self,
+        tickers: Optional[List[str]] = None,
+        isins: Optional[List[str]] = None,
+        security_type: VALID_SECURITY_TYPES = "stock",
+    ) -> None:
+        self.tickers = list(tickers) if tickers else []
+        self.isins = list(isins) if isins else []
+        self.security_type = security_type
+
+    def yahoo_api_bulk_price(
+        self,
+        range: Literal[
+            "1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"
+        ] = "1d",
+        dataGranularity: Literal[
+            "1m",
+            "2m",
+            "5m",
+            "15m",
+            "30m",
+            "60m",
+            "90m",
+            "1h",
+            "1d",
+            "5d",
+            "1wk",
+            "1mo",
+            "3mo",
+        ] = "1m",
+        layout: Literal["long", "wide"] = "long",
+    ) -> pd.DataFrame:
+        """
+        Get the price data for all tickers using the multi-symbol spark endpoint.
+        Symbols are packed into as few requests as the endpoint allows
+        (``SPARK_MAX_SYMBOLS`` per request). The endpoint only returns the close
+        of each bar, use ``yahoo_api_price`` of each ticker for open, high, low
+        and volume.
+
+        Args:
+        ----------------
+        range (str): The range of the price data to retrieve
+        valid values are "1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"
+
+        dataGranularity (str): The granularity of the data to retrieve (interval)
+        valid values are "1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo""  # noqa: E501
+
+        layout (str): The layout of the returned panel
+        if "long" is used, there is one row per symbol and timestamp
+        if "wide" is used, the index is the timestamp and the columns are (symbol, field)
+
+        Returns:
+        ----------------
+        pd.DataFrame: The close prices of all tickers, see ``SPARK_PRICE_FIELDS``.
+        Closes the endpoint does not return for a bar are NaN
+        """
+        results = []
+        for symbols in self._chunk_tickers(config.SPARK_MAX_SYMBOLS):
+            url = f"{config.SPARK_BASE_URL}?symbols={','.join(symbols)}"
+            url += f"&range={range}&interval={dataGranularity}"
+
+            content = self.get_response(url).content
+            results.extend(loads_json(content)["spark"]["result"])
+
+        return self._build_price_panel(results, layout)
+
+    def yahoo_api_bulk_quote(
+        self, fields: Optional[List[str]] = None, max_workers: int = 4
+    ) -> pd.DataFrame:
+        """
+        Get a quote snapshot of all tickers using the multi-symbol quote endpoint,
+        with ``QUOTE_MAX_SYMBOLS`` symbols per request. It covers the fields of
+        ``yahoo_web_summary`` without loading the quote page of every symbol.
+
+        Args:
+        ----------------
+        fields (List[str]): The fields to retrieve, see ``QUOTE_FIELDS`` in config
+        default is all fields
+
+        max_workers (int): The number of requests sent concurrently
+
+        Returns:
+        ----------------
+        pd.DataFrame: One row per ticker indexed by symbol, one typed column per
+        field. Fields the endpoint does not return for a symbol are missing values
+        """
+        fields = fields or list(config.QUOTE_FIELDS)
+        for field in fields:
+            if field not in config.QUOTE_FIELDS:
+                raise FieldNotExists(available_fields=list(config.QUOTE_FIELDS), given_field=field)
+
+        urls = [
+            f"{config.QUOTE_BASE_URL}?symbols={','.join(symbols)}&fields={','.join(fields)}"
+            for symbols in self._chunk_tickers(config.QUOTE_MAX_SYMBOLS)
+        ]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = executor.map(self.get_crumb_response, urls)
+            results = [
+                item
+                for response in responses
+                for item in response.json()["quoteResponse"]["result"]
+            ]
+
+        return self._build_quote_frame(results, fields)
+
+    def _chunk_tickers(self, size: int) -> List[List[str]]:
+        """
+        Split the tickers into chunks of at most ``size`` symbols
+        """
+        chunks = []
+        for start in range(0, len(self.tickers), size):
+            stop = start + size
+            chunks.append(self.tickers[start:stop])
+        return chunks
+
+    def _build_price_panel(self, results: list, layout: str = "long") -> pd.DataFrame:
+        """
+        Decode spark results into one panel built from pre-sized arrays
+
+        Args:
+        ----------------
+        results: list
+            The ``spark.result`` items of one or more responses
+
+        layout: str
+            The layout of the returned panel, "long" or "wide"
+
+        Returns:
+        ----------------
+        pd.DataFrame: The price panel
+        """
+        charts = []
+        for item in results:
+            for chart in item.get("response") or []:
+                if chart.get("timestamp"):
+                    charts.append((item["symbol"], chart))
+
+        size = sum(len(chart["timestamp"]) for _, chart in charts)
+        symbol = np.empty(size, dtype=object)
+        timestamp = np.empty(size, dtype="int64")
+        fields = {field: np.full(size, np.nan) for field in SPARK_PRICE_FIELDS}
+
+        # fill each symbol's slice in place, None values become NaN
+        position = 0
+        for ticker, chart in charts:
+            end = position + len(chart["timestamp"])
+            quote = chart["indicators"]["quote"][0]
+
+            symbol[position:end] = ticker
+            timestamp[position:end] = chart["timestamp"]
+            for field, values in fields.items():
+                if quote.get(field) is not None:
+                    values[position:end] = np.array(quote[field], dtype="float64")
+
+            position = end
+
+        data = pd.DataFrame(
+            {
+                "symbol": symbol,
+                "timestamp": pd.to_datetime(timestamp, unit="s"),
+                **fields,
+            }
+        )
+
+        if layout == "wide":
+            data = (
+                data.pivot(index="timestamp", columns="symbol", values=SPARK_PRICE_FIELDS)
+                .swaplevel(axis=1)
+                .sort_index(axis=1, level=0, sort_remaining=False)
+            )
+
+        return data
+
+    def _build_quote_frame(self, results: list, fields: List[str]) -> pd.DataFrame:
+        """
+        Decode quote results into one row per ticker with the dtypes of
+        ``QUOTE_FIELDS``
+
+        Args:
+        ----------------
+        results: list
+            The ``quoteResponse.result`` items of one or more responses
+
+        fields: List[str]
+            The fields to include as columns
+
+        Returns:
+        ----------------
+        pd.DataFrame: The quote snapshot indexed by symbol
+        """
+        quotes = {item["symbol"].upper(): item for item in results}
+        rows = [quotes.get(ticker.upper(), {}) for ticker in self.tickers]
+
+        data = {}
+        for field in fields:
+            dtype = config.QUOTE_FIELDS[field]
+            values = [row.get(field) for row in rows]
+
+            if dtype == "string":
+                data[field] = pd.array(values, dtype="string")
+            elif dtype.startswith("datetime64"):
+                data[field] = pd.to_datetime(np.array(values, dtype="float64"), unit="s", utc=True)
+            else:
+                data[field] = pd.array(
+                    (
+                        np.array(values, dtype="float64").round()
+                        if dtype == "Int64"
+                        else np.array(values, dtype="float64")
+                    ),
+                    dtype=dtype,
+                )
+
+        return pd.DataFrame(data, index=pd.Index(self.tickers, name="symbol"))
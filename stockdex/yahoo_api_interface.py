@@ -3,16 +3,18 @@ Module to retrieve stock data from Yahoo Finance API
 The main Ticker class inherits from this class
 """
 
-from datetime import datetime
-from typing import Literal, Union
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Literal, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 
 from stockdex import config
 from stockdex.config import VALID_DATA_SOURCES, VALID_SECURITY_TYPES
 from stockdex.exceptions import FieldNotExists
-from stockdex.lib import plot_dataframe
+from stockdex.lib import loads_json, plot_dataframe
 from stockdex.ticker_base import TickerBase
 
 
@@ -52,6 +54,9 @@ class YahooAPI(TickerBase):
             "1mo",
             "3mo",
         ] = "1m",
+        period1: Optional[datetime] = None,
+        period2: Optional[datetime] = None,
+        max_workers: int = 4,
     ) -> pd.DataFrame:
         """
         Get the price data for the stock
@@ -64,39 +69,204 @@ class YahooAPI(TickerBase):
         dataGranularity (str): The granularity of the data to retrieve (interval)
         valid values are "1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo""  # noqa: E501
 
+        period1 (datetime): The start date of the data to retrieve
+        if given, range is ignored and the span between period1 and period2 is split
+        into the largest windows Yahoo serves for the granularity, see
+        ``INTRADAY_MAX_WINDOW_DAYS``. Yahoo only keeps a limited history of intraday
+        bars (e.g. 30 days for 1m), period1 is moved forward to the oldest bar kept,
+        see ``INTRADAY_MAX_HISTORY_DAYS``
+
+        period2 (datetime): The end date of the data to retrieve
+        default is the current date
+
+        max_workers (int): The number of windows fetched concurrently
+
         Returns:
         ----------------
         pd.DataFrame: The price data
         """
+        if period1 is not None:
+            return self._yahoo_api_price_windows(
+                period1,
+                period2 or datetime.now(timezone.utc),
+                dataGranularity,
+                max_workers,
+            )
 
         url = f"{config.BASE_URL}/chart/{self.ticker}?range={range}&interval={dataGranularity}"
         response = self.get_response(url)
 
-        meta = response.json()["chart"]["result"][0]["meta"]
-        currency = meta["currency"]
-        exchangeTimezoneName = meta["exchangeTimezoneName"]
-        timezone = meta["timezone"]
-        exchangeName = meta["exchangeName"]
-        instrumentType = meta["instrumentType"]
+        return self._price_dataframe(loads_json(response.content)["chart"]["result"][0])
 
-        timestamp = response.json()["chart"]["result"][0]["timestamp"]
-        timestamp = pd.to_datetime(timestamp, unit="s")
+    def yahoo_api_price_since(
+        self,
+        last_timestamp: datetime,
+        dataGranularity: Literal[
+            "1m",
+            "2m",
+            "5m",
+            "15m",
+            "30m",
+            "60m",
+            "90m",
+            "1h",
+            "1d",
+            "5d",
+            "1wk",
+            "1mo",
+            "3mo",
+        ] = "1m",
+        refresh_last_bar: bool = True,
+        max_workers: int = 4,
+    ) -> pd.DataFrame:
+        """
+        Get only the price data since the last bar already held
+
+        Args:
+        ----------------
+        last_timestamp (datetime): The timestamp of the last bar already held,
+        naive timestamps are treated as UTC like the timestamps returned by yahoo_api_price
+
+        dataGranularity (str): The granularity of the data to retrieve (interval)
+        valid values are "1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo""  # noqa: E501
+
+        refresh_last_bar (bool): If the bar at last_timestamp should be returned again.
+        The last held bar may have been partially formed when it was fetched, in that case
+        the first row of the delta replaces it: drop the held bar before appending, e.g.
+        ``pd.concat([prices[prices["timestamp"] < last_timestamp], delta])``.
+        If False, only bars strictly newer than last_timestamp are returned
+        default is True
 
-        indicators = response.json()["chart"]["result"][0]["indicators"]
-        volume = indicators["quote"][0]["volume"]
-        close = indicators["quote"][0]["close"]
-        open = indicators["quote"][0]["open"]
-        high = indicators["quote"][0]["high"]
-        low = indicators["quote"][0]["low"]
+        max_workers (int): The number of windows fetched concurrently
+
+        Returns:
+        ----------------
+        pd.DataFrame: The price data since last_timestamp, sorted by timestamp.
+        Empty if last_timestamp is not in the past. For intraday granularities only the
+        bars Yahoo still keeps are returned, see ``INTRADAY_MAX_HISTORY_DAYS``
+        """
+        last_timestamp = pd.Timestamp(last_timestamp)
+        if last_timestamp.tzinfo is not None:
+            last_timestamp = last_timestamp.tz_convert("UTC").tz_localize(None)
+
+        # the held bar is only requested again to refresh it
+        start = last_timestamp if refresh_last_bar else last_timestamp + pd.Timedelta(seconds=1)
+        data = self._yahoo_api_price_windows(
+            start, datetime.now(timezone.utc), dataGranularity, max_workers
+        )
+
+        return data[data["timestamp"] >= start].reset_index(drop=True)
+
+    def _yahoo_api_price_windows(
+        self,
+        period1: datetime,
+        period2: datetime,
+        dataGranularity: str,
+        max_workers: int = 4,
+    ) -> pd.DataFrame:
+        """
+        Fetch the price data between period1 and period2 in concurrent windows
+        and stitch them into one deduplicated frame sorted by timestamp
+
+        Args:
+        ----------------
+        period1: datetime
+            The start date of the data to retrieve
+
+        period2: datetime
+            The end date of the data to retrieve
+
+        dataGranularity: str
+            The granularity of the data to retrieve (interval)
+
+        max_workers: int
+            The number of windows fetched concurrently
+
+        Returns:
+        ----------------
+        pd.DataFrame: The price data, empty if period1 is not before period2
+        """
+        start = int(pd.Timestamp(period1).timestamp())
+        end = int(pd.Timestamp(period2).timestamp())
+
+        # Yahoo refuses intraday requests reaching back further than it keeps bars
+        if dataGranularity in config.INTRADAY_MAX_HISTORY_DAYS:
+            oldest = int(datetime.now(timezone.utc).timestamp()) - (
+                config.INTRADAY_MAX_HISTORY_DAYS[dataGranularity] * 86400
+            )
+            if start < oldest:
+                self.logger.warning(
+                    f"Yahoo only keeps {config.INTRADAY_MAX_HISTORY_DAYS[dataGranularity]} "
+                    f"days of {dataGranularity} bars, retrieving from "
+                    f"{pd.Timestamp(oldest, unit='s')} instead of {pd.Timestamp(start, unit='s')}"
+                )
+                start = oldest
+
+        if start >= end:
+            return self._price_dataframe({"meta": {}, "indicators": {"quote": [{}]}})
+
+        # non intraday granularities are served in a single request
+        step = config.INTRADAY_MAX_WINDOW_DAYS.get(dataGranularity, 0) * 86400
+        windows = [(start, end)]
+        if step:
+            windows = [(window, min(window + step, end)) for window in range(start, end, step)]
+
+        def fetch(window):
+            url = f"{config.BASE_URL}/chart/{self.ticker}?period1={window[0]}"
+            url += f"&period2={window[1]}&interval={dataGranularity}"
+            response = self.get_response(url)
+            return self._price_dataframe(loads_json(response.content)["chart"]["result"][0])
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            data = pd.concat(list(executor.map(fetch, windows)), ignore_index=True)
+
+        return (
+            data.drop_duplicates(subset="timestamp", keep="last")
+            .sort_values("timestamp")
+            .reset_index(drop=True)
+        )
+
+    def _price_dataframe(self, result: dict) -> pd.DataFrame:
+        """
+        Build the price dataframe from a chart result
+
+        Args:
+        ----------------
+        result: dict
+            A single item of ``chart.result`` in the chart response
+
+        Returns:
+        ----------------
+        pd.DataFrame: The price data
+        """
+        meta = result["meta"]
+        currency = meta.get("currency")
+        exchangeTimezoneName = meta.get("exchangeTimezoneName")
+        timezone = meta.get("timezone")
+        exchangeName = meta.get("exchangeName")
+        instrumentType = meta.get("instrumentType")
+
+        # windows without trading days have no timestamps or quotes
+        timestamp = np.array(result.get("timestamp") or [], dtype="int64")
+
+        # convert each field to a float array at once, None values become NaN
+        quote = result["indicators"]["quote"][0]
+        fields = {}
+        for field in config.PRICE_FIELDS:
+            values = quote.get(field)
+            if values is None:
+                fields[field] = np.full(len(timestamp), np.nan)
+            else:
+                fields[field] = np.array(values, dtype="float64")
+
+        # volumes stay integers unless bars are missing
+        if not np.isnan(fields["volume"]).any():
+            fields["volume"] = fields["volume"].astype("int64")
 
         return pd.DataFrame(
             {
-                "timestamp": timestamp,
-                "volume": volume,
-                "close": close,
-                "open": open,
-                "high": high,
-                "low": low,
+                "timestamp": pd.to_datetime(timestamp, unit="s"),
+                **fields,
                 "currency": currency,
                 "timezone": timezone,
                 "exchangeTimezoneName": exchangeTimezoneName,
@@ -114,7 +284,7 @@ class YahooAPI(TickerBase):
         url = f"{config.BASE_URL}/chart/{self.ticker}"
         response = self.get_response(url)
 
-        currentTradingPeriod = response.json()["chart"]["result"][0]["meta"][
+        currentTradingPeriod = loads_json(response.content)["chart"]["result"][0]["meta"][
             "currentTradingPeriod"
         ]
 
@@ -138,12 +308,60 @@ class YahooAPI(TickerBase):
             }
         )
 
+    def yahoo_api_quote_summary(self, modules: List[str]) -> Dict[str, dict]:
+        """
+        Get any set of quoteSummary modules in a single request, e.g.
+        assetProfile, majorHoldersBreakdown, institutionOwnership, earningsTrend
+        or defaultKeyStatistics. Modules retrieved before for the same ticker
+        are served from memory.
+
+        Args:
+        ----------------
+        modules (List[str]): The modules to retrieve
+        see ``QUOTE_SUMMARY_MODULES`` in config for the supported modules
+
+        Returns:
+        ----------------
+        Dict[str, dict]: The JSON content of each module keyed by module name,
+        modules the endpoint has no data for are left out
+        """
+        for module in modules:
+            if module not in config.QUOTE_SUMMARY_MODULES:
+                raise ValueError(
+                    f"{module} is not a quoteSummary module, "
+                    f"choose from: {config.QUOTE_SUMMARY_MODULES}"
+                )
+
+        # modules are kept per ticker, the ticker of an instance may be reassigned
+        if not hasattr(self, "quote_summary_modules"):
+            self.quote_summary_modules = {}
+
+        missing = [
+            module for module in modules if (self.ticker, module) not in self.quote_summary_modules
+        ]
+        if missing:
+            url = f"{config.QUOTE_SUMMARY_BASE_URL}/{self.ticker}"
+            url += f"?modules={','.join(missing)}"
+            result = self.get_crumb_response(url).json()["quoteSummary"]["result"]
+
+            content = result[0] if result else {}
+            for module in missing:
+                self.quote_summary_modules[(self.ticker, module)] = content.get(module)
+
+        return {
+            module: self.quote_summary_modules[(self.ticker, module)]
+            for module in modules
+            if self.quote_summary_modules[(self.ticker, module)] is not None
+        }
+
     def yahoo_api_income_statement(
         self,
         frequency: Literal["annual", "quarterly"] = "annual",
         format: Literal["fmt", "raw"] = "fmt",
         period1: datetime = five_years_ago,
         period2: datetime = today,
+        windows: int = 1,
+        max_workers: int = 4,
     ) -> pd.DataFrame:
         """
         Get the income statement for the stock
@@ -164,13 +382,21 @@ class YahooAPI(TickerBase):
         period2 (datetime): The end date of the data to retrieve
         default is the current date
 
+        windows (int): The number of equal period windows between period1 and
+        period2, fetched concurrently and merged into one deduplicated frame
+        default is 1, a single request
+
+        max_workers (int): The number of windows fetched concurrently
+
         Returns:
         ----------------
         pd.DataFrame: The income statement data
         """
-        url = self.build_url(frequency, period1, period2, "income_statement")
-
-        response = self.get_response(url).json()["timeseries"]["result"]
+        urls = [
+            self.build_url(frequency, start, end, "income_statement")
+            for start, end in self._period_windows(period1, period2, windows)
+        ]
+        response = self._fetch_timeseries(urls, max_workers)
 
         return self.extract_dataframe(response, format)
 
@@ -180,6 +406,8 @@ class YahooAPI(TickerBase):
         format: Literal["fmt", "raw"] = "fmt",
         period1: datetime = five_years_ago,
         period2: datetime = today,
+        windows: int = 1,
+        max_workers: int = 4,
     ) -> pd.DataFrame:
         """
         Get the cash flow statement for the stock
@@ -200,13 +428,21 @@ class YahooAPI(TickerBase):
         period2 (datetime): The end date of the data to retrieve
         default is the current date
 
+        windows (int): The number of equal period windows between period1 and
+        period2, fetched concurrently and merged into one deduplicated frame
+        default is 1, a single request
+
+        max_workers (int): The number of windows fetched concurrently
+
         Returns:
         ----------------
         pd.DataFrame: The cash flow statement data
         """
-        url = self.build_url(frequency, period1, period2, "cash_flow")
-
-        response = self.get_response(url).json()["timeseries"]["result"]
+        urls = [
+            self.build_url(frequency, start, end, "cash_flow")
+            for start, end in self._period_windows(period1, period2, windows)
+        ]
+        response = self._fetch_timeseries(urls, max_workers)
 
         return self.extract_dataframe(response, format)
 
@@ -216,6 +452,8 @@ class YahooAPI(TickerBase):
         format: Literal["fmt", "raw"] = "fmt",
         period1: datetime = five_years_ago,
         period2: datetime = today,
+        windows: int = 1,
+        max_workers: int = 4,
     ) -> pd.DataFrame:
         """
         Get the balance sheet for the stock
@@ -236,13 +474,21 @@ class YahooAPI(TickerBase):
         period2 (datetime): The end date of the data to retrieve
         default is the current date
 
+        windows (int): The number of equal period windows between period1 and
+        period2, fetched concurrently and merged into one deduplicated frame
+        default is 1, a single request
+
+        max_workers (int): The number of windows fetched concurrently
+
         Returns:
         ----------------
         pd.DataFrame: The balance sheet data
         """
-        url = self.build_url(frequency, period1, period2, "balance_sheet")
-
-        response = self.get_response(url).json()["timeseries"]["result"]
+        urls = [
+            self.build_url(frequency, start, end, "balance_sheet")
+            for start, end in self._period_windows(period1, period2, windows)
+        ]
+        response = self._fetch_timeseries(urls, max_workers)
 
         return self.extract_dataframe(response, format)
 
@@ -252,6 +498,8 @@ class YahooAPI(TickerBase):
         format: Literal["fmt", "raw"] = "fmt",
         period1: datetime = five_years_ago,
         period2: datetime = today,
+        windows: int = 1,
+        max_workers: int = 4,
     ) -> pd.DataFrame:
         """
         Get the financials for the stock
@@ -272,16 +520,196 @@ class YahooAPI(TickerBase):
         period2 (datetime): The end date of the data to retrieve
         default is the current date
 
+        windows (int): The number of equal period windows between period1 and
+        period2, fetched concurrently and merged into one deduplicated frame
+        default is 1, a single request
+
+        max_workers (int): The number of windows fetched concurrently
+
         Returns:
         ----------------
         pd.DataFrame: The financials data
         """
-        url = self.build_url(frequency, period1, period2, "financials")
-
-        response = self.get_response(url).json()["timeseries"]["result"]
+        urls = [
+            self.build_url(frequency, start, end, "financials")
+            for start, end in self._period_windows(period1, period2, windows)
+        ]
+        response = self._fetch_timeseries(urls, max_workers)
 
         return self.extract_dataframe(response, format)
 
+    def yahoo_api_fundamentals(
+        self,
+        frequencies: Optional[List[Literal["annual", "quarterly"]]] = None,
+        format: Literal["fmt", "raw"] = "fmt",
+        period1: datetime = five_years_ago,
+        period2: datetime = today,
+        statements: List[
+            Literal["income_statement", "cash_flow", "balance_sheet", "financials"]
+        ] = config.FUNDAMENTALS_STATEMENTS,
+        windows: int = 1,
+        max_workers: int = 4,
+    ) -> Dict[str, Dict[str, pd.DataFrame]]:
+        """
+        Get several fundamentals statements and frequencies with as few requests
+        as possible. All requested fields are packed into URL-length-safe requests
+        to the fundamentals endpoint and the result is split per statement.
+
+        Args:
+        ----------------
+        frequencies (list): The frequencies of the data to retrieve
+        valid values are "annual", "quarterly", default is both
+
+        format (str): The format of the data to retrieve
+        valid values are "fmt", "raw"
+
+        period1 (datetime): The start date of the data to retrieve
+        default is five years ago as that is the maximum period the API supports data retrieval for
+
+        period2 (datetime): The end date of the data to retrieve
+        default is the current date
+
+        statements (list): The statements to retrieve
+        valid values are "income_statement", "cash_flow", "balance_sheet", "financials"
+
+        windows (int): The number of equal period windows between period1 and
+        period2, fetched concurrently and merged, default is 1
+
+        max_workers (int): The number of requests sent concurrently
+
+        Returns:
+        ----------------
+        Dict[str, Dict[str, pd.DataFrame]]: The data keyed by statement and frequency,
+        e.g. ``data["cash_flow"]["quarterly"]``
+        """
+        frequencies = frequencies or ["annual", "quarterly"]
+        fields = {
+            (statement, frequency): [
+                f"{frequency}{column}"
+                for column in getattr(config, f"{statement.upper()}_COLUMNS")
+            ]
+            for statement in statements
+            for frequency in frequencies
+        }
+
+        # statements share fields (e.g. income statement and financials)
+        types = list(dict.fromkeys(i for columns in fields.values() for i in columns))
+
+        urls = [
+            url
+            for start, end in self._period_windows(period1, period2, windows)
+            for url in self._build_fundamentals_urls(types, start, end)
+        ]
+        response = self._fetch_timeseries(urls, max_workers)
+
+        items = {item["meta"]["type"][0]: item for item in response}
+
+        data = {statement: {} for statement in statements}
+        for (statement, frequency), columns in fields.items():
+            data[statement][frequency] = self.extract_dataframe(
+                [items[i] for i in columns if i in items], format
+            )
+
+        return data
+
+    def _period_windows(
+        self, period1: datetime, period2: datetime, windows: int = 1
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Split the period between period1 and period2 into equal windows
+        """
+        if windows <= 1:
+            return [(period1, period2)]
+
+        edges = pd.date_range(pd.Timestamp(period1), pd.Timestamp(period2), periods=windows + 1)
+        return list(zip(edges[:-1], edges[1:]))
+
+    def _fetch_timeseries(self, urls: List[str], max_workers: int = 4) -> list:
+        """
+        Fetch fundamentals URLs concurrently and merge their timeseries results
+
+        Args:
+        ----------------
+        urls: List[str]
+            The fundamentals URLs, e.g. one per period window
+
+        max_workers: int
+            The number of URLs fetched concurrently
+
+        Returns:
+        ----------------
+        list: One timeseries result per type, with the data points of all URLs
+        sorted by date. Points of the same date, e.g. on the edge of two windows,
+        are kept once
+        """
+
+        def fetch(url):
+            return self.get_response(url).json()["timeseries"]["result"]
+
+        if len(urls) == 1:
+            return fetch(urls[0])
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch, urls))
+
+        merged = {}
+        for result in results:
+            for item in result:
+                column = item["meta"]["type"][0]
+                points = merged.setdefault(column, (item["meta"], {}))[1]
+                for point in item.get(column) or []:
+                    if point is not None:
+                        points[point["asOfDate"]] = point
+
+        return [
+            (
+                {"meta": meta, column: [points[date] for date in sorted(points)]}
+                if points
+                else {"meta": meta}
+            )
+            for column, (meta, points) in merged.items()
+        ]
+
+    def _build_fundamentals_urls(
+        self, types: List[str], period1: datetime, period2: datetime
+    ) -> List[str]:
+        """
+        Build the fewest fundamentals URLs that request all the given types
+        without exceeding ``MAX_URL_LENGTH``
+
+        Args:
+        ----------------
+        types: List[str]
+            The types to request, e.g. annualTotalRevenue
+
+        period1: datetime
+            The start date of the data to retrieve
+
+        period2: datetime
+            The end date of the data to retrieve
+
+        Returns:
+        ----------------
+        List[str]: The URLs to retrieve the data from
+        """
+        period1 = int(pd.Timestamp(period1).timestamp())
+        period2 = int(pd.Timestamp(period2).timestamp())
+
+        base_url = f"{config.FUNDAMENTALS_BASE_URL}/{self.ticker}/?symbol={self.ticker}"
+        base_url += f"&period1={period1}&period2={period2}&type="
+
+        urls, chunk = [], []
+        for item in types:
+            if chunk and len(base_url) + len(",".join(chunk + [item])) > (config.MAX_URL_LENGTH):
+                urls.append(base_url + ",".join(chunk))
+                chunk = []
+            chunk.append(item)
+
+        if chunk:
+            urls.append(base_url + ",".join(chunk))
+
+        return urls
+
     def build_url(
         self,
         frequency: str,
@@ -341,6 +769,7 @@ class YahooAPI(TickerBase):
         pd.DataFrame: The data in a dataframe
         """
         row = {}
+        dated_index = []
         for item in response:
             column = item["meta"]["type"][0]
 
@@ -2,17 +2,115 @@
 Module for fetching data from Yahoo Finance website
 """
 
+import json
 import re
+from contextlib import nullcontext
+from html import unescape
+from typing import Dict, List, Union
 
 import pandas as pd
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer, Tag
 
+from stockdex import config
 from stockdex.config import VALID_SECURITY_TYPES
-from stockdex.lib import check_security_type
+from stockdex.exceptions import NoDataError
+from stockdex.lib import check_security_type, table_to_dataframe, typed_table
 from stockdex.ticker_base import TickerBase
 
+# JSON responses the server embeds in the page, one script tag per response
+EMBEDDED_JSON_PATTERN = re.compile(
+    r'<script type="application/json" data-sveltekit-fetched data-url="([^"]*)"[^>]*>'
+    r"(.*?)</script>",
+    re.DOTALL,
+)
+
+# columns of the analysis tables by earningsTrend period
+TREND_PERIODS = {
+    "0q": "Current Qtr.",
+    "+1q": "Next Qtr.",
+    "0y": "Current Year",
+    "+1y": "Next Year",
+}
+
+# tables of the analysis page and the data-testid of their sections
+ANALYSIS_TABLES = {
+    "earnings_estimate": "earningsEstimate",
+    "revenue_estimate": "revenueEstimate",
+    "earnings_history": "earningsHistory",
+    "eps_trend": "epsTrend",
+    "eps_revisions": "epsRevisions",
+    "growth_estimates": "growthEstimate",
+}
+
+# tables of the key statistics page
+KEY_STATISTICS_TABLES = [
+    "valuation_measures",
+    "financial_highlights",
+    "trading_information",
+]
+
+# errors of a table missing from the page or not laid out as expected, they do
+# not change when the page is fetched again so they are kept like the tables
+MISSING_TABLE_ERRORS = (NoDataError, AttributeError, IndexError, KeyError)
+
+
+def parse_embedded_json(html: str) -> Dict[str, dict]:
+    """
+    Extract the JSON responses embedded in a Yahoo Finance page
+
+    Args:
+    ----------------
+    html (str): The HTML content of the page
+
+    Returns:
+    ----------------
+    Dict[str, dict]: The decoded body of each response keyed by the URL it
+    was fetched from, e.g. a quoteSummary or fundamentals-timeseries URL
+    """
+    payloads = {}
+    for data_url, content in EMBEDDED_JSON_PATTERN.findall(html):
+        body = json.loads(content).get("body")
+        if isinstance(body, str):
+            body = json.loads(body)
+        payloads[unescape(data_url)] = body
+
+    return payloads
+
+
+def _split_words(name: str) -> str:
+    """
+    Turn a timeseries type name into the row title shown on the website,
+    e.g. "TotalRevenue" into "Total Revenue"
+    """
+    return re.sub(r"(?<=[a-z])(?=[A-Z])", " ", name)
+
+
+def _short_date(value: str) -> str:
+    """
+    Format a date as shown in the table headers of the website, e.g. 9/30/2024
+    """
+    date = pd.Timestamp(value)
+    return f"{date.month}/{date.day}/{date.year}"
+
+
+def _formatted(value: Union[dict, str, int, None], key: str = "fmt") -> str:
+    """
+    Get the formatted text of a quoteSummary value, as shown on the website
+    """
+    if isinstance(value, dict):
+        return value.get(key) or value.get("fmt") or "--"
+    return "--" if value is None else str(value)
+
 
 class YahooWeb(TickerBase):
+    # retrieve the profile and holders properties from the quoteSummary endpoint,
+    # see yahoo_api_quote_summary, instead of scraping their pages
+    use_quote_summary = False
+
+    # serve the properties from the JSON the page embeds before walking its DOM,
+    # the DOM is still parsed if the page has no embedded data for a property
+    use_embedded_json = True
+
     def __init__(
         self,
         ticker: str = "",
@@ -37,10 +135,13 @@ class YahooWeb(TickerBase):
         ----------------
         pd.DataFrame: A pandas DataFrame including the financials table
         """
-        response = self.get_response(url)
-        soup = BeautifulSoup(response.content, "html.parser").find(
-            "div", {"class": "table yf-1pgoo1f"}
-        )
+        data = self._embedded_financials_table(url)
+        if data is not None:
+            return data
+
+        soup = self.get_soup(
+            url, parse_only=SoupStrainer("div", {"class": "table yf-1pgoo1f"})
+        ).find("div", {"class": "table yf-1pgoo1f"})
 
         # Extract column headers
         header_row = soup.find("div", class_="tableHeader")
@@ -75,7 +176,236 @@ class YahooWeb(TickerBase):
 
         return df
 
+    def _embedded_payloads(self, url: str) -> Dict[str, dict]:
+        """
+        Get the JSON responses embedded in a page. Like their documents, the
+        payloads of prefetched responses are extracted once and shared
+        """
+        if url in getattr(self, "prefetched_payloads", {}):
+            return self.prefetched_payloads[url]
+
+        try:
+            payloads = parse_embedded_json(self.get_response(url).text)
+        except ValueError as error:
+            self.logger.warning(f"Invalid JSON embedded in {url}: {error}")
+            payloads = {}
+
+        if url in getattr(self, "prefetched_responses", {}):
+            if not hasattr(self, "prefetched_payloads"):
+                self.prefetched_payloads = {}
+            self.prefetched_payloads[url] = payloads
+
+        return payloads
+
+    def _embedded_modules(self, url: str) -> Dict[str, dict]:
+        """
+        Get the quoteSummary modules embedded in a page
+
+        Returns:
+        ----------------
+        Dict[str, dict]: The modules keyed by name, empty if the embedded JSON
+        path is disabled or the page embeds no quoteSummary response
+        """
+        if not self.use_embedded_json:
+            return {}
+
+        modules = {}
+        for data_url, body in self._embedded_payloads(url).items():
+            if "quoteSummary" in data_url:
+                result = (body.get("quoteSummary") or {}).get("result") or [{}]
+                modules.update(result[0])
+
+        return modules
+
+    def _embedded_module(self, url: str, module: str) -> Union[dict, None]:
+        """
+        Get a quoteSummary module embedded in a page, None if it is not embedded
+        """
+        return self._embedded_modules(url).get(module)
+
+    def _embedded_financials_table(
+        self, url: str, frequency: str = "annual"
+    ) -> Union[pd.DataFrame, None]:
+        """
+        Build a financials table from the fundamentals timeseries embedded in
+        the page, with the trailing twelve months first and the periods of the
+        given frequency after it. The page embeds the annual, quarterly and
+        trailing series together, only the ones shown in the table of that
+        frequency are kept.
+
+        The raw values are in units of the currency while the table on the
+        website, and so the DOM path of ``yahoo_web_financials_table``, states
+        them in thousands. They are divided by 1000 to match it, except per
+        share values which the website shows as they are.
+
+        Args:
+        ----------------
+        url (str)
+            The URL of the financials page
+
+        frequency (str)
+            The periods of the table, ``annual`` (the website default) or
+            ``quarterly``
+
+        Returns:
+        ----------------
+        Union[pd.DataFrame, None]: The table, None if it is not embedded
+        """
+        if not self.use_embedded_json:
+            return None
+
+        rows = {}
+        for data_url, body in self._embedded_payloads(url).items():
+            if "fundamentals-timeseries" not in data_url:
+                continue
+
+            for result in (body.get("timeseries") or {}).get("result") or []:
+                name = result["meta"]["type"][0]
+                match = re.match("^(annual|quarterly|trailing)(.*)", name)
+                if match is None or match.group(1) not in (frequency, "trailing"):
+                    continue
+
+                period, field = match.groups()
+
+                row = rows.setdefault(_split_words(field), {})
+                for item in result.get(name) or []:
+                    if not item:
+                        continue
+                    value = item["reportedValue"]["raw"]
+                    column = "TTM" if period == "trailing" else pd.Timestamp(item["asOfDate"])
+                    row[column] = f"{value:.2f}" if "EPS" in field else f"{value / 1000:,.0f}"
+
+        if not any(rows.values()):
+            return None
+
+        data = pd.DataFrame.from_dict(rows, orient="index")
+        dates = sorted((column for column in data.columns if column != "TTM"), reverse=True)
+        data = data[(["TTM"] if "TTM" in data.columns else []) + dates]
+        data.columns = [
+            column if column == "TTM" else _short_date(column) for column in data.columns
+        ]
+
+        return data.fillna("--")
+
+    def _embedded_key_statistics(self, url: str, table: str) -> Union[pd.DataFrame, None]:
+        """
+        Build a key statistics table from the quoteSummary modules embedded in
+        the page, see ``KEY_STATISTICS_FIELDS`` in config for its rows
+
+        Returns:
+        ----------------
+        Union[pd.DataFrame, None]: The table, None if it is not embedded
+        """
+        fields = config.KEY_STATISTICS_FIELDS[table]
+        modules = self._embedded_modules(url)
+        if not any(module in modules for module, _ in fields.values()):
+            return None
+
+        data = pd.DataFrame(
+            [
+                [label, _formatted((modules.get(module) or {}).get(field))]
+                for label, (module, field) in fields.items()
+            ],
+            columns=["Criteria", "Value"],
+        )
+
+        return data.set_index("Criteria")
+
+    def _embedded_trend_table(self, url: str, estimate: str) -> Union[pd.DataFrame, None]:
+        """
+        Build an analysis table from the earningsTrend module embedded in the
+        page, see ``EARNINGS_TREND_ROWS`` in config for its rows
+
+        Returns:
+        ----------------
+        Union[pd.DataFrame, None]: The table, None if it is not embedded
+        """
+        modules = self._embedded_modules(url)
+        trend = [
+            item
+            for item in (modules.get("earningsTrend") or {}).get("trend") or []
+            if item.get("period") in TREND_PERIODS and item.get(estimate)
+        ]
+        if not trend:
+            return None
+
+        columns = [self._embedded_currency(modules)]
+        for item in trend:
+            end_date = pd.Timestamp(item["endDate"])
+            date_format = "%b %Y" if item["period"].endswith("q") else "%Y"
+            columns.append(f"{TREND_PERIODS[item['period']]} ({end_date.strftime(date_format)})")
+
+        data = [
+            [label] + [_formatted(item[estimate].get(field)) for item in trend]
+            for label, field in config.EARNINGS_TREND_ROWS[estimate].items()
+        ]
+
+        return pd.DataFrame(data, columns=columns)
+
+    def _embedded_earnings_history(self, url: str) -> Union[pd.DataFrame, None]:
+        """
+        Build the earnings history table from the earningsHistory module
+        embedded in the page
+
+        Returns:
+        ----------------
+        Union[pd.DataFrame, None]: The table, None if it is not embedded
+        """
+        modules = self._embedded_modules(url)
+        history = (modules.get("earningsHistory") or {}).get("history") or []
+        if not history:
+            return None
+
+        columns = [self._embedded_currency(modules)] + [
+            _short_date(item["quarter"]["fmt"]) for item in history
+        ]
+        rows = {
+            "EPS Est.": "epsEstimate",
+            "EPS Actual": "epsActual",
+            "Difference": "epsDifference",
+            "Surprise %": "surprisePercent",
+        }
+        data = [
+            [label] + [_formatted(item.get(field)) for item in history]
+            for label, field in rows.items()
+        ]
+
+        return pd.DataFrame(data, columns=columns)
+
+    def _embedded_currency(self, modules: Dict[str, dict]) -> str:
+        """
+        Get the header of the first column of the analysis tables
+        """
+        currency = (modules.get("financialData") or {}).get("financialCurrency")
+
+        return f"Currency in {currency}" if currency else "Currency"
+
+    def _quote_summary_module(self, module: str) -> Union[dict, None]:
+        """
+        Get a quoteSummary module for the fast path of the properties.
+        All modules of ``QUOTE_SUMMARY_WEB_MODULES`` are retrieved in one request,
+        so that the profile and holders properties share it.
+
+        Returns:
+        ----------------
+        Union[dict, None]: The module, None if the fast path is disabled or
+        the module is unavailable, in which case the page is scraped instead
+        """
+        if not self.use_quote_summary:
+            return None
+
+        try:
+            modules = self.yahoo_api_quote_summary(config.QUOTE_SUMMARY_WEB_MODULES)
+        except Exception as error:  # noqa: BLE001
+            # do not retry the endpoint for every property of this ticker
+            self.use_quote_summary = False
+            self.logger.warning(f"quoteSummary unavailable, scraping instead: {error}")
+            return None
+
+        return modules.get(module)
+
     @property
+    @typed_table
     def yahoo_web_cashflow(self) -> pd.DataFrame:
         """
         Get cash flow for the ticker
@@ -87,10 +417,11 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/cash-flow"
+        url = self.dataset_url("yahoo_web_cashflow")
         return self.yahoo_web_financials_table(url)
 
     @property
+    @typed_table
     def yahoo_web_balance_sheet(self) -> pd.DataFrame:
         """
         Get balance sheet for the ticker
@@ -103,10 +434,11 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/balance-sheet"
+        url = self.dataset_url("yahoo_web_balance_sheet")
         return self.yahoo_web_financials_table(url)
 
     @property
+    @typed_table
     def yahoo_web_income_stmt(self) -> pd.DataFrame:
         """
         Get income statement for the ticker
@@ -119,10 +451,11 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/financials"
+        url = self.dataset_url("yahoo_web_income_stmt")
         return self.yahoo_web_financials_table(url)
 
     @property
+    @typed_table
     def yahoo_web_calls(self) -> pd.DataFrame:
         """
         Get calls for the ticker
@@ -136,26 +469,18 @@ class YahooWeb(TickerBase):
         )
 
         # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/options"
-        response = self.get_response(url)
+        url = self.dataset_url("yahoo_web_calls")
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        # Parse only the region of the page that is read
+        soup = self.get_soup(url, parse_only=SoupStrainer("table"))
 
         # gets calls and puts
         table = self.find_parent_by_text(soup, "table", "Contract Name")
 
-        headers = [item.text for item in table.find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find_all("tr")[1:]
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return table_to_dataframe(table, header="tr", body=None)
 
     @property
+    @typed_table
     def yahoo_web_puts(self) -> pd.DataFrame:
         """
         Get puts for the ticker
@@ -170,24 +495,15 @@ class YahooWeb(TickerBase):
         )
 
         # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/options"
-        response = self.get_response(url)
+        url = self.dataset_url("yahoo_web_puts")
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        # Parse only the region of the page that is read
+        soup = self.get_soup(url, parse_only=SoupStrainer("table"))
 
         # gets calls and puts
         table = self.find_parent_by_text(soup, "table", "Contract Name", skip=1)
 
-        headers = [item.text for item in table.find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find_all("tr")[1:]
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return table_to_dataframe(table, header="tr", body=None)
 
     @property
     def yahoo_web_description(self) -> str:
@@ -200,15 +516,23 @@ class YahooWeb(TickerBase):
         """
 
         # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/profile"
-        response = self.get_response(url)
+        url = self.dataset_url("yahoo_web_description")
+
+        profile = self._quote_summary_module("assetProfile") or self._embedded_module(
+            url, "assetProfile"
+        )
+        if profile and profile.get("longBusinessSummary"):
+            return profile["longBusinessSummary"]
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        # Parse only the region of the page that is read
+        soup = self.get_soup(
+            url, parse_only=SoupStrainer("section", {"data-testid": "description"})
+        )
 
         return soup.find("section", {"data-testid": "description"}).find("p").text
 
     @property
+    @typed_table
     def yahoo_web_key_executives(self) -> pd.DataFrame:
         """
         Get profile key executives for the ticker
@@ -220,24 +544,34 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/profile"
-        response = self.get_response(url)
+        url = self.dataset_url("yahoo_web_key_executives")
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        profile = self._quote_summary_module("assetProfile") or self._embedded_module(
+            url, "assetProfile"
+        )
+        if profile and profile.get("companyOfficers"):
+            return pd.DataFrame(
+                [
+                    [
+                        officer.get("name"),
+                        officer.get("title"),
+                        _formatted(officer.get("totalPay")),
+                        _formatted(officer.get("exercisedValue")),
+                        _formatted(officer.get("yearBorn")),
+                    ]
+                    for officer in profile["companyOfficers"]
+                ],
+                columns=["Name", "Title", "Pay", "Exercised", "Year Born"],
+            )
+
+        # Parse only the region of the page that is read
+        soup = self.get_soup(
+            url, parse_only=SoupStrainer("section", {"data-testid": "key-executives"})
+        )
 
         raw_data = soup.find("section", {"data-testid": "key-executives"})
 
-        data_df = pd.DataFrame()
-        data = []
-
-        headers = [th.text for th in raw_data.find("thead").find("tr").find_all("th")]
-        for tr in raw_data.find("tbody").find_all("tr"):
-            data.append([td.text for td in tr.find_all("td")])
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return table_to_dataframe(raw_data)
 
     @property
     def yahoo_web_corporate_governance(self) -> str:
@@ -251,11 +585,13 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/profile"
-        response = self.get_response(url)
+        url = self.dataset_url("yahoo_web_corporate_governance")
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        # Parse only the region of the page that is read
+        soup = self.get_soup(
+            url,
+            parse_only=SoupStrainer("section", {"data-testid": "corporate-governance"}),
+        )
 
         return (
             soup.find("section", {"data-testid": "corporate-governance"})
@@ -264,6 +600,7 @@ class YahooWeb(TickerBase):
         )
 
     @property
+    @typed_table
     def yahoo_web_major_holders(self) -> pd.DataFrame:
         """
         Get major holders for the ticker
@@ -275,31 +612,39 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/holders"
-        response = self.get_response(url)
+        url = self.dataset_url("yahoo_web_major_holders")
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        breakdown = self._quote_summary_module("majorHoldersBreakdown") or self._embedded_module(
+            url, "majorHoldersBreakdown"
+        )
+        if breakdown:
+            descriptions = {
+                "insidersPercentHeld": "% of Shares Held by All Insider",
+                "institutionsPercentHeld": "% of Shares Held by Institutions",
+                "institutionsFloatPercentHeld": "% of Float Held by Institutions",
+                "institutionsCount": "Number of Institutions Holding Shares",
+            }
+            return pd.DataFrame(
+                [
+                    [_formatted(breakdown.get(field)), description]
+                    for field, description in descriptions.items()
+                ]
+            )
+
+        # Parse only the region of the page that is read
+        soup = self.get_soup(
+            url,
+            parse_only=SoupStrainer("section", {"data-testid": "holders-major-holders-table"}),
+        )
 
         section = soup.find("section", {"data-testid": "holders-major-holders-table"})
         table = section.find("table")
 
-        data_df = pd.DataFrame()
-        data = []
-
-        headers, data = [], []
-
-        headers = [item.text for item in table.find_all("th")].append("description")
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find_all("tr")[1:]
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        # the columns are numbered, the second one holds the description
+        return table_to_dataframe(table, header=None, body=None)
 
     @property
+    @typed_table
     def yahoo_web_top_institutional_holders(self) -> pd.DataFrame:
         """
         Get top institutional holders for the ticker
@@ -311,33 +656,34 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/holders"
-        response = self.get_response(url)
+        url = self.dataset_url("yahoo_web_top_institutional_holders")
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        ownership = self._quote_summary_module("institutionOwnership") or self._embedded_module(
+            url, "institutionOwnership"
+        )
+        if ownership and ownership.get("ownershipList"):
+            return self._quote_summary_holders(
+                ownership["ownershipList"],
+                columns=["Holder", "Shares", "Date Reported", "% Out", "Value"],
+            )
+
+        # Parse only the region of the page that is read
+        soup = self.get_soup(
+            url,
+            parse_only=SoupStrainer(
+                "section", {"data-testid": "holders-top-institutional-holders"}
+            ),
+        )
 
         section = soup.find(
             "section", {"data-testid": "holders-top-institutional-holders"}
         )
         table = section.find("table")
 
-        data_df = pd.DataFrame()
-        data = []
-
-        headers, data = [], []
-
-        headers = [item.text for item in table.find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find_all("tr")[1:]
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return table_to_dataframe(table, header="tr", body=None)
 
     @property
+    @typed_table
     def yahoo_web_top_mutual_fund_holders(self) -> pd.DataFrame:
         """
         Get top mutual fund holders for the ticker
@@ -349,26 +695,49 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/holders"
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-        raw_data = soup.find_all("table")
-
-        data_df = pd.DataFrame()
-        data = []
+        url = self.dataset_url("yahoo_web_top_mutual_fund_holders")
 
-        table = raw_data[2].find_all("tr")
-        for tr in table:
-            data.append([td.text for td in tr.find_all("td")])
+        ownership = self._quote_summary_module("fundOwnership") or self._embedded_module(
+            url, "fundOwnership"
+        )
+        if ownership and ownership.get("ownershipList"):
+            return self._quote_summary_holders(
+                ownership["ownershipList"],
+                columns=["holder", "shares", "date_reported", "percentage", "value"],
+            )
+
+        # Parse only the region of the page that is read
+        soup = self.get_soup(url, parse_only=SoupStrainer("table"))
+        table = soup.find_all("table")[2]
+
+        # the header row has no td cells and is skipped
+        return table_to_dataframe(
+            table,
+            header=None,
+            body=None,
+            columns=["holder", "shares", "date_reported", "percentage", "value"],
+        )
 
-        # drop the first row as it is none
-        data_df = pd.DataFrame(data[1:])
-        data_df.columns = ["holder", "shares", "date_reported", "percentage", "value"]
-        return data_df
+    def _quote_summary_holders(self, ownership: list, columns: list) -> pd.DataFrame:
+        """
+        Build a holders table from the ownershipList of a quoteSummary module
+        """
+        return pd.DataFrame(
+            [
+                [
+                    holder.get("organization"),
+                    _formatted(holder.get("position"), "longFmt"),
+                    _formatted(holder.get("reportDate")),
+                    _formatted(holder.get("pctHeld")),
+                    _formatted(holder.get("value"), "longFmt"),
+                ]
+                for holder in ownership
+            ],
+            columns=columns,
+        )
 
     @property
+    @typed_table
     def yahoo_web_summary(self) -> pd.DataFrame:
         """
         Get data for the ticker
@@ -380,11 +749,10 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}"
-        response = self.get_response(url)
+        url = self.dataset_url("yahoo_web_summary")
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        # Parse only the region of the page that is read
+        soup = self.get_soup(url, parse_only=SoupStrainer(["td", "fin-streamer"]))
 
         # for data in the table, generating 16 rows
         raw_data = soup.find_all("td", {"data-test": True})
@@ -399,75 +767,204 @@ class YahooWeb(TickerBase):
 
         return data_df.T
 
-    @property
-    def yahoo_web_valuation_measures(self) -> pd.DataFrame:
+    @typed_table
+    def yahoo_web_analysis(self, refresh: bool = False) -> Dict[str, pd.DataFrame]:
         """
-        Get valuation measures for the ticker
+        Get all tables of the analysis page. The page is fetched and parsed once
+        for all tables, which are kept on the ticker and reused by the single
+        table properties, e.g. yahoo_web_eps_trend
+
+        Args:
+        ----------------
+        refresh (bool): Retrieve the page again instead of reusing the tables
+        retrieved before
 
         Returns:
-        pd.DataFrame: A pandas DataFrame including the valuation measures
-        visible in the Yahoo Finance statistics page for the ticker
+        ----------------
+        Dict[str, pd.DataFrame]: The tables keyed by name, any of
+        "earnings_estimate", "revenue_estimate", "earnings_history", "eps_trend",
+        "eps_revisions" and "growth_estimates". Tables missing from the page are
+        left out and logged
         """
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
-        # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/key-statistics"
-        response = self.get_response(url)
+        return self._yahoo_web_page_tables("analysis", refresh)
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+    @typed_table
+    def yahoo_web_key_statistics(self, refresh: bool = False) -> Dict[str, pd.DataFrame]:
+        """
+        Get all tables of the key statistics page. The page is fetched and parsed
+        once for all tables, which are kept on the ticker and reused by the single
+        table properties, e.g. yahoo_web_valuation_measures
 
-        # find element with test Valuation Measures
-        parent_section = self.find_parent_by_text(
-            soup, "h3", "Valuation Measures"
-        ).parent.parent
+        Args:
+        ----------------
+        refresh (bool): Retrieve the page again instead of reusing the tables
+        retrieved before
 
-        # looking for "table svelte-104jbnt"
-        table = parent_section.find("table")
+        Returns:
+        ----------------
+        Dict[str, pd.DataFrame]: The tables keyed by name, any of
+        "valuation_measures", "financial_highlights" and "trading_information".
+        Tables missing from the page are left out and logged
+        """
+        check_security_type(security_type=self.security_type, valid_types=["stock"])
 
-        data_df = pd.DataFrame()
+        return self._yahoo_web_page_tables("key-statistics", refresh)
 
-        headers = [item.text for item in table.find("thead").find("tr").find_all("th")]
-        data_df = pd.DataFrame(columns=headers)
+    def _yahoo_web_page_tables(self, page: str, refresh: bool = False) -> Dict[str, pd.DataFrame]:
+        """
+        Get the tables of the analysis or key statistics page that could be built
+        """
+        tables = {}
+        for name, data in self._yahoo_web_page_results(page, refresh=refresh).items():
+            if isinstance(data, Exception):
+                self.logger.warning(f"Failed to read {name} of {self.ticker}: {data}")
+                continue
+            tables[name] = data.copy()
 
-        for row in table.find("tbody").find_all("tr"):
-            data = [item.text for item in row.find_all("td")]
-            data_df.loc[len(data_df)] = data
+        return tables
 
-        return data_df.set_index("")
+    def _yahoo_web_page_table(self, page: str, name: str) -> pd.DataFrame:
+        """
+        Get one table of the analysis or key statistics page, raising the error
+        met while building it, if any
+        """
+        data = self._yahoo_web_page_results(page, [name])[name]
+        if isinstance(data, Exception):
+            raise data
 
-    @property
-    def yahoo_web_financial_highlights(self) -> pd.DataFrame:
+        return data.copy()
+
+    def _yahoo_web_page_results(
+        self, page: str, names: Union[List[str], None] = None, refresh: bool = False
+    ) -> Dict[str, Union[pd.DataFrame, Exception]]:
         """
-        Get financial highlights for the ticker
+        Get tables of the analysis or key statistics page, all of them by default.
+        The tables are kept on the ticker per ticker and page and only the ones
+        not kept yet are built, from one fetch of the page. A table missing from
+        the page is kept as the error raised while building it, other errors,
+        e.g. of the request, are raised and nothing is kept for the table
+        """
+        if not hasattr(self, "yahoo_web_page_results"):
+            self.yahoo_web_page_results = {}
+        results = self.yahoo_web_page_results.setdefault((self.ticker, page), {})
+        if refresh:
+            results.clear()
+
+        if page == "analysis":
+            tables, build = list(ANALYSIS_TABLES), self._analysis_table
+        else:
+            tables, build = KEY_STATISTICS_TABLES, self._key_statistics_table
+        url = self.dataset_url(f"yahoo_web_{tables[0]}")
+        names = tables if names is None else names
+
+        missing = [name for name in names if name not in results]
+        # the page is fetched once for the embedded JSON and the document, which
+        # the tables served by the embedded JSON do not need, so it is only parsed
+        # as a whole when several tables are all read from it
+        page_context = (
+            self.shared_page(url, whole=len(missing) > 1 and not self.use_embedded_json)
+            if missing
+            else nullcontext()
+        )
+        with page_context:
+            for name in missing:
+                try:
+                    results[name] = build(url, name)
+                except MISSING_TABLE_ERRORS as error:
+                    # raised when the table is read on its own, logged otherwise
+                    results[name] = error
 
-        Returns:
-        pd.DataFrame: A pandas DataFrame including the financial highlights
+        return {name: results[name] for name in names}
+
+    def _analysis_table(self, url: str, name: str) -> pd.DataFrame:
+        """
+        Build a table of the analysis page from the embedded JSON, or from the
+        section of the page holding it
         """
+        testid = ANALYSIS_TABLES[name]
+        if name == "earnings_history":
+            data = self._embedded_earnings_history(url)
+        elif name == "growth_estimates":
+            # growth estimates are not part of the earningsTrend module
+            data = None
+        else:
+            data = self._embedded_trend_table(url, testid)
+        if data is not None:
+            return data
+
+        # Parse only the region of the page that is read
+        soup = self.get_soup(url, parse_only=SoupStrainer("section", {"data-testid": testid}))
+        section = soup.find("section", {"data-testid": testid})
+        if section is None:
+            raise NoDataError(f"There is no {name} data for the ticker {self.ticker}")
+
+        return table_to_dataframe(section.find("table"))
+
+    def _key_statistics_table(self, url: str, name: str) -> pd.DataFrame:
+        """
+        Build a table of the key statistics page from the embedded JSON, or from
+        the section of the page holding it
+        """
+        if name == "valuation_measures":
+            # Parse the HTML content of the website
+            soup = self.get_soup(url)
 
-        check_security_type(security_type=self.security_type, valid_types=["stock"])
+            # find element with test Valuation Measures
+            heading = self.find_parent_by_text(soup, "h3", "Valuation Measures")
+            if heading is None:
+                raise NoDataError(f"There is no {name} data for the ticker {self.ticker}")
+            parent_section = heading.parent.parent
 
-        # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/key-statistics"
-        response = self.get_response(url)
+            return table_to_dataframe(parent_section.find("table")).set_index("")
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        data = self._embedded_key_statistics(url, name)
+        if data is not None:
+            return data
 
+        # Parse only the region of the page that is read
+        soup = self.get_soup(
+            url, parse_only=SoupStrainer("div", {"data-testid": "stats-highlight"})
+        )
+
+        # financial highlights are in the first column, trading information in the
+        # second
         raw_data = soup.find("div", {"data-testid": "stats-highlight"}).find_all(
             "section", recursive=False
-        )[0]
-        data_df = pd.DataFrame(columns=["Criteria", "Value"])
+        )[KEY_STATISTICS_TABLES.index(name) - 1]
+
+        return self._stats_highlight_table(raw_data)
+
+    @property
+    @typed_table
+    def yahoo_web_valuation_measures(self) -> pd.DataFrame:
+        """
+        Get valuation measures for the ticker
+
+        Returns:
+        pd.DataFrame: A pandas DataFrame including the valuation measures
+        visible in the Yahoo Finance statistics page for the ticker
+        """
+        check_security_type(security_type=self.security_type, valid_types=["stock"])
+
+        return self._yahoo_web_page_table("key-statistics", "valuation_measures")
+
+    @property
+    @typed_table
+    def yahoo_web_financial_highlights(self) -> pd.DataFrame:
+        """
+        Get financial highlights for the ticker
 
-        sections = raw_data.find_all("section")
-        for section in sections:
-            for row in section.find("table").find("tbody").find_all("tr"):
-                data = [item.text.strip() for item in row.find_all("td")]
-                data_df.loc[len(data_df)] = data
+        Returns:
+        pd.DataFrame: A pandas DataFrame including the financial highlights
+        """
+        check_security_type(security_type=self.security_type, valid_types=["stock"])
 
-        return data_df.set_index("Criteria")
+        return self._yahoo_web_page_table("key-statistics", "financial_highlights")
 
     @property
+    @typed_table
     def yahoo_web_trading_information(self) -> pd.DataFrame:
         """
         Get trading information for the ticker
@@ -478,25 +975,26 @@ class YahooWeb(TickerBase):
         """
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
-        # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/key-statistics"
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        raw_data = soup.find("div", {"data-testid": "stats-highlight"}).find_all(
-            "section", recursive=False
-        )[1]
-        data_df = pd.DataFrame(columns=["Criteria", "Value"])
+        return self._yahoo_web_page_table("key-statistics", "trading_information")
 
-        sections = raw_data.find_all("section")
-        for section in sections:
-            for row in section.find("table").find("tbody").find_all("tr"):
-                data = [item.text.strip() for item in row.find_all("td")]
-                data_df.loc[len(data_df)] = data
+    def _stats_highlight_table(self, raw_data: Tag) -> pd.DataFrame:
+        """
+        Concatenate the tables of the sections of a stats highlight column,
+        e.g. "Profitability" and "Management Effectiveness"
+        """
+        tables = [
+            table_to_dataframe(
+                section.find("table"),
+                header=None,
+                columns=["Criteria", "Value"],
+                strip=True,
+            )
+            for section in raw_data.find_all("section")
+        ]
+        if not tables:
+            return pd.DataFrame(columns=["Criteria", "Value"]).set_index("Criteria")
 
-        return data_df.set_index("Criteria")
+        return pd.concat(tables, ignore_index=True).set_index("Criteria")
 
     @property
     def yahoo_web_full_name(self) -> str:
@@ -510,11 +1008,10 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/"
-        response = self.get_response(url)
+        url = self.dataset_url("yahoo_web_full_name")
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        # Parse only the region of the page that is read
+        soup = self.get_soup(url, parse_only=SoupStrainer("h1"))
 
         header = self.find_parent_by_text(soup, "h1", f"({self.ticker})")
 
@@ -522,6 +1019,7 @@ class YahooWeb(TickerBase):
         return re.findall(r"[\w\s]+", header.text)[0]
 
     @property
+    @typed_table
     def yahoo_web_earnings_estimate(self) -> pd.DataFrame:
         """
         Get earnings estimate for the ticker
@@ -533,29 +1031,10 @@ class YahooWeb(TickerBase):
         """
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
-        # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/analysis"
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        section = soup.find("section", {"data-testid": "earningsEstimate"})
-
-        # find thead and tbody
-        table = section.find("table")
-
-        headers = [item.text for item in table.find("thead").find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find("tbody").find_all("tr")
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return self._yahoo_web_page_table("analysis", "earnings_estimate")
 
     @property
+    @typed_table
     def yahoo_web_revenue_estimate(self) -> pd.DataFrame:
         """
         Get revenue estimate for the ticker
@@ -565,32 +1044,12 @@ class YahooWeb(TickerBase):
         pd.DataFrame: A pandas DataFrame including the revenue estimate
         visible in the Yahoo Finance statistics page for the ticker
         """
-
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
-        # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/analysis"
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        section = soup.find("section", {"data-testid": "revenueEstimate"})
-
-        # find thead and tbody
-        table = section.find("table")
-
-        headers = [item.text for item in table.find("thead").find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find("tbody").find_all("tr")
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return self._yahoo_web_page_table("analysis", "revenue_estimate")
 
     @property
+    @typed_table
     def yahoo_web_earnings_history(self) -> pd.DataFrame:
         """
         Get earnings history for the ticker
@@ -600,32 +1059,12 @@ class YahooWeb(TickerBase):
         pd.DataFrame: A pandas DataFrame including the earnings history
         visible in the Yahoo Finance statistics page for the ticker
         """
-
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
-        # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/analysis"
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        section = soup.find("section", {"data-testid": "earningsHistory"})
-
-        # find thead and tbody
-        table = section.find("table")
-
-        headers = [item.text for item in table.find("thead").find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find("tbody").find_all("tr")
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return self._yahoo_web_page_table("analysis", "earnings_history")
 
     @property
+    @typed_table
     def yahoo_web_eps_trend(self) -> pd.DataFrame:
         """
         Get EPS trend for the ticker
@@ -635,32 +1074,12 @@ class YahooWeb(TickerBase):
         pd.DataFrame: A pandas DataFrame including the EPS trend
         visible in the Yahoo Finance statistics page for the ticker
         """
-
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
-        # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/analysis"
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        section = soup.find("section", {"data-testid": "epsTrend"})
-
-        # find thead and tbody
-        table = section.find("table")
-
-        headers = [item.text for item in table.find("thead").find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find("tbody").find_all("tr")
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return self._yahoo_web_page_table("analysis", "eps_trend")
 
     @property
+    @typed_table
     def yahoo_web_eps_revisions(self) -> pd.DataFrame:
         """
         Get EPS revisions for the ticker
@@ -670,32 +1089,12 @@ class YahooWeb(TickerBase):
         pd.DataFrame: A pandas DataFrame including the EPS revisions
         visible in the Yahoo Finance statistics page for the ticker
         """
-
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
-        # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/analysis"
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        section = soup.find("section", {"data-testid": "epsRevisions"})
-
-        # find thead and tbody
-        table = section.find("table")
-
-        headers = [item.text for item in table.find("thead").find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find("tbody").find_all("tr")
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return self._yahoo_web_page_table("analysis", "eps_revisions")
 
     @property
+    @typed_table
     def yahoo_web_growth_estimates(self) -> pd.DataFrame:
         """
         Get growth estimates for the ticker
@@ -705,27 +1104,6 @@ class YahooWeb(TickerBase):
         pd.DataFrame: A pandas DataFrame including the growth estimates
         visible in the Yahoo Finance statistics page for the ticker
         """
-
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
-        # URL of the website to scrape
-        url = f"https://finance.yahoo.com/quote/{self.ticker}/analysis"
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        section = soup.find("section", {"data-testid": "growthEstimate"})
-
-        # find thead and tbody
-        table = section.find("table")
-
-        headers = [item.text for item in table.find("thead").find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find("tbody").find_all("tr")
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return self._yahoo_web_page_table("analysis", "growth_estimates")
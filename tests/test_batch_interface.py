@@ -0,0 +1,113 @@
+"""
+Module to test the BatchInterface class
+"""
+
+import os
+
+import pandas as pd
+import pytest
+import requests
+
+from stockdex.deadline import Deadline
+from stockdex.exceptions import DeadlineExceeded
+from stockdex.tickers import Tickers
+
+skip_test = bool(os.getenv("SKIP_TEST"))
+
+
+@pytest.mark.parametrize(
+    "tickers, datasets",
+    [
+        (["AAPL", "MSFT"], ["yahoo_web_major_holders", "yahoo_web_key_executives"]),
+        (["GOOGL"], ["yahoo_web_earnings_estimate", "yahoo_web_revenue_estimate"]),
+    ],
+)
+def test_scrape(tickers, datasets):
+    tickers = Tickers(tickers=tickers)
+    results = tickers.scrape(datasets, parse_workers=2)
+
+    assert len(results) == len(tickers.tickers) * len(datasets)
+    for result in results.values():
+        assert isinstance(result, pd.DataFrame)
+        assert result.shape[0] > 0
+
+
+@pytest.mark.skipif(skip_test, reason="Skipping in GH action as it throws error 403")
+def test_scrape_digrin():
+    tickers = Tickers(tickers=["AAPL", "CAT"])
+    results = tickers.scrape(["digrin_price", "digrin_dividend"])
+
+    for result in results.values():
+        assert isinstance(result, pd.DataFrame)
+        assert result.shape[0] > 0
+
+
+def test_scrape_offline(monkeypatch):
+    tickers = Tickers(tickers=["AAPL", "MSFT"])
+    requested = []
+
+    def get_response(url, deadline=None):
+        requested.append(url)
+        response = requests.Response()
+        response._content = b'<html><body><td data-test="PREV_CLOSE-value">1.5</td></body></html>'
+        response.status_code = 200
+        return response
+
+    monkeypatch.setattr(tickers, "get_response", get_response)
+
+    # the pages are fetched here and parsed in spawned processes
+    results = tickers.scrape(["yahoo_web_summary"], parse_workers=2)
+    assert sorted(requested) == [
+        "https://finance.yahoo.com/quote/AAPL",
+        "https://finance.yahoo.com/quote/MSFT",
+    ]
+    for ticker in ["AAPL", "MSFT"]:
+        assert results[(ticker, "yahoo_web_summary")].loc["PREV_CLOSE"].tolist() == ["1.5"]
+
+
+def test_scrape_wrong_dataset():
+    tickers = Tickers(tickers=["AAPL"])
+    with pytest.raises(ValueError):
+        tickers.scrape(["yahoo_api_price"])
+
+
+@pytest.mark.parametrize(
+    "tickers, datasets",
+    [
+        (["AAPL", "MSFT", "GOOGL"], [("yahoo_api_price", {"range": "5d"})]),
+        (["AAPL", "NVDA"], ["yahoo_web_major_holders", "yahoo_api_fundamentals"]),
+    ],
+)
+def test_iter_datasets(tickers, datasets):
+    tickers = Tickers(tickers=tickers)
+
+    results = list(tickers.iter_datasets(datasets, max_workers=2, max_in_flight=2))
+
+    assert len(results) == len(tickers.tickers) * len(datasets)
+    for ticker, dataset, result in results:
+        assert ticker in tickers.tickers
+        assert not isinstance(result, Exception)
+
+
+def test_iter_datasets_error():
+    tickers = Tickers(tickers=["AAPL"])
+
+    ticker, dataset, result = next(tickers.iter_datasets(["not_a_dataset"]))
+
+    assert (ticker, dataset) == ("AAPL", "not_a_dataset")
+    assert isinstance(result, AttributeError)
+
+
+def test_iter_datasets_deadline():
+    tickers = Tickers(tickers=["AAPL", "MSFT"])
+    deadline = Deadline()
+    deadline.cancel()
+
+    results = list(tickers.iter_datasets(["digrin_price"], deadline=deadline))
+
+    assert [(ticker, dataset) for ticker, dataset, _ in results] == [
+        ("AAPL", "digrin_price"),
+        ("MSFT", "digrin_price"),
+    ]
+    for _, _, result in results:
+        assert isinstance(result, DeadlineExceeded)
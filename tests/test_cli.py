@@ -0,0 +1,73 @@
+"""
+Module to test the stockdex command line interface
+"""
+
+import json
+
+import pytest
+
+from stockdex.cli import JOURNAL_FILE, main, read_journal, read_symbols
+
+
+def test_read_symbols(tmp_path):
+    path = tmp_path / "universe.txt"
+    path.write_text("# large caps\nAAPL\nMSFT  # software\n\nAAPL\n")
+
+    assert read_symbols(str(path)) == ["AAPL", "MSFT"]
+
+
+def test_read_journal_ignores_truncated_line(tmp_path):
+    path = tmp_path / JOURNAL_FILE
+    path.write_text(
+        json.dumps({"symbol": "AAPL", "dataset": "digrin_price", "status": "done"})
+        + "\n"
+        + json.dumps({"symbol": "MSFT", "dataset": "digrin_price", "status": "failed"})
+        + "\n"
+        + '{"symbol": "GOOGL", "data'
+    )
+
+    assert read_journal(str(path)) == {("AAPL", "digrin_price")}
+
+
+def test_fetch_resumes_from_journal(tmp_path):
+    symbols = tmp_path / "universe.txt"
+    symbols.write_text("AAPL\nMSFT\n")
+    out = tmp_path / "data"
+    out.mkdir()
+    (out / JOURNAL_FILE).write_text(
+        json.dumps({"symbol": "AAPL", "dataset": "not_a_dataset", "status": "done"}) + "\n"
+    )
+
+    argv = ["fetch", "--symbols", str(symbols), "--datasets", "not_a_dataset"]
+    argv += ["--out", str(out), "--format", "csv"]
+
+    # only MSFT runs and fails, AAPL was completed by the previous run
+    assert main(argv) == 1
+
+    entries = [json.loads(line) for line in (out / JOURNAL_FILE).read_text().splitlines()]
+    assert [(entry["symbol"], entry["status"]) for entry in entries] == [
+        ("AAPL", "done"),
+        ("MSFT", "failed"),
+    ]
+
+
+def test_fetch_appends_after_truncated_line(tmp_path):
+    symbols = tmp_path / "universe.txt"
+    symbols.write_text("AAPL\n")
+    out = tmp_path / "data"
+    out.mkdir()
+    (out / JOURNAL_FILE).write_text('{"symbol": "AAPL", "data')
+
+    argv = ["fetch", "--symbols", str(symbols), "--datasets", "not_a_dataset"]
+    argv += ["--out", str(out), "--format", "csv"]
+    assert main(argv) == 1
+
+    # the new entry starts on its own line, only the truncated one is unreadable
+    lines = (out / JOURNAL_FILE).read_text().splitlines()
+    assert lines[0] == '{"symbol": "AAPL", "data'
+    assert [json.loads(line)["status"] for line in lines[1:]] == ["failed"]
+
+
+def test_fetch_requires_arguments():
+    with pytest.raises(SystemExit):
+        main(["fetch", "--symbols", "universe.txt"])
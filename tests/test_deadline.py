@@ -0,0 +1,80 @@
+"""
+Module to test the Deadline class
+"""
+
+import threading
+import time
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from stockdex import selenium_interface as selenium_module
+from stockdex.deadline import Deadline
+from stockdex.exceptions import DeadlineExceeded
+
+
+def test_deadline_expires():
+    deadline = Deadline(timeout=0.05)
+
+    assert not deadline.expired
+    assert deadline.timeout(10) <= 0.05
+
+    time.sleep(0.06)
+
+    assert deadline.expired
+    assert deadline.remaining() == 0.0
+    with pytest.raises(DeadlineExceeded):
+        deadline.check()
+
+
+def test_deadline_without_timeout():
+    deadline = Deadline()
+
+    assert deadline.remaining() is None
+    assert deadline.timeout(10) == 10
+
+    deadline.cancel()
+
+    assert deadline.expired
+    with pytest.raises(DeadlineExceeded):
+        deadline.timeout(10)
+
+
+def test_cancel_interrupts_sleep():
+    deadline = Deadline()
+    threading.Timer(0.05, deadline.cancel).start()
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        deadline.sleep(5)
+
+    assert time.monotonic() - start < 1
+
+
+class TimingOutDriver:
+    def __init__(self, options=None):
+        pass
+
+    def set_page_load_timeout(self, timeout):
+        pass
+
+    def get(self, url):
+        time.sleep(0.06)
+        raise TimeoutException()
+
+    def quit(self):
+        pass
+
+
+def test_render_timeout(monkeypatch):
+    monkeypatch.setattr(selenium_module.webdriver, "Chrome", TimingOutDriver)
+    interface = selenium_module.selenium_interface()
+
+    # timeouts of renders without an expired deadline are not deadline errors
+    with pytest.raises(TimeoutException):
+        interface.get_html_content("https://example.com")
+    with pytest.raises(TimeoutException):
+        interface.get_html_content("https://example.com", deadline=Deadline(timeout=5))
+
+    with pytest.raises(DeadlineExceeded):
+        interface.get_html_content("https://example.com", deadline=Deadline(timeout=0.05))
@@ -0,0 +1,56 @@
+"""
+Module to test the JustETFBulk class
+"""
+
+import pandas as pd
+import pytest
+
+from stockdex.exceptions import NoISINError, WrongSecurityType
+from stockdex.tickers import Tickers
+
+
+@pytest.mark.parametrize(
+    "isins",
+    [
+        (["IE00B4L5Y983", "IE00B53SZB19"]),
+        (["IE00B5BMR087"]),
+    ],
+)
+def test_justetf_bulk(isins):
+    etfs = Tickers(isins=isins, security_type="etf")
+    results = etfs.justetf_bulk()
+
+    assert set(results) == {
+        "general_info",
+        "basics",
+        "holdings_companies",
+        "holdings_countries",
+        "holdings_sectors",
+    }
+    for data in results.values():
+        assert isinstance(data, pd.DataFrame)
+        assert set(data.index) == set(isins)
+
+    assert results["general_info"].shape[0] == len(isins)
+    assert "shares in percent" in results["holdings_countries"].columns
+
+
+def test_justetf_bulk_wrong_security_type():
+    etfs = Tickers(isins=["IE00B4L5Y983"], security_type="stock")
+
+    with pytest.raises(WrongSecurityType):
+        etfs.justetf_bulk()
+
+
+def test_justetf_bulk_without_isins():
+    etfs = Tickers(tickers=["AAPL"], security_type="etf")
+
+    with pytest.raises(NoISINError):
+        etfs.justetf_bulk()
+
+
+def test_justetf_bulk_wrong_dataset():
+    etfs = Tickers(isins=["IE00B4L5Y983"], security_type="etf")
+
+    with pytest.raises(ValueError):
+        etfs.justetf_bulk(datasets=["not_a_dataset"])
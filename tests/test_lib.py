@@ -6,9 +6,20 @@ import os
 import threading
 import time
 
+import numpy as np
+import pandas as pd
 import pytest
+from bs4 import BeautifulSoup
 
-from stockdex.lib import plot_multiple_categories
+from stockdex.lib import (
+    dates_dataframe,
+    numeric_dataframe,
+    parse_dates,
+    parse_numeric,
+    plot_multiple_categories,
+    table_to_dataframe,
+    write_output,
+)
 from stockdex.ticker import Ticker
 
 skip_test = bool(os.getenv("SKIP_TEST", False))
@@ -112,3 +123,155 @@ def test_complex_macrotrends_plot(ticker):
     # Allow the Dash app to run for a short duration (e.g., 5 seconds)
     print("Waiting for Dash app to run for 10 seconds")
     time.sleep(10)
+
+
+TABLE_HTML = (
+    "<html><body><table>"
+    '<thead><tr class="title"><th>Earnings</th></tr></thead>'
+    '<thead><tr class="table__header"><th>Quarter</th><th>EPS</th></tr></thead>'
+    "<tbody><tr><th>Q1</th><td> 1.2 </td></tr><tr><th>Q2</th><td>1.4</td></tr>"
+    "<tr></tr></tbody>"
+    "</table></body></html>"
+)
+
+
+@pytest.mark.parametrize("parser", ["html.parser", "lxml"])
+def test_table_to_dataframe(parser):
+    if parser == "lxml":
+        lxml_html = pytest.importorskip("lxml.html")
+        table = lxml_html.fromstring(TABLE_HTML).xpath("//table")[0]
+    else:
+        table = BeautifulSoup(TABLE_HTML, parser).find("table")
+
+    data = table_to_dataframe(table, header_position=1, cells=("th", "td"))
+    assert data.columns.tolist() == ["Quarter", "EPS"]
+    assert data.values.tolist() == [["Q1", " 1.2 "], ["Q2", "1.4"]]
+
+    # the header is found by its class
+    data = table_to_dataframe(table, header="tr.table__header", cells=("th", "td"))
+    assert data.columns.tolist() == ["Quarter", "EPS"]
+
+    # the rows without td cells are skipped
+    data = table_to_dataframe(table, header=None, body=None, strip=True)
+    assert data.values.tolist() == [["1.2"], ["1.4"]]
+
+    data = table_to_dataframe(table, header=None, columns=["value"])
+    assert data["value"].tolist() == [" 1.2 ", "1.4"]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1.23B", 1.23e9),
+        ("2.1 T", 2.1e12),
+        ("15.87 million", 15.87e6),
+        ("5 thousand", 5e3),
+        ("1.5 Thousand", 1.5e3),
+        ("3.2 Billion", 3.2e9),
+        ("2.1 trillion", 2.1e12),
+        ("2.1 TRILLION", 2.1e12),
+        ("-0.5K", -500.0),
+        ("12.5%", 12.5),
+        ("(1,234)", -1234.0),
+        ("$182.30", 182.3),
+        ("\u20ac1,000.5", 1000.5),
+        ("--", np.nan),
+        ("N/A", np.nan),
+        ("Apple Inc.", np.nan),
+        (None, np.nan),
+    ],
+)
+def test_parse_numeric(value, expected):
+    parsed = parse_numeric(pd.Series([value], name="value"))
+    assert parsed.name == "value"
+    np.testing.assert_equal(parsed.iloc[0], expected)
+
+
+def test_numeric_dataframe():
+    data = pd.DataFrame(
+        {
+            "Holder": ["Vanguard", "BlackRock"],
+            "Shares": ["1.3B", "--"],
+            "Date": ["Dec 31, 2023", "1"],
+        }
+    )
+
+    # only the columns holding numbers apart from missing markers are converted
+    converted = numeric_dataframe(data)
+    assert converted["Shares"].tolist()[0] == 1.3e9
+    assert np.isnan(converted["Shares"].tolist()[1])
+    assert converted["Holder"].tolist() == ["Vanguard", "BlackRock"]
+    assert converted["Date"].tolist() == ["Dec 31, 2023", "1"]
+    assert data["Shares"].tolist() == ["1.3B", "--"]
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        (
+            ["Dec. 31, 2023", "Sept. 30, 2023", "March 31, 2023"],
+            ["2023-12-31", "2023-09-30", "2023-03-31"],
+        ),
+        (["12/31/2023", "9/30/2023", "--"], ["2023-12-31", "2023-09-30", None]),
+        (["2023-12-31", "N/A"], ["2023-12-31", None]),
+        (["Dec 2024", "Mar 2025"], ["2024-12-01", "2025-03-01"]),
+        # the dates not matching the format of the first one are tried with the others
+        (["Dec. 31, 2023", "2023-09-30", "1"], ["2023-12-31", "2023-09-30", None]),
+        (["Apple Inc."], [None]),
+    ],
+)
+def test_parse_dates(values, expected):
+    parsed = parse_dates(pd.Series(values))
+    assert pd.api.types.is_datetime64_any_dtype(parsed)
+    assert parsed.tolist() == [pd.Timestamp(value) if value else pd.NaT for value in expected]
+
+
+@pytest.mark.parametrize(
+    "today, expected",
+    [
+        ("2026-10-19", ["2026-03-31", "2025-12-31", "2026-10-19"]),
+        ("2027-01-10", ["2026-03-31", "2026-12-31", "2026-10-19"]),
+        ("2028-03-01", ["2027-03-31", "2027-12-31", "2027-10-19"]),
+    ],
+)
+def test_parse_dates_without_year(monkeypatch, today, expected):
+    monkeypatch.setattr(pd.Timestamp, "today", classmethod(lambda cls: pd.Timestamp(today)))
+
+    # the year is the one of the most recent occurrence, up to today
+    parsed = parse_dates(pd.Series(["March 31", "Dec. 31", "19 Oct", "--"]))
+    assert parsed.tolist() == [pd.Timestamp(date) for date in expected] + [pd.NaT]
+
+
+def test_parse_dates_without_year_leap_day(monkeypatch):
+    monkeypatch.setattr(pd.Timestamp, "today", classmethod(lambda cls: pd.Timestamp("2028-03-01")))
+
+    assert parse_dates(pd.Series(["Feb 29"])).tolist() == [pd.Timestamp("2028-02-29")]
+
+
+def test_dates_dataframe():
+    data = pd.DataFrame(
+        {
+            "2023-12-31": ["Dec. 31, 2023", "1.2B"],
+            "2022-12-31": ["Sept. 30, 2022", "1"],
+        },
+        index=["Date", "Revenue"],
+    ).T
+
+    # the date columns and the date column names are converted, other columns are not
+    converted = dates_dataframe(data)
+    assert converted["Date"].tolist() == [
+        pd.Timestamp("2023-12-31"),
+        pd.Timestamp("2022-09-30"),
+    ]
+    assert converted["Revenue"].tolist() == ["1.2B", "1"]
+    assert isinstance(dates_dataframe(data.T).columns, pd.DatetimeIndex)
+
+
+def test_write_output(tmp_path):
+    data = pd.DataFrame({2023: [1.0], 2024: [2.0]}, index=["revenue"])
+
+    path = write_output(data, str(tmp_path), "AAPL", "digrin_price", "csv")
+
+    assert path == os.path.join(str(tmp_path), "digrin_price", "AAPL.csv")
+    assert list(pd.read_csv(path, index_col=0).columns) == ["2023", "2024"]
+    assert not os.path.exists(f"{path}.tmp")
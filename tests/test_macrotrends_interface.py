@@ -2,6 +2,7 @@ import os
 
 import pandas as pd
 import pytest
+from bs4 import BeautifulSoup
 
 from stockdex.ticker import Ticker
 
@@ -212,3 +213,28 @@ def test_plot_macrotrends_balance_sheet(ticker, group_by):
 def test_plot_macrotrends_cash_flow(ticker, group_by):
     ticker = Ticker(ticker=ticker)
     ticker.plot_macrotrends_cash_flow(group_by=group_by)
+
+
+def test_macrotrends_find_table_in_url():
+    script = (
+        "var originalData = ["
+        '{"field_name":"<a href=\'/stocks/charts/PANW/revenue\'>Revenue<\\/a>",'
+        '"popup_icon":"<div><\\/div>","2024-07-31":"8027.50000","2023-07-31":""},'
+        '{"field_name":"<a href=\'/stocks/charts/PANW/net-income\'>Net Income\\/Loss<\\/a>",'
+        '"popup_icon":"<div><\\/div>","2024-07-31":"2,577.70000","2023-07-31":null},'
+        '{"field_name":"Shares Buyback","popup_icon":"","2024-07-31":0,"2023-07-31":"-"}'
+        "];"
+    )
+    soup = BeautifulSoup(
+        f"<html><body><div>Revenue<script>{script}</script></div></body></html>",
+        "html.parser",
+    )
+
+    data = Ticker(ticker="PANW")._find_table_in_url("Revenue", soup)
+
+    assert list(data.index) == ["Revenue", "Net Income/Loss", "Shares Buyback"]
+    assert list(data.columns) == ["2024-07-31", "2023-07-31"]
+    assert (data.dtypes == "float64").all()
+    assert data.loc["Net Income/Loss", "2024-07-31"] == 2577.7
+    assert data.loc["Shares Buyback", "2024-07-31"] == 0
+    assert data["2023-07-31"].isna().all()
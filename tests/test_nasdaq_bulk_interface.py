@@ -0,0 +1,51 @@
+"""
+Module to test the NASDAQBulk class
+"""
+
+import pandas as pd
+import pytest
+
+from stockdex.exceptions import WrongSecurityType
+from stockdex.tickers import Tickers
+
+pytestmark = pytest.mark.skip(
+    reason="""Skip the entire module as nasdaq is
+              not supported anymore due to nasdaq
+              website changes"""
+)
+
+
+@pytest.mark.parametrize(
+    "tickers",
+    [
+        (["AAPL", "MSFT"]),
+        (["GOOGL"]),
+    ],
+)
+def test_nasdaq_bulk_earnings(tickers):
+    stocks = Tickers(tickers=tickers)
+    results = stocks.nasdaq_bulk_earnings()
+
+    assert set(results) == {
+        "quarterly_earnings_surprise",
+        "yearly_earnings_forecast",
+        "quarterly_earnings_forecast",
+    }
+    for data in results.values():
+        assert isinstance(data, pd.DataFrame)
+        assert list(data.columns) == ["symbol", "period", "field", "value"]
+        assert set(data["symbol"]) == set(tickers)
+
+
+def test_nasdaq_bulk_earnings_wrong_security_type():
+    etfs = Tickers(tickers=["SPY"], security_type="etf")
+
+    with pytest.raises(WrongSecurityType):
+        etfs.nasdaq_bulk_earnings()
+
+
+def test_nasdaq_bulk_earnings_wrong_table():
+    stocks = Tickers(tickers=["AAPL"])
+
+    with pytest.raises(ValueError):
+        stocks.nasdaq_bulk_earnings(tables=["not_a_table"])
@@ -0,0 +1,102 @@
+"""
+Module to test the RequestScheduler class
+"""
+
+import threading
+import time
+
+import pytest
+
+from stockdex.deadline import Deadline
+from stockdex.exceptions import DeadlineExceeded
+from stockdex.scheduler import RequestScheduler
+from stockdex.worker import SQLiteTokenBucket
+
+
+def test_max_concurrency_per_host():
+    scheduler = RequestScheduler(max_concurrency={"finance.yahoo.com": 2})
+    running, peak = [0], [0]
+    lock = threading.Lock()
+
+    def request():
+        with scheduler.slot("https://finance.yahoo.com/quote/AAPL"):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 2
+    assert scheduler.stats().loc[("finance.yahoo.com", "interactive"), "served"] == 8
+
+
+def test_interactive_served_before_bulk():
+    scheduler = RequestScheduler(default_max_concurrency=1)
+    url = "https://www.digrin.com/stocks/detail/AAPL"
+    order = []
+
+    # hold the only slot so that all other requests queue up
+    host = scheduler.acquire(url)
+
+    def request(priority):
+        with scheduler.slot(url, priority):
+            order.append(priority)
+
+    threads = [threading.Thread(target=request, args=("bulk",)) for _ in range(3)]
+    threads += [threading.Thread(target=request, args=("interactive",))]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.01)
+
+    assert scheduler.stats().loc[(host, "bulk"), "queued"] == 3
+
+    scheduler.release(host)
+    for thread in threads:
+        thread.join()
+
+    assert order == ["interactive", "bulk", "bulk", "bulk"]
+
+
+def test_politeness_delay():
+    scheduler = RequestScheduler(politeness_delay={"www.digrin.com": 0.1})
+    started = []
+
+    for _ in range(3):
+        with scheduler.slot("https://www.digrin.com/stocks/detail/AAPL", "bulk"):
+            started.append(time.monotonic())
+
+    assert started[1] - started[0] >= 0.1
+    assert started[2] - started[1] >= 0.1
+
+
+def test_deadline_leaves_queue():
+    scheduler = RequestScheduler(default_max_concurrency=1)
+    url = "https://www.digrin.com/stocks/detail/AAPL"
+
+    # hold the only slot so that the request with a deadline cannot start
+    host = scheduler.acquire(url)
+
+    with pytest.raises(DeadlineExceeded):
+        scheduler.acquire(url, "bulk", Deadline(timeout=0.05))
+
+    assert scheduler.stats()["queued"].sum() == 0
+    scheduler.release(host)
+
+
+def test_rate_limits_take_tokens(tmp_path):
+    bucket = SQLiteTokenBucket(str(tmp_path / "jobs.db"), "www.digrin.com", rate=20)
+    scheduler = RequestScheduler(rate_limits={"www.digrin.com": bucket})
+
+    start = time.monotonic()
+    for _ in range(3):
+        with scheduler.slot("https://www.digrin.com/stocks/detail/AAPL"):
+            pass
+
+    assert time.monotonic() - start >= 2 / 20 - 0.01
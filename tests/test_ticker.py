@@ -1,7 +1,25 @@
+import importlib.util
+
+import pandas as pd
 import pytest
+import requests
+from bs4 import SoupStrainer
 
+from stockdex.config import SCRAPED_DATASET_URLS
+from stockdex.lib import table_to_dataframe
 from stockdex.ticker import Ticker
 
+# lxml is an optional dependency, its cases are skipped when it is not installed
+PARSERS = [
+    pytest.param(
+        "lxml",
+        marks=pytest.mark.skipif(
+            importlib.util.find_spec("lxml") is None, reason="lxml is not installed"
+        ),
+    ),
+    "html.parser",
+]
+
 
 @pytest.mark.parametrize(
     "ticker, expected_response",
@@ -20,3 +38,174 @@ def test_get_response(ticker, expected_response):
 
     # Check if the response is as expected
     assert response.status_code == expected_response
+
+
+@pytest.mark.parametrize(
+    "ticker, datasets",
+    [
+        (
+            "AAPL",
+            [
+                "yahoo_web_description",
+                "yahoo_web_key_executives",
+                "yahoo_web_corporate_governance",
+            ],
+        ),
+        ("MSFT", ["digrin_price", "digrin_net_income", "digrin_free_cash_flow"]),
+    ],
+)
+def test_fetch(ticker, datasets):
+    ticker = Ticker(ticker=ticker)
+    results = ticker.fetch(datasets)
+
+    assert list(results) == datasets
+    for result in results.values():
+        assert len(result) > 0
+
+    # the prefetched pages are not kept after the call
+    assert ticker.prefetched_responses == {}
+
+
+def test_fetch_wrong_dataset():
+    ticker = Ticker(ticker="AAPL")
+
+    with pytest.raises(ValueError):
+        ticker.fetch(["not_a_dataset"])
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_get_soup_parser(parser):
+    url = "https://finance.yahoo.com/quote/AAPL"
+    response = requests.Response()
+    response._content = b"<html><body><table><tr><td>1</td></tr></table></body></html>"
+    response.status_code = 200
+
+    ticker = Ticker(ticker="AAPL")
+    ticker.html_parser = parser
+    ticker.prefetched_responses = {url: response}
+
+    assert ticker.get_soup(url).find("td").text == "1"
+    assert ticker.get_soup(url).builder.NAME == parser
+
+    # the parser given to the call is used instead of the parser of the ticker
+    ticker.prefetched_soups = {}
+    assert ticker.get_soup(url, parser="html.parser").builder.NAME == "html.parser"
+
+
+def test_get_soup_parse_only():
+    url = "https://finance.yahoo.com/quote/AAPL/profile"
+    response = requests.Response()
+    response._content = (
+        b'<html><body><nav><a href="/">Home</a></nav>'
+        b'<section data-testid="description"><p>Apple Inc.</p></section>'
+        b"</body></html>"
+    )
+    response.status_code = 200
+
+    ticker = Ticker(ticker="AAPL")
+    ticker.prefetched_responses = {url: response}
+
+    # only the declared region is built and the partial document is not shared
+    strainer = SoupStrainer("section", {"data-testid": "description"})
+    soup = ticker.get_soup(url, parse_only=strainer)
+    assert soup.find("nav") is None
+    assert soup.find("p").text == "Apple Inc."
+    assert url not in getattr(ticker, "prefetched_soups", {})
+
+    # a whole document parsed before serves the regions of all datasets
+    assert ticker.yahoo_web_description == "Apple Inc."
+    soup = ticker.get_soup(url)
+    assert ticker.get_soup(url, parse_only=strainer) is soup
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_find_table(parser):
+    url = "https://www.digrin.com/stocks/detail/AAPL/price"
+    response = requests.Response()
+    response._content = (
+        b"<html><body><table><tr><td>Menu</td></tr></table>"
+        b"<table><thead><tr><th>Date</th><th>Adjusted price</th></tr></thead>"
+        b"<tbody><tr><td>2024-01-01</td><td>185.2</td></tr></tbody></table>"
+        b"</body></html>"
+    )
+    response.status_code = 200
+
+    ticker = Ticker(ticker="AAPL")
+    ticker.html_parser = parser
+    ticker.prefetched_responses = {url: response}
+
+    table = ticker.find_table(url, "Adjusted price")
+    assert table_to_dataframe(table).values.tolist() == [["2024-01-01", "185.2"]]
+    assert ticker.digrin_price.columns.tolist() == ["Date", "Adjusted price"]
+    assert ticker.find_table(url, "Split Ratio") is None
+
+
+def test_find_table_parses_once(monkeypatch):
+    lxml_html = pytest.importorskip("lxml.html")
+    url = "https://www.digrin.com/stocks/detail/AAPL/price"
+    response = requests.Response()
+    response._content = (
+        b"<html><body><table><tr><th>Date</th><th>Adjusted price</th></tr></table>"
+        b"<table><tr><th>Date</th><th>Split Ratio</th></tr></table></body></html>"
+    )
+    response.status_code = 200
+
+    parsed = []
+    fromstring = lxml_html.fromstring
+    monkeypatch.setattr(
+        lxml_html, "fromstring", lambda content: parsed.append(url) or fromstring(content)
+    )
+
+    ticker = Ticker(ticker="AAPL")
+    ticker.html_parser = "lxml"
+    ticker.prefetched_responses = {url: response}
+
+    # all tables of a prefetched page are found in one parsed document
+    assert ticker.find_table(url, "Adjusted price") is not None
+    assert ticker.find_table(url, "Split Ratio") is not None
+    assert parsed == [url]
+
+    ticker.release_page(url)
+    assert url not in ticker.prefetched_trees
+
+
+def test_numeric():
+    url = "https://www.digrin.com/stocks/detail/AAPL/price"
+    response = requests.Response()
+    response._content = (
+        b"<html><body><table><thead><tr><th>Date</th><th>Real price</th>"
+        b"<th>Adjusted price</th></tr></thead><tbody>"
+        b"<tr><td>2024-01-01</td><td>$1,185.20</td><td>$184.90</td></tr>"
+        b"</tbody></table></body></html>"
+    )
+    response.status_code = 200
+
+    ticker = Ticker(ticker="AAPL")
+    ticker.prefetched_responses = {url: response}
+    assert ticker.digrin_price["Real price"].tolist() == ["$1,185.20"]
+
+    ticker.numeric = True
+    data = ticker.digrin_price
+    assert data["Real price"].tolist() == [1185.2]
+    assert data["Adjusted price"].tolist() == [184.9]
+    assert data["Date"].tolist() == ["2024-01-01"]
+
+    ticker.dates = True
+    assert ticker.digrin_price["Date"].tolist() == [pd.Timestamp("2024-01-01")]
+
+
+@pytest.mark.parametrize("dataset", list(SCRAPED_DATASET_URLS))
+def test_dataset_url(monkeypatch, dataset):
+    class Fetched(Exception):
+        pass
+
+    def get_response(self, url, *args, **kwargs):
+        raise Fetched(url)
+
+    monkeypatch.setattr(Ticker, "get_response", get_response)
+    ticker = Ticker(ticker="AAPL")
+
+    # each dataset is read from the page its URL template in config points to
+    with pytest.raises(Fetched) as fetched:
+        getattr(ticker, dataset)
+    assert fetched.value.args[0] == SCRAPED_DATASET_URLS[dataset].format(ticker="AAPL")
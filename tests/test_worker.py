@@ -0,0 +1,208 @@
+"""
+Module to test the worker mode with the SQLite and Redis job queues and token buckets
+"""
+
+import time
+
+import pytest
+
+from stockdex.cli import main
+from stockdex.worker import (
+    DirectoryResultSink,
+    RedisJobQueue,
+    RedisTokenBucket,
+    SQLiteJobQueue,
+    SQLiteTokenBucket,
+    TokenBucket,
+    build_jobs,
+    run_worker,
+)
+
+
+@pytest.fixture
+def redis_client():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    return fakeredis.FakeRedis()
+
+
+def test_lease_complete_and_retry(tmp_path):
+    queue = SQLiteJobQueue(str(tmp_path / "jobs.db"), max_attempts=2)
+    queue.push(build_jobs(["AAPL", "MSFT"], [("yahoo_api_price", {"range": "5d"})]))
+
+    first = queue.lease("worker-1")
+    second = queue.lease("worker-2")
+
+    assert (first.symbol, first.kwargs, first.attempts) == ("AAPL", {"range": "5d"}, 1)
+    assert second.symbol == "MSFT"
+    assert queue.lease("worker-3") is None
+
+    queue.complete(first)
+    queue.fail(second, "TimeoutError")
+    assert queue.counts() == {"pending": 1, "leased": 0, "done": 1, "failed": 0}
+
+    # the retry is the last attempt
+    retry = queue.lease("worker-3")
+    assert (retry.symbol, retry.attempts) == ("MSFT", 2)
+    queue.fail(retry, "TimeoutError")
+    assert queue.counts()["failed"] == 1
+
+
+def test_expired_lease_is_retried(tmp_path):
+    queue = SQLiteJobQueue(str(tmp_path / "jobs.db"))
+    queue.push([("AAPL", "digrin_price", None)])
+
+    queue.lease("crashed-worker", lease_seconds=0.01)
+    time.sleep(0.02)
+
+    job = queue.lease("worker-2")
+    assert (job.symbol, job.attempts) == ("AAPL", 2)
+
+
+def test_expired_lease_is_left_to_its_new_holder(tmp_path):
+    queue = SQLiteJobQueue(str(tmp_path / "jobs.db"))
+    queue.push([("AAPL", "digrin_price", None)])
+
+    crashed = queue.lease("crashed-worker", lease_seconds=0.01)
+    time.sleep(0.02)
+    job = queue.lease("worker-2")
+
+    # the former worker no longer holds the lease, it can neither give back nor
+    # complete the job
+    assert not queue.fail(crashed, "TimeoutError")
+    assert not queue.complete(crashed)
+    assert queue.counts() == {"pending": 0, "leased": 1, "done": 0, "failed": 0}
+
+    assert queue.complete(job)
+    assert queue.counts() == {"pending": 0, "leased": 0, "done": 1, "failed": 0}
+
+
+def test_token_bucket_shared_between_connections(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    buckets = [SQLiteTokenBucket(path, "www.digrin.com", rate=20) for _ in range(2)]
+
+    start = time.monotonic()
+    for _ in range(3):
+        for bucket in buckets:
+            bucket.acquire()
+
+    # one token in the bucket, the other five refill at 20 per second
+    assert time.monotonic() - start >= 5 / 20 - 0.01
+
+
+def test_run_worker_marks_failed_jobs(tmp_path):
+    queue = SQLiteJobQueue(str(tmp_path / "jobs.db"), max_attempts=2)
+    queue.push(build_jobs(["AAPL"], ["not_a_dataset"]))
+
+    counts = run_worker(queue, DirectoryResultSink(str(tmp_path), "csv"))
+
+    assert counts == {"done": 0, "failed": 2}
+    assert queue.counts()["failed"] == 1
+    assert queue.failures()["error"][0].startswith("AttributeError")
+
+
+def test_redis_lease_complete_and_retry(redis_client):
+    queue = RedisJobQueue(redis_client, max_attempts=2)
+    queue.push(build_jobs(["AAPL", "MSFT"], [("yahoo_api_price", {"range": "5d"})]))
+
+    first = queue.lease("worker-1")
+    second = queue.lease("worker-2")
+
+    assert (first.symbol, first.kwargs, first.attempts) == ("AAPL", {"range": "5d"}, 1)
+    assert second.symbol == "MSFT"
+    assert queue.lease("worker-3") is None
+
+    queue.complete(first)
+    queue.fail(second, "TimeoutError")
+    assert queue.counts() == {"pending": 1, "leased": 0, "done": 1, "failed": 0}
+
+    # the retry is the last attempt
+    retry = queue.lease("worker-3")
+    assert (retry.symbol, retry.attempts) == ("MSFT", 2)
+    queue.fail(retry, "TimeoutError")
+    assert queue.counts() == {"pending": 0, "leased": 0, "done": 1, "failed": 1}
+
+
+def test_redis_expired_lease_is_retried(redis_client):
+    queue = RedisJobQueue(redis_client)
+    queue.push([("AAPL", "digrin_price", None)])
+
+    crashed = queue.lease("crashed-worker", lease_seconds=0.01)
+    time.sleep(0.02)
+
+    job = queue.lease("worker-2")
+    assert (job.symbol, job.attempts) == ("AAPL", 2)
+
+    # the former worker no longer holds the lease, it can neither give back nor
+    # complete the job
+    assert not queue.fail(crashed, "TimeoutError")
+    assert not queue.complete(crashed)
+    assert queue.counts() == {"pending": 0, "leased": 1, "done": 0, "failed": 0}
+
+    assert queue.complete(job)
+    assert queue.counts() == {"pending": 0, "leased": 0, "done": 1, "failed": 0}
+
+
+def test_redis_expired_lease_out_of_attempts(redis_client):
+    queue = RedisJobQueue(redis_client, max_attempts=1)
+    queue.push([("AAPL", "digrin_price", None)])
+
+    queue.lease("crashed-worker", lease_seconds=0.01)
+    time.sleep(0.02)
+
+    assert queue.lease("worker-2") is None
+    assert queue.counts() == {"pending": 0, "leased": 0, "done": 0, "failed": 1}
+    assert queue.failures()["error"].tolist() == ["lease expired"]
+
+
+def test_redis_token_bucket_shared_between_clients(redis_client):
+    buckets = [RedisTokenBucket(redis_client, "www.digrin.com", rate=20) for _ in range(2)]
+
+    start = time.monotonic()
+    for _ in range(3):
+        for bucket in buckets:
+            bucket.acquire()
+
+    # one token in the bucket, the other five refill at 20 per second
+    assert time.monotonic() - start >= 5 / 20 - 0.01
+
+
+def test_redis_run_worker_marks_failed_jobs(redis_client, tmp_path):
+    queue = RedisJobQueue(redis_client, max_attempts=2)
+    queue.push(build_jobs(["AAPL"], ["not_a_dataset"]))
+
+    counts = run_worker(queue, DirectoryResultSink(str(tmp_path), "csv"))
+
+    assert counts == {"done": 0, "failed": 2}
+    assert queue.counts()["failed"] == 1
+    assert queue.failures()["error"][0].startswith("AttributeError")
+
+
+def test_token_bucket_is_abstract():
+    with pytest.raises(TypeError):
+        TokenBucket()
+
+
+def test_cli_enqueue_and_work(tmp_path):
+    symbols = tmp_path / "universe.txt"
+    symbols.write_text("AAPL\nMSFT\n")
+    queue = str(tmp_path / "jobs.db")
+
+    assert (
+        main(
+            ["enqueue", "--queue", queue, "--symbols", str(symbols)]
+            + ["--datasets", "not_a_dataset"]
+        )
+        == 0
+    )
+    assert SQLiteJobQueue(queue).counts()["pending"] == 2
+
+    argv = ["work", "--queue", queue, "--out", str(tmp_path), "--format", "csv"]
+    assert main(argv + ["--max-attempts", "1"]) == 1
+    assert SQLiteJobQueue(queue).counts()["failed"] == 2
+
+
+def test_cli_wrong_rate_limit(tmp_path):
+    argv = ["work", "--queue", str(tmp_path / "jobs.db"), "--out", str(tmp_path)]
+    with pytest.raises(SystemExit):
+        main(argv + ["--format", "csv", "--rate-limit", "www.digrin.com"])
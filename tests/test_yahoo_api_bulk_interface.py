@@ -0,0 +1,121 @@
+"""
+Module to test the YahooAPIBulk class
+"""
+
+import pandas as pd
+import pytest
+
+from stockdex.exceptions import FieldNotExists
+from stockdex.tickers import Tickers
+
+LARGE_UNIVERSE = [
+    "AAPL",
+    "MSFT",
+    "GOOGL",
+    "AMZN",
+    "NVDA",
+    "META",
+    "TSLA",
+    "BAC",
+    "CAT",
+    "ASML",
+    "PLTR",
+    "JPM",
+    "V",
+    "MA",
+    "KO",
+    "PEP",
+    "XOM",
+    "CVX",
+    "WMT",
+    "DIS",
+    "INTC",
+    "AMD",
+    "ORCL",
+    "IBM",
+    "SAP",
+]
+
+
+@pytest.mark.parametrize(
+    "tickers, range, dataGranularity",
+    [
+        (["AAPL", "MSFT"], "1d", "5m"),
+        (["GOOGL", "NVDA", "SAP"], "1mo", "1d"),
+        # more symbols than fit in a single spark request
+        (LARGE_UNIVERSE, "5d", "1h"),
+    ],
+)
+def test_yahoo_api_bulk_price(tickers, range, dataGranularity):
+    tickers = Tickers(tickers=tickers)
+    price = tickers.yahoo_api_bulk_price(range=range, dataGranularity=dataGranularity)
+
+    assert price.columns.tolist() == ["symbol", "timestamp", "close"]
+    assert set(price["symbol"]) == set(tickers.tickers)
+
+
+def test_build_price_panel():
+    tickers = Tickers(tickers=["AAPL", "MSFT"])
+    results = [
+        {
+            "symbol": "AAPL",
+            "response": [
+                {
+                    "timestamp": [1700000000, 1700000060],
+                    "indicators": {"quote": [{"close": [190.5, None]}]},
+                }
+            ],
+        },
+        {
+            "symbol": "MSFT",
+            "response": [
+                {"timestamp": [1700000000], "indicators": {"quote": [{"close": [370.0]}]}}
+            ],
+        },
+    ]
+
+    price = tickers._build_price_panel(results)
+    assert price.columns.tolist() == ["symbol", "timestamp", "close"]
+    assert price["symbol"].tolist() == ["AAPL", "AAPL", "MSFT"]
+    assert price["close"].tolist()[::2] == [190.5, 370.0]
+    assert price["close"].isna().tolist() == [False, True, False]
+
+    wide = tickers._build_price_panel(results, layout="wide")
+    assert wide.columns.tolist() == [("AAPL", "close"), ("MSFT", "close")]
+
+
+def test_yahoo_api_bulk_price_wide():
+    tickers = Tickers(tickers=["AAPL", "MSFT"])
+    price = tickers.yahoo_api_bulk_price(range="5d", dataGranularity="1d", layout="wide")
+
+    assert isinstance(price.columns, pd.MultiIndex)
+    assert set(price.columns.get_level_values(0)) == {"AAPL", "MSFT"}
+    assert price["AAPL"].columns.tolist() == ["close"]
+
+
+def test_tickers_without_symbols():
+    with pytest.raises(ValueError):
+        Tickers()
+
+
+@pytest.mark.parametrize(
+    "tickers, fields",
+    [
+        (["AAPL", "MSFT"], None),
+        (LARGE_UNIVERSE, ["regularMarketPrice", "marketCap", "regularMarketTime"]),
+    ],
+)
+def test_yahoo_api_bulk_quote(tickers, fields):
+    tickers = Tickers(tickers=tickers)
+    quote = tickers.yahoo_api_bulk_quote(fields=fields)
+
+    assert quote.index.tolist() == tickers.tickers
+    assert quote["regularMarketPrice"].dtype == "float64"
+    assert quote["regularMarketPrice"].notna().all()
+
+
+def test_yahoo_api_bulk_quote_wrong_field():
+    tickers = Tickers(tickers=["AAPL"])
+
+    with pytest.raises(FieldNotExists):
+        tickers.yahoo_api_bulk_quote(fields=["not_a_field"])
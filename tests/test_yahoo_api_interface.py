@@ -1,7 +1,10 @@
-from datetime import datetime
+import json
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlparse
 
 import pandas as pd
 import pytest
+import requests
 
 from stockdex.exceptions import FieldNotExists
 from stockdex.ticker import Ticker
@@ -46,6 +49,189 @@ def test_yahoo_api_price(ticker, range, dataGranularity):
     assert len(yahoo_api_price) > 0
 
 
+@pytest.mark.parametrize(
+    "ticker, dataGranularity, days",
+    [
+        ("AAPL", "1m", 20),
+        ("MSFT", "5m", 90),
+        ("NVDA", "1d", 365),
+    ],
+)
+def test_yahoo_api_price_period(ticker, dataGranularity, days):
+    """
+    Test the windowed retrieval of the price data between period1 and period2
+    """
+
+    ticker = Ticker(ticker)
+    period2 = datetime.now(timezone.utc)
+    yahoo_api_price = ticker.yahoo_api_price(
+        dataGranularity=dataGranularity,
+        period1=period2 - timedelta(days=days),
+        period2=period2,
+    )
+
+    assert len(yahoo_api_price) > 0
+    assert yahoo_api_price["timestamp"].is_monotonic_increasing
+    assert not yahoo_api_price["timestamp"].duplicated().any()
+
+
+def _chart_response(timestamps):
+    response = requests.Response()
+    response._content = json.dumps(
+        {
+            "chart": {
+                "result": [
+                    {
+                        "meta": {
+                            "currency": "USD",
+                            "exchangeTimezoneName": "America/New_York",
+                            "timezone": "EST",
+                            "exchangeName": "NMS",
+                            "instrumentType": "EQUITY",
+                        },
+                        "timestamp": timestamps,
+                        "indicators": {
+                            "quote": [
+                                {
+                                    field: [1.0] * len(timestamps)
+                                    for field in ["volume", "close", "open", "high", "low"]
+                                }
+                            ]
+                        },
+                    }
+                ]
+            }
+        }
+    ).encode()
+    response.status_code = 200
+    return response
+
+
+def _chart_request_recorder(monkeypatch, ticker):
+    """
+    Answer the chart requests of the ticker with one bar at the start of each window
+    """
+    windows = []
+
+    def send_request(session, url, deadline=None):
+        query = parse_qs(urlparse(url).query)
+        windows.append((int(query["period1"][0]), int(query["period2"][0])))
+        return _chart_response([windows[-1][0]])
+
+    monkeypatch.setattr(ticker, "_send_request", send_request)
+    return windows
+
+
+def test_yahoo_api_price_period_retention(monkeypatch):
+    ticker = Ticker("AAPL")
+    windows = _chart_request_recorder(monkeypatch, ticker)
+    now = datetime.now(timezone.utc)
+
+    # windows older than the bars Yahoo keeps are not requested
+    prices = ticker.yahoo_api_price(
+        dataGranularity="5m", period1=now - timedelta(days=90), period2=now
+    )
+    assert len(windows) == 1
+    assert windows[0][0] >= (now - timedelta(days=59, seconds=1)).timestamp()
+    assert len(prices) == 1
+
+    # granularities with full history are requested as given
+    windows.clear()
+    ticker.yahoo_api_price(dataGranularity="1d", period1=now - timedelta(days=365), period2=now)
+    assert windows == [(int((now - timedelta(days=365)).timestamp()), int(now.timestamp()))]
+
+
+def test_yahoo_api_price_period_empty(monkeypatch):
+    ticker = Ticker("AAPL")
+    windows = _chart_request_recorder(monkeypatch, ticker)
+    now = datetime.now(timezone.utc)
+
+    prices = ticker.yahoo_api_price(
+        dataGranularity="1m", period1=now, period2=now - timedelta(days=1)
+    )
+    assert windows == []
+    assert prices.empty
+    assert prices.columns.tolist() == [
+        "timestamp",
+        "volume",
+        "close",
+        "open",
+        "high",
+        "low",
+        "currency",
+        "timezone",
+        "exchangeTimezoneName",
+        "exchangeName",
+        "instrumentType",
+    ]
+
+
+@pytest.mark.parametrize(
+    "ticker, dataGranularity",
+    [
+        ("AAPL", "1m"),
+        ("MSFT", "1h"),
+    ],
+)
+def test_yahoo_api_price_since(ticker, dataGranularity):
+    """
+    Test the incremental retrieval of the price data
+    """
+
+    ticker = Ticker(ticker)
+    prices = ticker.yahoo_api_price(range="5d", dataGranularity=dataGranularity)
+    last_timestamp = prices["timestamp"].iloc[-2]
+
+    delta = ticker.yahoo_api_price_since(last_timestamp, dataGranularity)
+    assert delta["timestamp"].iloc[0] == last_timestamp
+    assert delta.columns.tolist() == prices.columns.tolist()
+
+    delta = ticker.yahoo_api_price_since(last_timestamp, dataGranularity, refresh_last_bar=False)
+    assert (delta["timestamp"] > last_timestamp).all()
+    assert delta["timestamp"].iloc[0] == prices["timestamp"].iloc[-1]
+
+
+def test_yahoo_api_price_since_offline(monkeypatch):
+    ticker = Ticker("AAPL")
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    last_timestamp = now - timedelta(hours=1)
+    windows = []
+
+    def send_request(session, url, deadline=None):
+        query = parse_qs(urlparse(url).query)
+        windows.append((int(query["period1"][0]), int(query["period2"][0])))
+        # Yahoo returns the bar the window starts in
+        return _chart_response(
+            [int(last_timestamp.timestamp()), int(last_timestamp.timestamp()) + 60]
+        )
+
+    monkeypatch.setattr(ticker, "_send_request", send_request)
+
+    held = pd.Timestamp(last_timestamp).tz_localize(None)
+
+    # the held bar, which may have been partially formed, is refreshed by the first row
+    delta = ticker.yahoo_api_price_since(last_timestamp, "1m")
+    assert delta["timestamp"].tolist() == [held, held + pd.Timedelta(minutes=1)]
+    assert windows[0][0] == int(last_timestamp.timestamp())
+
+    # or only the newer bars are returned
+    windows.clear()
+    delta = ticker.yahoo_api_price_since(last_timestamp, "1m", refresh_last_bar=False)
+    assert delta["timestamp"].tolist() == [held + pd.Timedelta(minutes=1)]
+    assert windows[0][0] == int(last_timestamp.timestamp()) + 1
+
+    # nothing is requested for a timestamp that is not in the past
+    windows.clear()
+    delta = ticker.yahoo_api_price_since(now + timedelta(minutes=5), "1m")
+    assert windows == []
+    assert delta.empty
+
+    # timestamps older than the bars Yahoo keeps start at the oldest bar kept
+    delta = ticker.yahoo_api_price_since(now - timedelta(days=90), "1m")
+    assert windows[0][0] >= (now - timedelta(days=29, seconds=1)).timestamp()
+    assert len(delta) == 2
+
+
 @pytest.mark.parametrize(
     "ticker",
     [
@@ -163,6 +349,32 @@ def test_yahoo_api_financials(ticker, frequency, format, period1, period2):
     assert yahoo_api_financials.shape[1] > 0
 
 
+@pytest.mark.parametrize(
+    "ticker, frequencies, format",
+    [
+        ("AAPL", ["annual", "quarterly"], "fmt"),
+        ("MSFT", ["quarterly"], "raw"),
+        ("NVDA", ["annual"], "raw"),
+    ],
+)
+def test_yahoo_api_fundamentals(ticker, frequencies, format):
+    ticker = Ticker(ticker)
+    fundamentals = ticker.yahoo_api_fundamentals(frequencies=frequencies, format=format)
+
+    assert list(fundamentals.keys()) == [
+        "income_statement",
+        "cash_flow",
+        "balance_sheet",
+        "financials",
+    ]
+    for statement in fundamentals.values():
+        assert list(statement.keys()) == frequencies
+        for data in statement.values():
+            assert isinstance(data, pd.DataFrame)
+            assert data.shape[0] > 0
+            assert data.shape[1] > 0
+
+
 @pytest.mark.parametrize(
     "ticker, frequency, group_by, period1, period2",
     [
@@ -273,3 +485,108 @@ def test_plot_yahoo_api_financials_wrong_field():
             period2=datetime.today(),
             fields_to_include=["wrong_field"],
         )
+
+
+@pytest.mark.parametrize(
+    "ticker, modules",
+    [
+        ("AAPL", ["assetProfile", "majorHoldersBreakdown", "institutionOwnership"]),
+        ("MSFT", ["earningsTrend", "defaultKeyStatistics"]),
+    ],
+)
+def test_yahoo_api_quote_summary(ticker, modules):
+    ticker = Ticker(ticker)
+    quote_summary = ticker.yahoo_api_quote_summary(modules)
+
+    assert set(quote_summary) == set(modules)
+    for module in modules:
+        assert isinstance(quote_summary[module], dict)
+
+
+def test_yahoo_api_quote_summary_cache(monkeypatch):
+    ticker = Ticker("AAPL")
+    requested = []
+
+    def get_crumb_response(url, deadline=None):
+        requested.append(url)
+        symbol = urlparse(url).path.split("/")[-1]
+        response = requests.Response()
+        response._content = json.dumps(
+            {"quoteSummary": {"result": [{"assetProfile": {"symbol": symbol}}]}}
+        ).encode()
+        return response
+
+    monkeypatch.setattr(ticker, "get_crumb_response", get_crumb_response)
+
+    assert ticker.yahoo_api_quote_summary(["assetProfile"]) == {"assetProfile": {"symbol": "AAPL"}}
+    ticker.yahoo_api_quote_summary(["assetProfile"])
+    assert len(requested) == 1
+
+    # modules of a previous ticker are not served after the ticker changes
+    ticker.ticker = "MSFT"
+    assert ticker.yahoo_api_quote_summary(["assetProfile"]) == {"assetProfile": {"symbol": "MSFT"}}
+    assert len(requested) == 2
+
+
+def test_yahoo_api_quote_summary_wrong_module():
+    ticker = Ticker("AAPL")
+    with pytest.raises(ValueError):
+        ticker.yahoo_api_quote_summary(["wrong_module"])
+
+
+@pytest.mark.parametrize(
+    "ticker, frequency, windows",
+    [
+        ("AAPL", "quarterly", 4),
+        ("MSFT", "annual", 2),
+    ],
+)
+def test_yahoo_api_income_statement_windows(ticker, frequency, windows):
+    ticker = Ticker(ticker)
+    period1 = datetime(2015, 1, 1)
+
+    windowed = ticker.yahoo_api_income_statement(
+        frequency=frequency, period1=period1, windows=windows, format="raw"
+    )
+    single = ticker.yahoo_api_income_statement(frequency=frequency, period1=period1, format="raw")
+
+    assert windowed.index.is_unique
+    assert set(single.index) <= set(windowed.index)
+
+
+def test_yahoo_api_price_dataframe():
+    meta = {
+        "currency": "USD",
+        "exchangeTimezoneName": "America/New_York",
+        "timezone": "EST",
+        "exchangeName": "NMS",
+        "instrumentType": "EQUITY",
+    }
+    quote = {
+        "volume": [100, None],
+        "close": [1.5, None],
+        "open": [1.0, 2.0],
+        "high": [2.0, 2.5],
+    }
+    result = {
+        "meta": meta,
+        "timestamp": [1700000000, 1700000060],
+        "indicators": {"quote": [quote]},
+    }
+
+    data = Ticker(ticker="AAPL")._price_dataframe(result)
+
+    assert data["timestamp"].iloc[1] == pd.Timestamp("2023-11-14 22:14:20")
+    assert data["close"].isna().tolist() == [False, True]
+    assert data["volume"].isna().tolist() == [False, True]
+    # fields missing from the response are NaN
+    assert data["low"].isna().all()
+    assert (data["currency"] == "USD").all()
+
+    # volumes stay integers when no bar is missing
+    quote["volume"] = [100, 200]
+    assert Ticker(ticker="AAPL")._price_dataframe(result)["volume"].dtype == "int64"
+
+    # windows without trading days have no timestamps or quotes
+    empty = {"meta": meta, "indicators": {"quote": [{}]}}
+    assert Ticker(ticker="AAPL")._price_dataframe(empty).shape[0] == 0
@@ -2,10 +2,13 @@
 Module to test the YahooWeb class.
 """
 
+import json
+
 import pandas as pd
 import pytest
+import requests
 
-from stockdex.exceptions import WrongSecurityType
+from stockdex.exceptions import NoDataError, WrongSecurityType
 from stockdex.ticker import Ticker
 
 
@@ -525,3 +528,381 @@ def test_yahoo_web_growth_estimates_wrong_security_type():
     with pytest.raises(WrongSecurityType):
         ticker = Ticker(ticker="AAPL", security_type="etf")
         ticker.yahoo_web_growth_estimates
+
+
+@pytest.mark.parametrize(
+    "ticker",
+    [
+        ("AAPL"),
+        ("MSFT"),
+    ],
+)
+def test_yahoo_web_quote_summary_fast_path(ticker):
+    ticker = Ticker(ticker)
+    ticker.use_quote_summary = True
+
+    assert len(ticker.yahoo_web_description) > 0
+    assert ticker.yahoo_web_key_executives.shape[0] > 0
+    assert ticker.yahoo_web_major_holders.shape == (4, 2)
+    assert ticker.yahoo_web_top_institutional_holders.shape[0] > 0
+
+    # all properties were served by a single quoteSummary request
+    assert set(ticker.quote_summary_modules) == {
+        (ticker.ticker, "assetProfile"),
+        (ticker.ticker, "majorHoldersBreakdown"),
+        (ticker.ticker, "institutionOwnership"),
+        (ticker.ticker, "fundOwnership"),
+    }
+
+
+def _embedded_page(responses: dict) -> requests.Response:
+    """
+    Build a page embedding the given JSON responses like Yahoo Finance does
+    """
+    scripts = "".join(
+        f'<script type="application/json" data-sveltekit-fetched data-url="{url}">'
+        + json.dumps({"status": 200, "body": json.dumps(body)})
+        + "</script>"
+        for url, body in responses.items()
+    )
+    response = requests.Response()
+    response._content = f"<html><body>{scripts}</body></html>".encode()
+    response.encoding = "utf-8"
+    response.status_code = 200
+
+    return response
+
+
+def test_yahoo_web_embedded_json():
+    ticker = Ticker("AAPL")
+    profile_url = "https://finance.yahoo.com/quote/AAPL/profile"
+    analysis_url = "https://finance.yahoo.com/quote/AAPL/analysis"
+    financials_url = "https://finance.yahoo.com/quote/AAPL/financials"
+    summary_url = "https://query1.finance.yahoo.com/v10/finance/quoteSummary/AAPL"
+    timeseries_url = (
+        "https://query1.finance.yahoo.com/ws/fundamentals-timeseries/v1/finance/"
+        "timeseries/AAPL?type=annualTotalRevenue,trailingTotalRevenue,annualDilutedEPS"
+    )
+    revenue = [
+        {"asOfDate": "2023-09-30", "reportedValue": {"raw": 383285000000}},
+        {"asOfDate": "2024-09-30", "reportedValue": {"raw": 391035000000}},
+    ]
+    ticker.prefetched_responses = {
+        profile_url: _embedded_page(
+            {
+                f"{summary_url}?modules=assetProfile": {
+                    "quoteSummary": {
+                        "result": [{"assetProfile": {"longBusinessSummary": "Apple"}}]
+                    }
+                }
+            }
+        ),
+        analysis_url: _embedded_page(
+            {
+                f"{summary_url}?modules=earningsTrend&amp;lang=en-US": {
+                    "quoteSummary": {
+                        "result": [
+                            {
+                                "earningsTrend": {
+                                    "trend": [
+                                        {
+                                            "period": "0q",
+                                            "endDate": "2024-12-31",
+                                            "earningsEstimate": {
+                                                "avg": {"raw": 2.35, "fmt": "2.35"}
+                                            },
+                                        }
+                                    ]
+                                }
+                            }
+                        ]
+                    }
+                }
+            }
+        ),
+        financials_url: _embedded_page(
+            {
+                timeseries_url: {
+                    "timeseries": {
+                        "result": [
+                            {
+                                "meta": {"type": ["annualTotalRevenue"]},
+                                "annualTotalRevenue": revenue,
+                            },
+                            {
+                                "meta": {"type": ["trailingTotalRevenue"]},
+                                "trailingTotalRevenue": revenue[1:],
+                            },
+                            {
+                                # only shown on the quarterly table
+                                "meta": {"type": ["quarterlyTotalRevenue"]},
+                                "quarterlyTotalRevenue": [
+                                    {
+                                        "asOfDate": "2024-12-31",
+                                        "reportedValue": {"raw": 124300000000},
+                                    }
+                                ],
+                            },
+                            {
+                                "meta": {"type": ["annualDilutedEPS"]},
+                                "annualDilutedEPS": [
+                                    None,
+                                    {
+                                        "asOfDate": "2024-09-30",
+                                        "reportedValue": {"raw": 6.08},
+                                    },
+                                ],
+                            },
+                        ]
+                    }
+                }
+            }
+        ),
+    }
+
+    assert ticker.yahoo_web_description == "Apple"
+
+    estimate = ticker.yahoo_web_earnings_estimate
+    assert list(estimate.columns) == ["Currency", "Current Qtr. (Dec 2024)"]
+    assert estimate.iloc[1].tolist() == ["Avg. Estimate", "2.35"]
+
+    income_stmt = ticker.yahoo_web_income_stmt
+    assert list(income_stmt.columns) == ["TTM", "9/30/2024", "9/30/2023"]
+    assert income_stmt.loc["Total Revenue"].tolist() == [
+        "391,035,000",
+        "391,035,000",
+        "383,285,000",
+    ]
+    assert income_stmt.loc["Diluted EPS"].tolist() == ["--", "6.08", "--"]
+
+
+def test_yahoo_web_embedded_financials_match_dom():
+    url = "https://finance.yahoo.com/quote/AAPL/financials"
+    timeseries_url = (
+        "https://query1.finance.yahoo.com/ws/fundamentals-timeseries/v1/finance/"
+        "timeseries/AAPL?type=annualTotalRevenue,trailingTotalRevenue,annualDilutedEPS"
+    )
+    embedded = _embedded_page(
+        {
+            timeseries_url: {
+                "timeseries": {
+                    "result": [
+                        {
+                            "meta": {"type": ["annualTotalRevenue"]},
+                            "annualTotalRevenue": [
+                                {"asOfDate": "2023-09-30", "reportedValue": {"raw": 383285000000}},
+                                {"asOfDate": "2024-09-30", "reportedValue": {"raw": 391035000000}},
+                            ],
+                        },
+                        {
+                            "meta": {"type": ["trailingTotalRevenue"]},
+                            "trailingTotalRevenue": [
+                                {"asOfDate": "2024-12-31", "reportedValue": {"raw": 395760000000}}
+                            ],
+                        },
+                        {
+                            "meta": {"type": ["annualDilutedEPS"]},
+                            "annualDilutedEPS": [
+                                {"asOfDate": "2023-09-30", "reportedValue": {"raw": 6.13}},
+                                {"asOfDate": "2024-09-30", "reportedValue": {"raw": 6.08}},
+                            ],
+                        },
+                    ]
+                }
+            }
+        }
+    ).text
+    # the table the website renders from the same data, in thousands
+    rows = [
+        ("Total Revenue", "395,760,000", "391,035,000", "383,285,000"),
+        ("Diluted EPS", "--", "6.08", "6.13"),
+    ]
+    table = (
+        '<div class="table yf-1pgoo1f"><div class="tableHeader"><div class="row">'
+        + "".join(
+            f'<div class="column">{column}</div>'
+            for column in ["Breakdown", "TTM", "9/30/2024", "9/30/2023"]
+        )
+        + '</div></div><div class="tableBody">'
+        + "".join(
+            f'<div class="row"><div class="column"><div class="rowTitle">{title}</div></div>'
+            + "".join(f'<div class="column">{value}</div>' for value in values)
+            + "</div>"
+            for title, *values in rows
+        )
+        + "</div></div>"
+    )
+    response = requests.Response()
+    response._content = embedded.replace("</body>", f"{table}</body>").encode()
+    response.encoding = "utf-8"
+    response.status_code = 200
+
+    ticker = Ticker("AAPL")
+    ticker.prefetched_responses = {url: response}
+    from_json = ticker.yahoo_web_income_stmt
+
+    ticker = Ticker("AAPL")
+    ticker.use_embedded_json = False
+    ticker.prefetched_responses = {url: response}
+    from_dom = ticker.yahoo_web_income_stmt
+
+    pd.testing.assert_frame_equal(from_json, from_dom)
+
+
+def test_yahoo_web_embedded_json_fallback():
+    ticker = Ticker("AAPL")
+    url = "https://finance.yahoo.com/quote/AAPL/profile"
+    response = requests.Response()
+    response._content = (
+        b'<html><body><section data-testid="description"><p>Apple</p></section></body></html>'
+    )
+    response.status_code = 200
+    ticker.prefetched_responses = {url: response}
+
+    # pages without embedded data are parsed
+    assert ticker.yahoo_web_description == "Apple"
+
+
+def test_yahoo_web_analysis(monkeypatch):
+    ticker = Ticker("AAPL")
+    url = "https://finance.yahoo.com/quote/AAPL/analysis"
+    summary_url = "https://query1.finance.yahoo.com/v10/finance/quoteSummary/AAPL"
+    page = _embedded_page(
+        {
+            f"{summary_url}?modules=earningsTrend": {
+                "quoteSummary": {
+                    "result": [
+                        {
+                            "earningsTrend": {
+                                "trend": [
+                                    {
+                                        "period": "0q",
+                                        "endDate": "2024-12-31",
+                                        "earningsEstimate": {"avg": {"raw": 2.35, "fmt": "2.35"}},
+                                    }
+                                ]
+                            }
+                        }
+                    ]
+                }
+            }
+        }
+    )
+    page._content = page._content.replace(
+        b"</body>",
+        b'<section data-testid="growthEstimate"><table><thead><tr><th>Currency</th>'
+        b"<th>AAPL</th></tr></thead><tbody><tr><td>Current Qtr.</td><td>5.2%</td>"
+        b"</tr></tbody></table></section></body>",
+    )
+
+    requested = []
+
+    def send_request(session, url, deadline=None):
+        requested.append(url)
+        return page
+
+    monkeypatch.setattr(ticker, "_send_request", send_request)
+
+    # the page is fetched once for all tables, missing tables are left out
+    tables = ticker.yahoo_web_analysis()
+    assert requested == [url]
+    assert set(tables) == {"earnings_estimate", "growth_estimates"}
+    assert tables["earnings_estimate"].iloc[1].tolist() == ["Avg. Estimate", "2.35"]
+    assert tables["growth_estimates"].values.tolist() == [["Current Qtr.", "5.2%"]]
+
+    # the single table properties reuse the tables, or the error of a missing one
+    assert ticker.yahoo_web_growth_estimates.equals(tables["growth_estimates"])
+    with pytest.raises(NoDataError, match="eps_trend"):
+        ticker._yahoo_web_page_table("analysis", "eps_trend")
+    assert requested == [url]
+
+    ticker.yahoo_web_analysis(refresh=True)
+    assert requested == [url, url]
+    assert url not in ticker.prefetched_responses
+
+    # the embedded JSON serves most tables, the page is not parsed as a whole
+    assert "prefetched_soups" not in vars(ticker) or url not in ticker.prefetched_soups
+
+
+def test_yahoo_web_analysis_lazy(monkeypatch):
+    ticker = Ticker("AAPL")
+    summary_url = "https://query1.finance.yahoo.com/v10/finance/quoteSummary/AAPL"
+    page = _embedded_page(
+        {
+            f"{summary_url}?modules=earningsTrend": {
+                "quoteSummary": {
+                    "result": [
+                        {
+                            "earningsTrend": {
+                                "trend": [
+                                    {
+                                        "period": "0q",
+                                        "endDate": "2024-12-31",
+                                        "earningsEstimate": {"avg": {"raw": 2.35, "fmt": "2.35"}},
+                                    }
+                                ]
+                            }
+                        }
+                    ]
+                }
+            }
+        }
+    )
+
+    requested = []
+
+    def send_request(session, url, deadline=None):
+        requested.append(url)
+        return page
+
+    monkeypatch.setattr(ticker, "_send_request", send_request)
+
+    # only the table read is built
+    estimate = ticker.yahoo_web_earnings_estimate
+    assert estimate.iloc[1].tolist() == ["Avg. Estimate", "2.35"]
+    assert list(ticker.yahoo_web_page_results[("AAPL", "analysis")]) == ["earnings_estimate"]
+
+    # the tables are kept per ticker, a new ticker does not read those of the old one
+    ticker.ticker = "MSFT"
+    assert ticker.yahoo_web_earnings_estimate.equals(estimate)
+    assert requested == [
+        "https://finance.yahoo.com/quote/AAPL/analysis",
+        "https://finance.yahoo.com/quote/MSFT/analysis",
+    ]
+    assert set(ticker.yahoo_web_page_results) == {("AAPL", "analysis"), ("MSFT", "analysis")}
+
+
+def test_yahoo_web_analysis_transient_error(monkeypatch):
+    ticker = Ticker("AAPL")
+    url = "https://finance.yahoo.com/quote/AAPL/analysis"
+    page = _embedded_page({})
+    page._content = page._content.replace(
+        b"</body>",
+        b'<section data-testid="growthEstimate"><table><thead><tr><th>Currency</th>'
+        b"<th>AAPL</th></tr></thead><tbody><tr><td>Current Qtr.</td><td>5.2%</td>"
+        b"</tr></tbody></table></section></body>",
+    )
+
+    requested = []
+
+    def send_request(session, url, deadline=None):
+        requested.append(url)
+        if len(requested) == 1:
+            raise requests.exceptions.ConnectionError("connection reset")
+        return page
+
+    monkeypatch.setattr(ticker, "_send_request", send_request)
+
+    # errors of the request are not kept, reading the table again fetches the page
+    with pytest.raises(requests.exceptions.ConnectionError):
+        ticker._yahoo_web_page_table("analysis", "growth_estimates")
+    growth = ticker.yahoo_web_growth_estimates
+    assert growth.values.tolist() == [["Current Qtr.", "5.2%"]]
+    assert requested == [url, url]
+
+    # a table missing from the page is kept
+    with pytest.raises(NoDataError):
+        ticker._yahoo_web_page_table("analysis", "eps_trend")
+    with pytest.raises(NoDataError):
+        ticker._yahoo_web_page_table("analysis", "eps_trend")
+    assert requested == [url, url, url]